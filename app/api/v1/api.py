@@ -1,5 +1,6 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from app.api.v1.deps import use_request_session
 from app.api.v1.endpoints import (
     analysis,
     auth,
@@ -10,7 +11,8 @@ from app.api.v1.endpoints import (
     users,
 )
 
-router = APIRouter()
+# Every endpoint shares one request-scoped session, auth lookups included
+router = APIRouter(dependencies=[Depends(use_request_session)])
 
 router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 router.include_router(users.router, prefix="/users", tags=["Users"])
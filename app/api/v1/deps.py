@@ -1,47 +1,56 @@
-import redis
 from fastapi import Depends, Request
 from sqlalchemy.orm import Session
 
+from app.core.active_users import active_users
 from app.core.config import settings
-from app.core.database import SessionLocal
-from app.core.security import get_current_user
-
-_redis_client = None
-
-
-def _get_redis():
-    global _redis_client
-    if redis is None:
-        return None
-    if _redis_client is not None:
-        return _redis_client
-    try:
-        _redis_client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
-        _redis_client.ping()
-        return _redis_client
-    except Exception:
-        return None
+from app.core.database import RequestSessionLocal, request_session
+from app.core.exceptions import ForbiddenError
+from app.core.security import get_current_user, get_current_user_async
 
 
 def get_db():
-    db = SessionLocal()
+    """The request's unit of work: one session, on one pooled connection."""
+    db = RequestSessionLocal()
     try:
         yield db
     finally:
         db.close()
 
 
+async def use_request_session(db: Session = Depends(get_db)):
+    # Async so the context variable is set in the request's own context, which
+    # the threadpool copies for sync dependencies and endpoints; it is reset
+    # before streaming bodies and background tasks run, so those open their own
+    with request_session(db):
+        yield db
+
+
+def _touch_active_user(user):
+    # Recorded in process; the metrics updater flushes touches to Redis
+    if user and user.get("id"):
+        active_users.touch(user["id"])
+
+
 def _get_current_user_with_touch(request: Request):
     user = get_current_user(request)
-    client = _get_redis()
-    if client and user and user.get("id"):
-        # TTL key
-        user_id = str(user["id"])
-        try:
-            client.setex(f"active_user:{user_id}", 120, "1")  # 2 minutes TTL
-        except Exception:
-            pass
+    _touch_active_user(user)
+    return user
+
+
+async def _get_current_user_with_touch_async(request: Request):
+    user = await get_current_user_async(request)
+    _touch_active_user(user)
     return user
 
 
 get_current_user_dep = Depends(_get_current_user_with_touch)
+get_current_user_async_dep = Depends(_get_current_user_with_touch_async)
+
+
+def _require_admin(current_user: dict = get_current_user_dep):
+    if (current_user or {}).get("email") not in settings.admin_emails:
+        raise ForbiddenError("Admin access required")
+    return current_user
+
+
+require_admin_dep = Depends(_require_admin)
@@ -1,7 +1,21 @@
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+import time
 
-from app.api.v1.deps import get_current_user_dep
-from app.schemas.analysis import AnswerCreate, AnswerOut, SentimentAnalysisRequest
+from fastapi import APIRouter, Depends, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.api.v1.deps import get_current_user_async_dep, get_current_user_dep
+from app.core.config import settings
+from app.core.exceptions import ValidationError
+from app.core.responses import success_response
+from app.schemas.analysis import (
+    AnswerBatchCreate,
+    AnswerCreate,
+    AnswerOut,
+    SentimentAnalysisRequest,
+    SentimentBatchRequest,
+)
 from app.schemas.responses import SuccessResponse
 from app.services.analysis_service import AnalysisService
 
@@ -9,12 +23,97 @@ router = APIRouter()
 analysis_service = AnalysisService()
 
 
+def _sse(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
 @router.post("/analyze")
-def analyze_answer(answer: AnswerCreate, current_user: dict = get_current_user_dep):
-    result = analysis_service.analyze_answer(answer)
+async def analyze_answer(
+    answer: AnswerCreate,
+    response: Response,
+    background: bool = False,
+    current_user: dict = get_current_user_async_dep,
+):
+    """
+    Analyze an answer. With `background=true` the answer is stored as
+    `pending` and analyzed by a worker; poll `/answers/{id}` or stream
+    `/answers/{id}/stream` for the result.
+    """
+    if background:
+        result = await analysis_service.submit_answer(answer, current_user["id"])
+        response.status_code = status.HTTP_202_ACCEPTED
+        return SuccessResponse(message="Answer queued for analysis", data=result)
+    result = await analysis_service.analyze_answer(answer)
     return SuccessResponse(message="Answer analyzed successfully", data=result)
 
 
+@router.post("/analyze/stream")
+async def analyze_answer_stream(
+    answer: AnswerCreate, current_user: dict = get_current_user_async_dep
+):
+    """
+    Analyze an answer as server-sent events: one `pillar` event per EQ pillar
+    as soon as the model has produced it, then `completed` with the saved
+    answer (or `failed`).
+    """
+    events = await analysis_service.analyze_answer_stream(answer)
+
+    async def stream():
+        async for event, data in events:
+            yield _sse(event, json.dumps(data, ensure_ascii=False))
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
+
+
+@router.post("/analyze-batch")
+async def analyze_batch(
+    batch: AnswerBatchCreate, current_user: dict = get_current_user_async_dep
+):
+    """
+    Analyze many answers, possibly across situations. Each item in the result
+    reports its own success or error.
+    """
+    if len(batch.answers) > settings.analysis_batch_max_size:
+        raise ValidationError(
+            "Batch too large",
+            [f"at most {settings.analysis_batch_max_size} answers per batch"],
+        )
+    result = await analysis_service.analyze_batch(batch.answers, current_user["id"])
+    return SuccessResponse(message="Batch analyzed successfully", data=result)
+
+
+@router.get("/answers/{answer_id}")
+def get_answer(answer_id: int, current_user: dict = get_current_user_dep):
+    result = analysis_service.get_answer(answer_id)
+    return SuccessResponse(message="Answer retrieved successfully", data=result)
+
+
+@router.get("/answers/{answer_id}/stream")
+async def stream_answer(
+    answer_id: int, current_user: dict = get_current_user_async_dep
+):
+    """
+    Server-sent events for a background analysis: a `completed` or `failed`
+    event carrying the answer, or `timeout` if it is still pending.
+    """
+    answer = await asyncio.to_thread(analysis_service.get_answer, answer_id)
+
+    async def events():
+        nonlocal answer
+        deadline = time.monotonic() + settings.analysis_stream_timeout_seconds
+        while answer.status == "pending":
+            if time.monotonic() >= deadline:
+                yield _sse("timeout", json.dumps({"id": answer_id}))
+                return
+            # Comment line keeps proxies from closing an idle stream
+            yield ": pending\n\n"
+            await asyncio.sleep(settings.analysis_stream_poll_seconds)
+            answer = await asyncio.to_thread(analysis_service.get_answer, answer_id)
+        yield _sse(answer.status, answer.model_dump_json())
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.post("/analyze-sentiment")
 def analyze_sentiment(
     text: SentimentAnalysisRequest, current_user: dict = get_current_user_dep
@@ -23,9 +122,26 @@ def analyze_sentiment(
     return SuccessResponse(message="Sentiment analyzed successfully", data=result)
 
 
+@router.post("/analyze-sentiment/batch")
+def analyze_sentiment_batch(
+    batch: SentimentBatchRequest, current_user: dict = get_current_user_dep
+):
+    """
+    Analyze sentiment for many texts. Results are in input order and each one
+    reports its own success or error.
+    """
+    if len(batch.contents) > settings.sentiment_batch_max_size:
+        raise ValidationError(
+            "Batch too large",
+            [f"at most {settings.sentiment_batch_max_size} texts per batch"],
+        )
+    result = analysis_service.analyze_sentiment_batch(batch.contents)
+    return SuccessResponse(message="Sentiments analyzed successfully", data=result)
+
+
 @router.get("/situations/{situation_id}/answers")
 def get_answers_by_situation(
     situation_id: int, current_user: dict = get_current_user_dep
 ):
     result = analysis_service.get_answers_by_situation(situation_id)
-    return SuccessResponse(message="Answers retrieved successfully", data=result)
+    return success_response("Answers retrieved successfully", result)
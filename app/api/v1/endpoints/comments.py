@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 
 from app.api.v1.deps import get_current_user_dep
+from app.core.exceptions import ValidationError
 from app.core.metrics import increment_comments_created
+from app.core.responses import success_response
 from app.core.security import get_current_user
 from app.schemas.comments import CommentCreate, CommentOut, CommentUpdate
 from app.schemas.responses import SuccessResponse
@@ -12,18 +16,36 @@ comment_service = CommentService()
 
 
 @router.get("/situations/{situation_id}/comments")
-def get_comments_by_situation(situation_id: int):
+async def get_comments_by_situation(
+    situation_id: int,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    all_comments: bool = Query(False, alias="all"),
+):
     """
-    Get comments by situation ID.
+    Get comments by situation ID, one keyset page (oldest first) at a time.
+    Follow `next_cursor`/`prev_cursor` with `after`/`before`; `limit`
+    defaults to 20. Pass `all=true` for the legacy unpaginated list.
     """
-    result = comment_service.get_comments_by_situation(situation_id)
-    return SuccessResponse(message="Comments retrieved successfully", data=result)
+    if all_comments:
+        if after is not None or before is not None or limit is not None:
+            raise ValidationError(
+                "Invalid pagination", ["all cannot be combined with a page"]
+            )
+        result = await comment_service.get_comments_by_situation_async(situation_id)
+    else:
+        result = await comment_service.get_comments_page_async(
+            situation_id, after=after, before=before, limit=limit or 20
+        )
+    return success_response("Comments retrieved successfully", result)
 
 
 @router.post("/situations/{situation_id}/comments")
 def create_comment_for_situation(
     situation_id: int,
     comment_in: CommentCreate,
+    background_tasks: BackgroundTasks,
     current_user: dict = get_current_user_dep,
 ):
     """
@@ -36,6 +58,7 @@ def create_comment_for_situation(
     result = comment_service.create_comment(
         comment_in=CommentCreate(**payload),
         user_id=current_user["id"],
+        defer=background_tasks.add_task,
     )
     increment_comments_created()
     return SuccessResponse(message="Comment created successfully", data=result)
@@ -45,10 +68,13 @@ def create_comment_for_situation(
 def create_comment(
     # situation_id: int,
     comment_in: CommentCreate,
+    background_tasks: BackgroundTasks,
     current_user: dict = get_current_user_dep,
 ):
     result = comment_service.create_comment(
-        comment_in=comment_in, user_id=current_user["id"]
+        comment_in=comment_in,
+        user_id=current_user["id"],
+        defer=background_tasks.add_task,
     )
     increment_comments_created()
     return SuccessResponse(message="Comment created successfully", data=result)
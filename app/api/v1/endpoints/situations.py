@@ -1,11 +1,23 @@
-from fastapi import APIRouter, Depends
+import io
+import tempfile
+from typing import Optional
 
-from app.api.v1.deps import get_current_user_dep
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+
+from app.api.v1.deps import (
+    get_current_user_async_dep,
+    get_current_user_dep,
+    require_admin_dep,
+)
+from app.core.config import settings
+from app.core.exceptions import ValidationError
 from app.core.metrics import (
     increment_comments_created,
     increment_reactions,
     increment_situations_created,
 )
+from app.core.responses import success_response
 from app.core.security import get_current_user, get_current_user_optional
 from app.schemas.comments import CommentCreate
 from app.schemas.responses import SuccessResponse
@@ -17,56 +29,91 @@ from app.schemas.situations import (
 )
 from app.services.comment_service import CommentService
 from app.services.reaction_service import ReactionService
+from app.services.search_service import SearchService
+from app.services.situation_import_service import SituationImportService
 from app.services.situation_service import SituationService
 
 router = APIRouter()
 situation_service = SituationService()
 comment_service = CommentService()
 reaction_service = ReactionService()
+search_service = SearchService()
+import_service = SituationImportService()
 
 
 @router.get("/contributed")
-def get_contributed_situations(current_user: dict = get_current_user_dep):
+def get_contributed_situations(
+    page: int = 1, limit: int = 10, current_user: dict = get_current_user_dep
+):
     """
-    Get all contributed situations.
+    Get contributed situations with user info and stats.
+    Supports pagination.
     """
-    result = situation_service.get_contributed_situations()
-    return SuccessResponse(
-        message="Contributed situations retrieved successfully", data=result
-    )
+    result = situation_service.get_contributed_situations(page=page, limit=limit)
+    return success_response("Contributed situations retrieved successfully", result)
 
 
 @router.get("/feed")
-def get_situations_feed(
+async def get_situations_feed(
     page: int = 1,
     limit: int = 10,
     sort_by: str = "created_at",
     sort_order: str = "desc",
-    current_user: dict = get_current_user_dep,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    current_user: dict = get_current_user_async_dep,
 ):
     """
     Get situations feed with comments and reactions (aggregated).
-    Supports pagination and sorting.
+    Supports pagination and sorting. Passing `cursor` (empty for the first
+    page) switches to keyset pagination and returns `next_cursor`.
     """
     current_user_id = current_user.get("id") if current_user else None
-    result = situation_service.get_situations_feed_paginated(
-        page=page,
-        limit=limit,
-        sort_by=sort_by,
-        sort_order=sort_order,
-        current_user_id=current_user_id,
-    )
-    return SuccessResponse(
-        message="Situations feed retrieved successfully", data=result
+    if cursor is not None:
+        result = await situation_service.get_situations_feed_cursor_async(
+            cursor=cursor,
+            limit=limit,
+            sort_order=sort_order,
+            current_user_id=current_user_id,
+            include_total=include_total,
+        )
+    else:
+        result = await situation_service.get_situations_feed_paginated_async(
+            page=page,
+            limit=limit,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            current_user_id=current_user_id,
+        )
+    return success_response("Situations feed retrieved successfully", result)
+
+
+@router.get("/search")
+def search_situations(
+    q: str = Query(..., min_length=2, max_length=200),
+    target: str = Query("situations", pattern="^(situations|comments)$"),
+    topic_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=100),
+    current_user: dict = get_current_user_dep,
+):
+    """
+    Full-text search over situations (question and context) or comments.
+    Results are ordered by relevance, keyset-paginated via `next_cursor`,
+    and carry a `snippet` with matching words wrapped in <mark>.
+    """
+    result = search_service.search(
+        q, kind=target, topic_id=topic_id, cursor=cursor, limit=limit
     )
+    return success_response("Search results retrieved successfully", result)
 
 
 @router.get("/{situation_id}")
-def get_situation(situation_id: int):
+async def get_situation(situation_id: int):
     """
     Get situation by ID.
     """
-    result = situation_service.get_situation(situation_id)
+    result = await situation_service.get_situation_async(situation_id)
     return SuccessResponse(message="Situation retrieved successfully", data=result)
 
 
@@ -76,9 +123,7 @@ def get_my_situations(current_user: dict = get_current_user_dep):
     Get situations created by current user.
     """
     result = situation_service.get_situations_by_user(current_user["id"])
-    return SuccessResponse(
-        message="User situations retrieved successfully", data=result
-    )
+    return success_response("User situations retrieved successfully", result)
 
 
 @router.get("/user/{user_id}")
@@ -92,9 +137,7 @@ def get_user_situations(
     result = situation_service.get_situations_by_user_with_feed(
         user_id, current_user_id
     )
-    return SuccessResponse(
-        message="User situations retrieved successfully", data=result
-    )
+    return success_response("User situations retrieved successfully", result)
 
 
 @router.post("/")
@@ -112,6 +155,42 @@ def create_situation(
     return SuccessResponse(message="Situation created successfully", data=result)
 
 
+@router.post("/import")
+async def import_situations(
+    request: Request,
+    fmt: str = Query("jsonl", alias="format", pattern="^(jsonl|csv)$"),
+    current_user: dict = require_admin_dep,
+):
+    """
+    Bulk-import situations from a JSONL or CSV request body (admins only).
+    Reports inserted, duplicate and rejected rows, with the line number and
+    errors of each rejected row.
+    """
+    # Spooled to disk past 1 MiB, then parsed and inserted batch by batch
+    with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as body:
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > settings.situation_import_max_bytes:
+                raise ValidationError(
+                    "Import too large",
+                    [f"body exceeds {settings.situation_import_max_bytes} bytes"],
+                )
+            body.write(chunk)
+        body.seek(0)
+        stream = io.TextIOWrapper(body, encoding="utf-8-sig", newline="")
+        try:
+            report = await run_in_threadpool(
+                import_service.import_stream,
+                stream,
+                fmt,
+                user_id=current_user.get("id"),
+            )
+        except UnicodeDecodeError:
+            raise ValidationError("Invalid import body", ["body must be UTF-8"])
+    return success_response("Situations imported successfully", report)
+
+
 @router.post("/contribute")
 def contribute_situation(
     situation_data: dict, current_user: dict = Depends(get_current_user)
@@ -147,22 +226,43 @@ def delete_situation(situation_id: int, current_user: dict = get_current_user_de
 
 # Comment routes under situations path to match tests
 @router.get("/{situation_id}/comments")
-def get_comments_by_situation(situation_id: int):
-    result = comment_service.get_comments_by_situation(situation_id)
-    return SuccessResponse(message="Comments retrieved successfully", data=result)
+async def get_comments_by_situation(
+    situation_id: int,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    all_comments: bool = Query(False, alias="all"),
+):
+    """
+    Get comments by situation ID, one keyset page (oldest first) at a time.
+    Follow `next_cursor`/`prev_cursor` with `after`/`before`; `limit`
+    defaults to 20. Pass `all=true` for the legacy unpaginated list.
+    """
+    if all_comments:
+        if after is not None or before is not None or limit is not None:
+            raise ValidationError(
+                "Invalid pagination", ["all cannot be combined with a page"]
+            )
+        result = await comment_service.get_comments_by_situation_async(situation_id)
+    else:
+        result = await comment_service.get_comments_page_async(
+            situation_id, after=after, before=before, limit=limit or 20
+        )
+    return success_response("Comments retrieved successfully", result)
 
 
 @router.post("/{situation_id}/comments")
 def create_comment_for_situation(
     situation_id: int,
     comment_in: CommentCreate,
+    background_tasks: BackgroundTasks,
     current_user: dict = get_current_user_dep,
 ):
     # Note: situation_id comes from path; repo uses it from comment_in if needed
     payload = comment_in.model_dump()
     payload["situation_id"] = situation_id
     result = comment_service.create_comment(
-        CommentCreate(**payload), current_user["id"]
+        CommentCreate(**payload), current_user["id"], defer=background_tasks.add_task
     )
     # Track comment creation
     increment_comments_created()
@@ -171,12 +271,12 @@ def create_comment_for_situation(
 
 # Reaction routes
 @router.get("/{situation_id}/reactions")
-def get_reactions_by_situation(situation_id: int):
+async def get_reactions_by_situation(situation_id: int):
     """
     Get reactions for a situation.
     """
-    result = reaction_service.get_reactions_by_situation(situation_id)
-    return SuccessResponse(message="Reactions retrieved successfully", data=result)
+    result = await reaction_service.get_reactions_by_situation_async(situation_id)
+    return success_response("Reactions retrieved successfully", result)
 
 
 @router.post("/{situation_id}/reactions")
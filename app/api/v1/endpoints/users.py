@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, Query
 
-from app.api.v1.deps import get_current_user_dep
+from app.api.v1.deps import get_current_user_async_dep, get_current_user_dep
 from app.core.security import get_current_user
 from app.schemas.responses import SuccessResponse
 from app.schemas.users import UserProfileOut, UserShortOut
@@ -25,7 +25,7 @@ def list_users(
 
 
 @router.get("/me")
-async def read_current_user(current_user: dict = get_current_user_dep):
+async def read_current_user(current_user: dict = get_current_user_async_dep):
     """
     Get current user info.
     """
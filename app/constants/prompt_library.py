@@ -48,3 +48,41 @@ Use a professional, objective, constructive, and clear tone. Avoid emotional or
 
 ## TEXT TO ANALYZE (SITUATION, QUESTION, USER'S ANSWER):
 """
+
+# Same brief as SITUATION_ANALYZE_PROMPT, scoring several answers per request
+SITUATION_BATCH_ANALYZE_PROMPT = (
+    SITUATION_ANALYZE_PROMPT.split("## OUTPUT FORMAT")[0]
+    + """## INPUT FORMAT
+You will receive several situations, each labelled `SITUATION <k>` with its
+question, followed by several items labelled `ITEM <n> (SITUATION <k>)`, each
+holding one user's answer to that situation. Score every item independently.
+
+## OUTPUT FORMAT
+You MUST return a single JSON object with one entry per item, using the item
+numbers you were given:
+{
+  "results": [
+    {
+      "item": <item number>,
+      "scores": {
+        "self_awareness": <score from 0 to 10>,
+        "empathy": <score from 0 to 10>,
+        "self_regulation": <score from 0 to 10>,
+        "communication": <score from 0 to 10>,
+        "decision_making": <score from 0 to 10>
+      },
+      "reasoning": {
+        "self_awareness": "<Brief explanation for the self_awareness score>",
+        "empathy": "<Brief explanation for the empathy score>",
+        "self_regulation": "<Brief explanation for the self_regulation score>",
+        "communication": "<Brief explanation for the communication score>",
+        "decision_making": "<Brief explanation for the decision_making score>"
+      }
+    }
+  ]
+}
+
+## TONE
+Use a professional, objective, constructive, and clear tone. Avoid emotional or subjective judgments; instead, focus on specific evidence from the provided text.
+"""
+)
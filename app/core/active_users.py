@@ -0,0 +1,87 @@
+"""Active-user tracking shared by every replica through one Redis sorted set.
+
+Requests only record a touch in process; a user is queued at most once per
+`active_users_touch_window_seconds`. A background flusher writes the queued
+touches with pipelined ZADDs (member: user id, score: last seen), and counting
+trims idle members with ZREMRANGEBYSCORE and reads ZCARD, so the count is
+exact across replicas without scanning the keyspace.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_USERS_KEY = "active_users"
+
+
+class ActiveUserTracker:
+    def __init__(self):
+        self._pending: Dict[int, float] = {}
+        self._queued_at: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def touch(self, user_id: int) -> None:
+        now = time.time()
+        with self._lock:
+            queued_at = self._queued_at.get(user_id)
+            if (
+                queued_at is not None
+                and now - queued_at < settings.active_users_touch_window_seconds
+            ):
+                return
+            self._queued_at[user_id] = now
+            self._pending[user_id] = now
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self, client) -> int:
+        """Write queued touches to Redis; return how many users were written.
+
+        On failure the touches are queued again for the next flush.
+        """
+        now = time.time()
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            window = settings.active_users_touch_window_seconds
+            self._queued_at = {
+                user_id: queued_at
+                for user_id, queued_at in self._queued_at.items()
+                if now - queued_at < window
+            }
+        if not pending:
+            return 0
+        items = [(str(user_id), seen) for user_id, seen in pending.items()]
+        batch = settings.active_users_flush_batch_size
+        try:
+            pipe = client.pipeline(transaction=False)
+            for start in range(0, len(items), batch):
+                pipe.zadd(ACTIVE_USERS_KEY, dict(items[start : start + batch]))
+            pipe.expire(ACTIVE_USERS_KEY, settings.active_users_ttl_seconds * 2)
+            pipe.execute()
+        except Exception as exc:
+            logger.warning(f"Failed to flush {len(pending)} active-user touches: {exc}")
+            with self._lock:
+                for user_id, seen in pending.items():
+                    if seen > self._pending.get(user_id, 0):
+                        self._pending[user_id] = seen
+            return 0
+        return len(pending)
+
+    def count(self, client) -> int:
+        """Users seen within `active_users_ttl_seconds`, across all replicas."""
+        cutoff = time.time() - settings.active_users_ttl_seconds
+        pipe = client.pipeline(transaction=False)
+        pipe.zremrangebyscore(ACTIVE_USERS_KEY, "-inf", cutoff)
+        pipe.zcard(ACTIVE_USERS_KEY)
+        _, count = pipe.execute()
+        return int(count)
+
+
+active_users = ActiveUserTracker()
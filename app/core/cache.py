@@ -0,0 +1,257 @@
+"""Read-through cache backed by Redis, with an in-process fallback.
+
+Keys are `cache:{namespace}:{generation}:{key}`, plus `#{key generation}`
+once a single key has been invalidated. Bumping a namespace's generation
+invalidates all of its keys at once, bumping a key's generation just that key.
+Without Redis, entries live in a per-process LRU and other replicas only
+converge through the TTL.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+import redis
+
+from app.core.config import settings
+from app.core.metrics import mark_cache_hit, mark_cache_miss
+
+logger = logging.getLogger(__name__)
+
+# How long to stay on the local store after a Redis error before retrying
+REDIS_RETRY_SECONDS = 30
+# Per-key generations expire once no entry they guard can still be alive
+KEY_GENERATION_TTL_SECONDS = 24 * 3600
+
+
+class _LocalStore:
+    """Thread-safe LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        # Generation counters live outside the LRU so they are never evicted
+        self._counters: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            if key in self._counters:
+                return str(self._counters[key])
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def mget(self, keys: list) -> list:
+        return [self.get(key) for key in keys]
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def expire(self, key: str, seconds: int) -> bool:
+        # Counters are never evicted here, so they need no expiry either
+        return key in self._counters
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._counters.clear()
+
+
+class Cache:
+    def __init__(self, redis_url: Optional[str] = None):
+        self.redis_url = redis_url or settings.redis_url
+        self.local = _LocalStore(settings.cache_local_max_entries)
+        self._redis: Optional["redis.Redis"] = None
+        self._redis_retry_at = 0.0
+
+    def _client(self) -> Optional["redis.Redis"]:
+        if self._redis is not None:
+            return self._redis
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        try:
+            client = redis.Redis.from_url(
+                self.redis_url,
+                decode_responses=True,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+            client.ping()
+            self._redis = client
+            return client
+        except Exception as exc:
+            logger.warning(f"Cache falling back to in-process store: {exc}")
+            self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+            return None
+
+    def _call(self, op: str, *args):
+        """Run `op` on Redis, falling back to the local store on any error."""
+        client = self._client()
+        if client is not None:
+            try:
+                return getattr(client, op)(*args)
+            except Exception as exc:
+                logger.warning(f"Cache Redis {op} failed, using local store: {exc}")
+                self._redis = None
+                self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        if op == "setex":
+            key, ttl, value = args
+            return self.local.set(key, value, ttl)
+        return getattr(self.local, op)(*args)
+
+    def _key(self, namespace: str, key: str) -> str:
+        generation, key_generation = self._call(
+            "mget", [f"cache:gen:{namespace}", f"cache:gen:{namespace}:{key}"]
+        )
+        full_key = f"cache:{namespace}:{generation or '0'}:{key}"
+        return f"{full_key}#{key_generation}" if key_generation else full_key
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        if not settings.cache_enabled:
+            return None
+        return self._get(namespace, self._key(namespace, key))
+
+    def _get(self, namespace: str, full_key: str) -> Optional[Any]:
+        raw = self._call("get", full_key)
+        if raw is None:
+            mark_cache_miss(namespace)
+            return None
+        mark_cache_hit(namespace)
+        return json.loads(raw)
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """Store `value`; with `max_entries`, evict the namespace's oldest keys.
+
+        The cap is enforced in Redis through a per-namespace sorted-set index;
+        the in-process store is already bounded by its LRU.
+        """
+        if not settings.cache_enabled:
+            return
+        self._set(namespace, self._key(namespace, key), value, ttl, max_entries)
+
+    def _set(
+        self,
+        namespace: str,
+        full_key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        raw = json.dumps(value, default=str)
+        self._call("setex", full_key, ttl or settings.cache_ttl_seconds, raw)
+        if max_entries:
+            self._trim(namespace, full_key, max_entries)
+
+    def _trim(self, namespace: str, full_key: str, max_entries: int) -> None:
+        client = self._client()
+        if client is None:
+            return
+        index = f"cache:idx:{namespace}"
+        try:
+            pipe = client.pipeline()
+            pipe.zadd(index, {full_key: time.time()})
+            pipe.zcard(index)
+            _, size = pipe.execute()
+            if size > max_entries:
+                evicted = client.zpopmin(index, size - max_entries)
+                client.delete(*[member for member, _ in evicted])
+        except Exception as exc:
+            logger.warning(f"Cache trim of {namespace} failed: {exc}")
+
+    def _lookup(self, namespace: str, key: str) -> Tuple[str, Optional[Any]]:
+        full_key = self._key(namespace, key)
+        return full_key, self._get(namespace, full_key)
+
+    def get_or_set(
+        self, namespace: str, key: str, loader: Callable[[], Any], ttl: int = None
+    ) -> Any:
+        """Return the cached value, computing and storing it on a miss.
+
+        The value is stored under the generation read before `loader` ran, so
+        an `invalidate` that lands while it loads leaves it unreachable rather
+        than serving pre-write data under the new generation.
+        """
+        if not settings.cache_enabled:
+            return loader()
+        full_key, cached = self._lookup(namespace, key)
+        if cached is not None:
+            return cached
+        value = loader()
+        self._set(namespace, full_key, value, ttl)
+        return value
+
+    async def get_or_set_async(
+        self,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int = None,
+    ) -> Any:
+        """`get_or_set` for async callers; Redis I/O runs in a worker thread."""
+        if not settings.cache_enabled:
+            return await loader()
+        full_key, cached = await asyncio.to_thread(self._lookup, namespace, key)
+        if cached is not None:
+            return cached
+        value = await loader()
+        await asyncio.to_thread(self._set, namespace, full_key, value, ttl)
+        return value
+
+    def delete(self, namespace: str, key: str) -> None:
+        if not settings.cache_enabled:
+            return
+        self._call("delete", self._key(namespace, key))
+
+    def invalidate(self, namespace: str, key: Optional[str] = None) -> None:
+        """Drop every key in `namespace`, or only `key`, via a new generation.
+
+        Unlike `delete`, this also retires a `get_or_set` fill that loaded
+        before the write and stores after it: the fill lands under the old
+        generation, where no reader looks.
+        """
+        if not settings.cache_enabled:
+            return
+        if key is None:
+            self._call("incr", f"cache:gen:{namespace}")
+            return
+        generation_key = f"cache:gen:{namespace}:{key}"
+        self._call("incr", generation_key)
+        self._call("expire", generation_key, KEY_GENERATION_TTL_SECONDS)
+
+    def clear_local(self) -> None:
+        self.local.clear()
+
+
+cache = Cache()
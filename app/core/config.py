@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -13,11 +13,98 @@ class Settings(BaseSettings):
     algorithm: str
     access_token_expire_minutes: int = 30
 
+    feed_total_cache_ttl_seconds: int = 30
+
+    cache_enabled: bool = True
+    cache_ttl_seconds: int = 60
+    cache_local_max_entries: int = 1024
+
+    # Connection pool, per engine and process. A size of 0 turns off pooling
+    # in the app (NullPool), for when PgBouncer pools the connections
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 300
+    # Pre-ping "always" (every checkout), "idle" (only connections idle for
+    # db_pool_pre_ping_idle_seconds) or "never"
+    db_pool_pre_ping: str = "idle"
+    db_pool_pre_ping_idle_seconds: float = 30.0
+    # Server-side statement timeout in ms; 0 keeps the server default
+    db_statement_timeout_ms: int = 0
+    # PgBouncer transaction pooling: no prepared-statement caching and no
+    # startup options (the statement timeout is set per transaction instead)
+    db_pgbouncer: bool = False
+
+    # Query instrumentation
+    db_slow_query_ms: int = 200
+    # Same statement this many times in one request is reported as an N+1
+    db_n_plus_one_threshold: int = 10
+
+    # DB total gauges: "estimate" (pg_class.reltuples) or "exact" (COUNT)
+    metrics_db_totals_mode: str = "estimate"
+    metrics_update_seconds: int = 30
+    metrics_leader_lock_ttl_seconds: int = 90
+
+    # Active users: seen within the TTL; one Redis write per user per window
+    active_users_ttl_seconds: int = 120
+    active_users_touch_window_seconds: int = 30
+    active_users_flush_seconds: float = 5.0
+    active_users_flush_batch_size: int = 500
+
+    # Authenticated principals; entries never outlive the token
+    principal_cache_ttl_seconds: int = 300
+    principal_cache_local_ttl_seconds: int = 30
+    principal_cache_local_max_entries: int = 10000
+
     google_client_id: str
     google_client_secret: str
 
     openai_api_key: str
     openai_base_url: str
+    openai_timeout_seconds: float = 60.0
+    openai_connect_timeout_seconds: float = 5.0
+    openai_max_retries: int = 3
+    openai_max_concurrency: int = 8
+    openai_model: str = "gemini-1.5-flash"
+
+    eq_analysis_cache_ttl_seconds: int = 7 * 24 * 3600
+    eq_analysis_cache_max_entries: int = 10000
+
+    # Background analysis workers per process
+    analysis_workers: int = 4
+    analysis_queue_max_size: int = 1000
+    analysis_stream_poll_seconds: float = 1.0
+    analysis_stream_timeout_seconds: float = 120.0
+    # A pending answer's claim goes stale after this long without a refresh;
+    # every process refreshes its own claims and re-queues stale and
+    # unclaimed answers three times per timeout
+    analysis_claim_timeout_seconds: int = 900
+
+    # Multi-answer prompts for /analysis/analyze-batch
+    analysis_batch_token_budget: int = 6000
+    analysis_batch_max_items: int = 10
+    analysis_batch_max_size: int = 100
+
+    # Comment sentiment scorer: "keyword" or "package.module:ClassName"
+    sentiment_backend: str = "keyword"
+    # "inline" scores before the insert; "deferred" scores after the response
+    sentiment_mode: str = "inline"
+    # JSON file with "negative"/"positive" keyword lists; built-in list if unset
+    sentiment_lexicon_path: Optional[str] = None
+    sentiment_batch_max_size: int = 1000
+    # Process pool for large /analysis/analyze-sentiment/batch requests
+    sentiment_pool_workers: int = 0
+    sentiment_pool_min_batch: int = 500
+
+    # Full-text search: "postgres" (tsvector columns), "memory" (in-process
+    # inverted index) or "auto" (postgres on PostgreSQL, memory otherwise)
+    search_backend: str = "auto"
+
+    # Bulk situation import (python -m app.import_situations, POST
+    # /situations/import); the endpoint is limited to these account emails
+    admin_emails: List[str] = Field(default=[], alias="ADMIN_EMAILS")
+    situation_import_batch_size: int = 1000
+    situation_import_max_bytes: int = 50 * 1024 * 1024
 
     cors_extra_origins: List[str] = Field(default=[], alias="CORS_ORIGINS")
 
@@ -1,5 +1,9 @@
 import os
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from uuid import uuid4
 
 from sqlalchemy import (
     Boolean,
@@ -13,43 +17,217 @@ from sqlalchemy import (
     create_engine,
     event,
 )
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
+# Registers the SQLite versions of the search functions on every connection
+from app.core import text_search  # noqa: F401
 from app.core.config import settings
-from app.core.metrics import track_db_query
+from app.core.db_instrumentation import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    after_cursor_execute,
+    before_cursor_execute,
+)
+from app.core.metrics import mark_db_stale_connection
 
 SQLALCHEMY_DATABASE_URL = settings.database_url
 
+APPLICATION_NAME = "eq_test_backend"
+
+
+def _pool_options(url: str, pool_class) -> dict:
+    """Pool arguments for `create_engine`, from the db_pool_* settings."""
+    options = {
+        "pool_pre_ping": settings.db_pool_pre_ping == "always",
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+    }
+    if "sqlite" in url:
+        # SQLite keeps its dialect's default pool
+        return options
+    if settings.db_pool_size <= 0:
+        # Pooling is left to PgBouncer; its own exporter reports pool usage
+        return {"poolclass": NullPool, "pool_pre_ping": options["pool_pre_ping"]}
+    return {
+        **options,
+        "poolclass": pool_class,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+    }
+
+
+def _connect_args(url: str) -> dict:
+    if "sqlite" in url:
+        return {"check_same_thread": False}
+    args = {"connect_timeout": 30, "application_name": APPLICATION_NAME}
+    if settings.db_statement_timeout_ms and not settings.db_pgbouncer:
+        args["options"] = f"-c statement_timeout={settings.db_statement_timeout_ms}"
+    return args
+
+
+def _async_connect_args(url: str) -> dict:
+    if "sqlite" in url:
+        return {"check_same_thread": False}
+    server_settings = {"application_name": APPLICATION_NAME}
+    args = {"timeout": 30, "server_settings": server_settings}
+    if settings.db_pgbouncer:
+        # In transaction pooling consecutive statements may reach different
+        # server connections, so nothing prepared can be cached or reused
+        args.update(
+            statement_cache_size=0,
+            prepared_statement_cache_size=0,
+            prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+        )
+    elif settings.db_statement_timeout_ms:
+        server_settings["statement_timeout"] = str(settings.db_statement_timeout_ms)
+    return args
+
+
+def _set_local_statement_timeout(conn) -> None:
+    # PgBouncer rejects startup options, so the timeout is set per transaction
+    conn.exec_driver_sql(
+        f"SET LOCAL statement_timeout = {int(settings.db_statement_timeout_ms)}"
+    )
+
+
+def _ping_idle_connections(engine: Engine, label: str) -> None:
+    """Pre-ping only connections that sat idle in the pool for a while.
+
+    A failed ping raises `DisconnectionError`, which makes the pool discard
+    the connection and check out a fresh one.
+    """
+    dialect = engine.dialect
+
+    def on_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.pop("checked_in_at", None)
+        if (
+            checked_in_at is None
+            or time.monotonic() - checked_in_at < settings.db_pool_pre_ping_idle_seconds
+        ):
+            return
+        try:
+            dialect.do_ping(dbapi_connection)
+        except Exception as exc:
+            mark_db_stale_connection(label)
+            raise DisconnectionError(
+                f"Idle pooled connection failed ping: {exc}"
+            ) from exc
+
+    event.listen(engine, "checkin", on_checkin)
+    event.listen(engine, "checkout", on_checkout)
+
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    pool_timeout=30,
-    connect_args=(
-        {"check_same_thread": False}
-        if "sqlite" in SQLALCHEMY_DATABASE_URL
-        else {"connect_timeout": 30, "application_name": "eq_test_backend"}
-    ),
+    **_pool_options(SQLALCHEMY_DATABASE_URL, InstrumentedQueuePool),
+    connect_args=_connect_args(SQLALCHEMY_DATABASE_URL),
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-@event.listens_for(engine, "before_cursor_execute")
-def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    context._query_start_time = time.perf_counter()
+class RequestSession(Session):
+    """Session that keeps one pooled connection from first use until close.
+
+    A plain session hands its connection back to the pool at every commit, so
+    a request that commits and then reads again checks out twice.
+    """
+
+    _held_connection = None
+
+    def get_bind(self, *args, **kwargs):
+        if self._held_connection is None:
+            bind = super().get_bind(*args, **kwargs)
+            if not isinstance(bind, Engine):
+                return bind
+            self._held_connection = bind.connect()
+        return self._held_connection
 
+    def close(self) -> None:
+        super().close()
+        if self._held_connection is not None:
+            self._held_connection.close()
+            self._held_connection = None
 
-@event.listens_for(engine, "after_cursor_execute")
-def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+
+RequestSessionLocal = sessionmaker(
+    class_=RequestSession, autocommit=False, autoflush=False, bind=engine
+)
+
+_request_session: ContextVar[Optional[Session]] = ContextVar(
+    "db_request_session", default=None
+)
+
+
+@contextmanager
+def request_session(db: Session):
+    """Make `db` the session that `session_scope` hands out in this context."""
+    token = _request_session.set(db)
     try:
-        elapsed = time.perf_counter() - getattr(
-            context, "_query_start_time", time.perf_counter()
-        )
-        track_db_query(elapsed)
-    except Exception:
-        pass
+        yield db
+    finally:
+        _request_session.reset(token)
+
+
+@contextmanager
+def session_scope(factory=None):
+    """Yield the current request's session, or a new one outside requests.
+
+    A new session is closed on exit; the request session is left open for
+    its owner (`get_db`), so every service call in a request shares one unit
+    of work and one connection. An error rolls the request session back, as
+    closing a session of its own would have.
+    """
+    db = _request_session.get()
+    if db is not None:
+        try:
+            yield db
+        except Exception:
+            db.rollback()
+            raise
+        return
+    with (factory or SessionLocal)() as db:
+        yield db
+
+
+def _async_database_url(url: str) -> str:
+    """Map a sync database URL onto its asyncio driver (asyncpg/aiosqlite)."""
+    scheme, _, rest = url.partition("://")
+    if scheme.startswith("postgresql"):
+        return f"postgresql+asyncpg://{rest}"
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite://{rest}"
+    return url
+
+
+ASYNC_SQLALCHEMY_DATABASE_URL = _async_database_url(SQLALCHEMY_DATABASE_URL)
+
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    **_pool_options(ASYNC_SQLALCHEMY_DATABASE_URL, InstrumentedAsyncQueuePool),
+    connect_args=_async_connect_args(ASYNC_SQLALCHEMY_DATABASE_URL),
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+for _engine, _label in ((engine, "sync"), (async_engine.sync_engine, "async")):
+    event.listen(_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(_engine, "after_cursor_execute", after_cursor_execute)
+    if settings.db_pool_pre_ping == "idle":
+        _ping_idle_connections(_engine, _label)
+    if settings.db_pgbouncer and settings.db_statement_timeout_ms:
+        event.listen(_engine, "begin", _set_local_statement_timeout)
 
 
 Base = declarative_base()
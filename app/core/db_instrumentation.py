@@ -0,0 +1,163 @@
+"""Query and connection-pool instrumentation for the SQLAlchemy engines.
+
+Every statement is timed and labeled with its operation and main table (parsed
+from the SQL) and with the route of the request that issued it. Requests go
+through `DBQueryStatsMiddleware`, which counts their queries and reports a
+likely N+1 when one statement repeats `db_n_plus_one_threshold` times.
+Statements slower than `db_slow_query_ms` are logged. The pool classes record
+checkout wait time and how many connections are in use.
+"""
+
+import contextvars
+import logging
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+from app.core.metrics import (
+    mark_db_n_plus_one,
+    mark_db_slow_query,
+    track_db_pool,
+    track_db_query,
+    track_db_request_queries,
+)
+
+logger = logging.getLogger(__name__)
+
+_OPERATIONS = {"select", "insert", "update", "delete"}
+_TABLE_PATTERNS = {
+    "select": re.compile(r"\bFROM\s+\"?(\w+)", re.IGNORECASE),
+    "insert": re.compile(r"\bINTO\s+\"?(\w+)", re.IGNORECASE),
+    "update": re.compile(r"^\s*UPDATE\s+\"?(\w+)", re.IGNORECASE),
+    "delete": re.compile(r"\bFROM\s+\"?(\w+)", re.IGNORECASE),
+}
+
+
+@lru_cache(maxsize=2048)
+def classify_statement(statement: str) -> Tuple[str, str]:
+    """Return (operation, table) for a SQL statement, e.g. ("select", "users")."""
+    words = statement.lstrip().split(None, 1)
+    operation = words[0].lower() if words else "other"
+    if operation == "with":
+        operation = "select"
+    if operation not in _OPERATIONS:
+        return "other", "none"
+    match = _TABLE_PATTERNS[operation].search(statement)
+    return operation, match.group(1).lower() if match else "none"
+
+
+class RequestQueryStats:
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.count = 0
+        self.statements: Counter = Counter()
+
+    @property
+    def route(self) -> str:
+        route = self.scope.get("route")
+        return getattr(route, "path", "unmatched")
+
+    def record(self, statement: str) -> None:
+        self.count += 1
+        self.statements[statement] += 1
+
+    def finish(self) -> None:
+        route = self.route
+        track_db_request_queries(route, self.count)
+        if not self.statements:
+            return
+        statement, repeats = self.statements.most_common(1)[0]
+        if repeats >= settings.db_n_plus_one_threshold:
+            mark_db_n_plus_one(route)
+            logger.warning(
+                f"Possible N+1 on {route}: statement ran {repeats} times "
+                f"({self.count} queries in total): {statement[:200]}"
+            )
+
+
+_request_stats: contextvars.ContextVar[Optional[RequestQueryStats]] = (
+    contextvars.ContextVar("db_request_stats", default=None)
+)
+
+
+def current_request_stats() -> Optional[RequestQueryStats]:
+    return _request_stats.get()
+
+
+class DBQueryStatsMiddleware:
+    """ASGI middleware that scopes query statistics to each HTTP request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = RequestQueryStats(scope)
+        token = _request_stats.set(stats)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_stats.reset(token)
+            stats.finish()
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start_time = time.perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    try:
+        elapsed = time.perf_counter() - getattr(
+            context, "_query_start_time", time.perf_counter()
+        )
+        operation, table = classify_statement(statement)
+        stats = _request_stats.get()
+        route = stats.route if stats is not None else "background"
+        track_db_query(elapsed, operation, table, route)
+        if stats is not None:
+            stats.record(statement)
+        if elapsed * 1000 >= settings.db_slow_query_ms:
+            mark_db_slow_query(operation, table)
+            logger.warning(
+                f"Slow query ({elapsed * 1000:.0f}ms, {operation} {table}, "
+                f"{route}): {statement[:200]}"
+            )
+    except Exception:
+        pass
+
+
+class _PoolMetricsMixin:
+    engine_label = "sync"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self._report(time.perf_counter() - started)
+
+    def _do_return_conn(self, record):
+        super()._do_return_conn(record)
+        self._report()
+
+    def _report(self, wait_seconds: float = None) -> None:
+        try:
+            capacity = self.size() + max(self._max_overflow, 0)
+            track_db_pool(self.engine_label, self.checkedout(), capacity, wait_seconds)
+        except Exception:
+            pass
+
+
+class InstrumentedQueuePool(_PoolMetricsMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_PoolMetricsMixin, AsyncAdaptedQueuePool):
+    engine_label = "async"
@@ -47,3 +47,10 @@ class UnauthorizedError(APIException):
 class ForbiddenError(APIException):
     def __init__(self, message: str = "Forbidden"):
         super().__init__(status_code=status.HTTP_403_FORBIDDEN, message=message)
+
+
+class ServiceUnavailableError(APIException):
+    def __init__(self, message: str = "Service unavailable"):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, message=message
+        )
@@ -0,0 +1,71 @@
+"""In-process background job queue served by a fixed pool of asyncio workers.
+
+Jobs are coroutine functions queued with their arguments. The queue only
+dispatches work: callers persist whatever state is needed to recover jobs that
+were still queued when the process stopped.
+"""
+
+import asyncio
+import contextvars
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+from app.core.exceptions import ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueue:
+    def __init__(self, name: str, concurrency: int, max_size: int = 0):
+        self.name = name
+        self.concurrency = concurrency
+        self.max_size = max_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._loop = None
+
+    def start(self) -> None:
+        """Start the workers on the running loop (again, if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        # A fresh context keeps workers started from a request out of its scope
+        self._workers = [
+            loop.create_task(self._worker(i), context=contextvars.Context())
+            for i in range(self.concurrency)
+        ]
+        self._loop = loop
+        logger.info(f"Started {self.concurrency} {self.name} workers")
+
+    async def stop(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._loop = None
+
+    def enqueue(self, job: Callable[..., Awaitable], *args) -> None:
+        self.start()
+        try:
+            self._queue.put_nowait((job, args))
+        except asyncio.QueueFull:
+            raise ServiceUnavailableError(f"The {self.name} queue is full, retry later")
+
+    async def join(self) -> None:
+        """Wait until every queued job has finished."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def qsize(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job, args = await self._queue.get()
+            try:
+                await job(*args)
+            except Exception:
+                logger.exception(f"{self.name} worker {index} job failed")
+            finally:
+                self._queue.task_done()
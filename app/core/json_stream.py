@@ -0,0 +1,91 @@
+"""Incremental scanner for a JSON object that arrives in chunks.
+
+The scanner reports each scalar value as soon as its last character has been
+seen, together with the path of object keys leading to it, so callers can act
+on parts of a model reply before the whole document has been generated. Text
+before the first `{` (such as a Markdown fence) is skipped.
+"""
+
+import json
+from typing import Any, List, Optional, Tuple
+
+_SCALAR_END = set(",}] \t\r\n")
+
+
+class _Frame:
+    __slots__ = ("is_object", "key", "expect_key")
+
+    def __init__(self, is_object: bool):
+        self.is_object = is_object
+        self.key: Optional[str] = None
+        self.expect_key = is_object
+
+
+class JSONStreamScanner:
+    def __init__(self):
+        self._stack: List[_Frame] = []
+        self._started = False
+        self._done = False
+        self._token: Optional[List[str]] = None
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def done(self) -> bool:
+        """True once the outermost object has been closed."""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Tuple[Tuple[str, ...], Any]]:
+        """Consume `chunk`; return the (path, value) pairs it completed."""
+        values = []
+        for char in chunk:
+            if self._done:
+                break
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    self._stack.append(_Frame(is_object=True))
+                continue
+            if self._in_string:
+                self._token.append(char)
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    self._complete(json.loads("".join(self._token)), values)
+                continue
+            if self._token is not None:
+                if char not in _SCALAR_END:
+                    self._token.append(char)
+                    continue
+                self._complete(json.loads("".join(self._token)), values)
+            self._structural(char)
+        return values
+
+    def _structural(self, char: str) -> None:
+        frame = self._stack[-1]
+        if char == '"':
+            self._token, self._in_string = [char], True
+        elif char in "{[":
+            self._stack.append(_Frame(is_object=char == "{"))
+        elif char in "}]":
+            self._stack.pop()
+            if not self._stack:
+                self._done = True
+        elif char == ",":
+            frame.expect_key = frame.is_object
+        elif char not in ": \t\r\n":
+            self._token = [char]
+
+    def _complete(self, value: Any, values: list) -> None:
+        self._token = None
+        frame = self._stack[-1]
+        if frame.expect_key:
+            frame.key, frame.expect_key = value, False
+            return
+        values.append((self._path(), value))
+
+    def _path(self) -> Tuple[str, ...]:
+        return tuple(frame.key for frame in self._stack if frame.is_object)
@@ -14,6 +14,11 @@ ACTIVE_USERS = Gauge("active_users", "Number of active users")
 SITUATIONS_CREATED = Counter("situations_created_total", "Total situations created")
 REACTIONS_TOTAL = Counter("reactions_total", "Total reactions")
 COMMENTS_CREATED = Counter("comments_created_total", "Total comments created")
+SITUATIONS_IMPORTED = Counter(
+    "situations_imported_rows_total",
+    "Rows read by bulk situation imports",
+    ["outcome"],  # inserted, duplicate or rejected
+)
 
 # Auth metrics
 AUTH_LOGIN_SUCCESS = Counter(
@@ -27,7 +32,74 @@ EXCEPTIONS_TOTAL = Counter("exceptions_total", "Unhandled exceptions", ["type"])
 
 # DB metrics
 DB_QUERY_DURATION = Histogram(
-    "db_query_duration_seconds", "Database query duration in seconds"
+    "db_query_duration_seconds",
+    "Database query duration in seconds",
+    ["operation", "table", "route"],
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "Database queries issued while serving one request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250),
+)
+DB_N_PLUS_ONE = Counter(
+    "db_n_plus_one_total",
+    "Requests that repeated one statement at least the N+1 threshold times",
+    ["route"],
+)
+DB_SLOW_QUERIES = Counter(
+    "db_slow_queries_total",
+    "Queries slower than the slow-query threshold",
+    ["operation", "table"],
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled database connection",
+    ["engine"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use", "Checked-out pooled connections", ["engine"]
+)
+DB_POOL_SATURATION = Gauge(
+    "db_pool_saturation_ratio",
+    "Checked-out connections over pool size plus overflow",
+    ["engine"],
+)
+DB_POOL_CAPACITY = Gauge("db_pool_capacity", "Pool size plus max overflow", ["engine"])
+DB_POOL_STALE_CONNECTIONS = Counter(
+    "db_pool_stale_connections_total",
+    "Idle pooled connections discarded after a failed pre-ping",
+    ["engine"],
+)
+
+# Cache metrics
+CACHE_HITS = Counter("cache_hits_total", "Read-through cache hits", ["namespace"])
+CACHE_MISSES = Counter("cache_misses_total", "Read-through cache misses", ["namespace"])
+
+# Principal cache metrics
+PRINCIPAL_CACHE_HITS = Counter(
+    "auth_principal_cache_hits_total",
+    "Authenticated requests served from the principal cache; each saves a "
+    "users query",
+    ["tier"],
+)
+PRINCIPAL_CACHE_MISSES = Counter(
+    "auth_principal_cache_misses_total",
+    "Authenticated requests that had to load the user from the database",
+)
+
+# EQ analysis metrics
+EQ_ANALYSIS_DURATION = Histogram(
+    "eq_analysis_duration_seconds", "Model round trip for one EQ analysis"
+)
+EQ_ANALYSIS_CACHE_SAVED_SECONDS = Counter(
+    "eq_analysis_cache_saved_seconds_total",
+    "Model latency avoided by serving EQ analyses from the result cache",
+)
+EQ_ANALYSIS_TIME_TO_FIRST_PILLAR = Histogram(
+    "eq_analysis_time_to_first_pillar_seconds",
+    "Time from request to the first complete pillar of a streamed EQ analysis",
 )
 
 # Database totals
@@ -72,6 +144,13 @@ def increment_situations_created() -> None:
     SITUATIONS_CREATED.inc()
 
 
+def track_situation_import(inserted: int, duplicates: int, rejected: int) -> None:
+    SITUATIONS_CREATED.inc(inserted)
+    SITUATIONS_IMPORTED.labels(outcome="inserted").inc(inserted)
+    SITUATIONS_IMPORTED.labels(outcome="duplicate").inc(duplicates)
+    SITUATIONS_IMPORTED.labels(outcome="rejected").inc(rejected)
+
+
 def increment_reactions() -> None:
     REACTIONS_TOTAL.inc()
 
@@ -99,13 +178,78 @@ def mark_exception(exc_type: str) -> None:
 
 
 # DB helpers
-def track_db_query(duration_seconds: float) -> None:
+def track_db_query(
+    duration_seconds: float,
+    operation: str = "other",
+    table: str = "none",
+    route: str = "none",
+) -> None:
     try:
-        DB_QUERY_DURATION.observe(duration_seconds)
+        DB_QUERY_DURATION.labels(operation=operation, table=table, route=route).observe(
+            duration_seconds
+        )
     except Exception:
         pass
 
 
+def track_db_request_queries(route: str, count: int) -> None:
+    DB_QUERIES_PER_REQUEST.labels(route=route).observe(count)
+
+
+def mark_db_n_plus_one(route: str) -> None:
+    DB_N_PLUS_ONE.labels(route=route).inc()
+
+
+def mark_db_slow_query(operation: str, table: str) -> None:
+    DB_SLOW_QUERIES.labels(operation=operation, table=table).inc()
+
+
+def track_db_pool(
+    engine: str, in_use: int, capacity: int, wait_seconds: float = None
+) -> None:
+    if wait_seconds is not None:
+        DB_POOL_CHECKOUT_WAIT.labels(engine=engine).observe(wait_seconds)
+    DB_POOL_IN_USE.labels(engine=engine).set(in_use)
+    DB_POOL_CAPACITY.labels(engine=engine).set(capacity)
+    if capacity > 0:
+        DB_POOL_SATURATION.labels(engine=engine).set(in_use / capacity)
+
+
+def mark_db_stale_connection(engine: str) -> None:
+    DB_POOL_STALE_CONNECTIONS.labels(engine=engine).inc()
+
+
+# Cache helpers
+def mark_cache_hit(namespace: str) -> None:
+    CACHE_HITS.labels(namespace=namespace).inc()
+
+
+def mark_cache_miss(namespace: str) -> None:
+    CACHE_MISSES.labels(namespace=namespace).inc()
+
+
+# Principal cache helpers
+def mark_principal_cache_hit(tier: str) -> None:
+    PRINCIPAL_CACHE_HITS.labels(tier=tier).inc()
+
+
+def mark_principal_cache_miss() -> None:
+    PRINCIPAL_CACHE_MISSES.inc()
+
+
+# EQ analysis helpers
+def track_eq_analysis(duration_seconds: float) -> None:
+    EQ_ANALYSIS_DURATION.observe(duration_seconds)
+
+
+def mark_eq_analysis_cache_saved(duration_seconds: float) -> None:
+    EQ_ANALYSIS_CACHE_SAVED_SECONDS.inc(duration_seconds)
+
+
+def track_eq_analysis_first_pillar(duration_seconds: float) -> None:
+    EQ_ANALYSIS_TIME_TO_FIRST_PILLAR.observe(duration_seconds)
+
+
 # Database totals helpers
 def update_db_totals(
     users_count: int, situations_count: int, reactions_count: int, comments_count: int
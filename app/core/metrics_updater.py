@@ -2,12 +2,16 @@
 
 import asyncio
 import logging
+import os
+import socket
+import uuid
 from typing import Optional
 
 import redis
-from sqlalchemy import func, inspect
+from sqlalchemy import func, inspect, text
 from sqlalchemy.orm import sessionmaker
 
+from app.core.active_users import active_users
 from app.core.config import settings
 from app.core.database import engine
 from app.core.metrics import set_active_users, update_db_totals
@@ -26,7 +30,14 @@ def get_redis_client() -> Optional["redis.Redis"]:
     if _redis_client is not None:
         return _redis_client
     try:
-        _redis_client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+        # Bounded, so an unreachable Redis cannot stall the updater for the
+        # OS connect timeout
+        _redis_client = redis.Redis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_connect_timeout=0.5,
+            socket_timeout=2,
+        )
         _redis_client.ping()
         return _redis_client
     except Exception as exc:
@@ -35,34 +46,112 @@ def get_redis_client() -> Optional["redis.Redis"]:
         return None
 
 
-async def update_database_metrics():
-    """Update database metrics from actual DB counts."""
+TOTAL_MODELS = {
+    "users": User,
+    "situations": Situation,
+    "reactions": Reaction,
+    "comments": Comment,
+}
+LEADER_KEY = "metrics:leader"
+# Identifies this replica when holding the leader lock
+REPLICA_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+_tables_ready = False
+
+
+def is_leader(client) -> bool:
+    """Take or renew the updater lock; without Redis every replica leads."""
+    if client is None:
+        return True
+    ttl = settings.metrics_leader_lock_ttl_seconds
     try:
-        # Skip if tables are not yet created (e.g., before migrations run)
-        inspector = inspect(engine)
-        existing_tables = set(inspector.get_table_names())
-        required_tables = {"users", "situations", "reactions", "comments"}
-        if not required_tables.issubset(existing_tables):
-            missing = ", ".join(sorted(required_tables - existing_tables))
+        if client.set(LEADER_KEY, REPLICA_ID, nx=True, ex=ttl):
+            return True
+        if client.get(LEADER_KEY) == REPLICA_ID:
+            client.expire(LEADER_KEY, ttl)
+            return True
+    except Exception as exc:
+        logger.warning(f"Metrics leader election failed: {exc}")
+    return False
+
+
+def _exact_totals(db, names) -> dict:
+    return {
+        name: db.query(func.count(TOTAL_MODELS[name].id)).scalar() or 0
+        for name in names
+    }
+
+
+def _estimated_totals(db) -> dict:
+    """Row counts from the planner statistics in pg_class.
+
+    Tables that have never been vacuumed or analyzed report -1 and are counted
+    exactly instead.
+    """
+    names = list(TOTAL_MODELS)
+    params = {f"t{i}": name for i, name in enumerate(names)}
+    oids = ", ".join(f"to_regclass(:{key})" for key in params)
+    rows = db.execute(
+        text(
+            "SELECT relname, reltuples::bigint FROM pg_class " f"WHERE oid IN ({oids})"
+        ),
+        params,
+    ).all()
+    totals = {name: int(count) for name, count in rows if count >= 0}
+    missing = [name for name in names if name not in totals]
+    totals.update(_exact_totals(db, missing))
+    return totals
+
+
+def _read_db_totals() -> Optional[dict]:
+    global _tables_ready
+    # Skip if tables are not yet created (e.g., before migrations run)
+    if not _tables_ready:
+        existing_tables = set(inspect(engine).get_table_names())
+        missing = set(TOTAL_MODELS) - existing_tables
+        if missing:
             logger.info(
-                f"Skipping metrics update; missing tables: {missing}. Will retry later."
+                f"Skipping metrics update; missing tables: {', '.join(sorted(missing))}. "
+                "Will retry later."
             )
-            return
+            return None
+        _tables_ready = True
 
-        with SessionLocal() as db:
-            users_count = db.query(func.count(User.id)).scalar() or 0
-            situations_count = db.query(func.count(Situation.id)).scalar() or 0
-            reactions_count = db.query(func.count(Reaction.id)).scalar() or 0
-            comments_count = db.query(func.count(Comment.id)).scalar() or 0
+    with SessionLocal() as db:
+        if (
+            settings.metrics_db_totals_mode == "estimate"
+            and engine.dialect.name == "postgresql"
+        ):
+            return _estimated_totals(db)
+        return _exact_totals(db, TOTAL_MODELS)
 
-            update_db_totals(
-                users_count, situations_count, reactions_count, comments_count
-            )
 
-            logger.info(
-                f"Updated DB metrics: users={users_count}, situations={situations_count}, "
-                f"reactions={reactions_count}, comments={comments_count}"
-            )
+async def update_database_metrics():
+    """Update the DB total gauges, on the leader replica only.
+
+    The default "estimate" mode reads pg_class.reltuples instead of counting
+    rows; "exact" runs COUNT queries. The queries run in a worker thread.
+    Followers keep their gauges unchanged, so aggregate with max().
+    """
+    try:
+        client = await asyncio.to_thread(get_redis_client)
+        if not await asyncio.to_thread(is_leader, client):
+            return
+        totals = await asyncio.to_thread(_read_db_totals)
+        if totals is None:
+            return
+
+        update_db_totals(
+            totals["users"],
+            totals["situations"],
+            totals["reactions"],
+            totals["comments"],
+        )
+
+        logger.info(
+            f"Updated DB metrics: users={totals['users']}, situations={totals['situations']}, "
+            f"reactions={totals['reactions']}, comments={totals['comments']}"
+        )
 
     except Exception as e:
         # Do not crash app if metrics fail; log and continue
@@ -70,26 +159,39 @@ async def update_database_metrics():
 
 
 async def update_active_users_from_redis():
-    client = get_redis_client()
+    client = await asyncio.to_thread(get_redis_client)
     if not client:
         return
     try:
-        # Count TTL keys
-        count = 0
-        for _ in client.scan_iter("active_user:*", count=1000):
-            count += 1
-        set_active_users(int(count))
-        logger.info(f"Updated Active Users from Redis (keys): {count}")
+        count = await asyncio.to_thread(active_users.count, client)
+        set_active_users(count)
+        logger.info(f"Updated Active Users from Redis: {count}")
     except Exception as exc:  # pragma: no cover
         logger.warning(f"Failed to update active users from Redis: {exc}")
 
 
+async def flush_active_users():
+    client = await asyncio.to_thread(get_redis_client)
+    if client and active_users.pending():
+        await asyncio.to_thread(active_users.flush, client)
+
+
+async def start_active_user_flusher():
+    """Write coalesced active-user touches every `active_users_flush_seconds`."""
+    while True:
+        await asyncio.sleep(settings.active_users_flush_seconds)
+        try:
+            await flush_active_users()
+        except Exception as e:
+            logger.error(f"Error flushing active users: {e}")
+
+
 async def start_metrics_updater():
     while True:
         try:
             await update_database_metrics()
             await update_active_users_from_redis()
-            await asyncio.sleep(30)
+            await asyncio.sleep(settings.metrics_update_seconds)
         except Exception as e:
             logger.error(f"Error in metrics updater: {e}")
             await asyncio.sleep(60)
@@ -0,0 +1,63 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import and_, or_
+
+from app.core.exceptions import ValidationError
+
+
+def encode_cursor(created_at: Optional[datetime], id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    payload = {
+        "created_at": created_at.isoformat() if created_at else None,
+        "id": id,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """Decode a cursor produced by `encode_cursor`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        created_at = payload.get("created_at")
+        return (
+            datetime.fromisoformat(created_at) if created_at else None,
+            int(payload["id"]),
+        )
+    except Exception:
+        raise ValidationError("Invalid cursor", ["cursor is malformed"])
+
+
+def seek_filter(created_column, id_column, created_at, last_id: int, descending: bool):
+    """Filter rows that sort after the (created_at, id) cursor position."""
+    if created_at is None:
+        return id_column < last_id if descending else id_column > last_id
+    if descending:
+        return or_(
+            created_column < created_at,
+            and_(created_column == created_at, id_column < last_id),
+        )
+    return or_(
+        created_column > created_at,
+        and_(created_column == created_at, id_column > last_id),
+    )
+
+
+def encode_rank_cursor(rank: float, id: int) -> str:
+    """Encode a (rank, id) keyset position, for relevance-ordered results."""
+    raw = json.dumps({"rank": rank, "id": id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, int]:
+    """Decode a cursor produced by `encode_rank_cursor`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return float(payload["rank"]), int(payload["id"])
+    except Exception:
+        raise ValidationError("Invalid cursor", ["cursor is malformed"])
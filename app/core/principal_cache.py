@@ -0,0 +1,83 @@
+"""Cache of authenticated principals, so a valid token skips the user lookup.
+
+Principals are keyed by email (the token subject) and kept in two tiers: a
+short-lived in-process store, then the shared Redis-backed `cache`. No entry
+outlives the token it was loaded for. Writes to a user must call `invalidate`;
+other replicas' in-process entries expire within the local TTL.
+"""
+
+import json
+import time
+from typing import Optional
+
+from app.core.cache import _LocalStore, cache
+from app.core.config import settings
+from app.core.metrics import mark_principal_cache_hit, mark_principal_cache_miss
+
+PRINCIPAL_CACHE_NAMESPACE = "principal"
+
+
+class PrincipalCache:
+    def __init__(self):
+        self.local = _LocalStore(settings.principal_cache_local_max_entries)
+
+    def get_local(self, email: str) -> Optional[dict]:
+        if not settings.cache_enabled:
+            return None
+        raw = self.local.get(email)
+        if raw is None:
+            return None
+        mark_principal_cache_hit("local")
+        return json.loads(raw)
+
+    def get(self, email: str) -> Optional[dict]:
+        """Return the cached principal, trying the in-process tier first."""
+        if not settings.cache_enabled:
+            return None
+        principal = self.get_local(email)
+        if principal is not None:
+            return principal
+        cached = cache.get(PRINCIPAL_CACHE_NAMESPACE, email)
+        if cached is None:
+            mark_principal_cache_miss()
+            return None
+        mark_principal_cache_hit("redis")
+        principal, expires_at = cached["principal"], cached["expires_at"]
+        self._set_local(email, principal, expires_at)
+        return principal
+
+    def set(self, email: str, principal: dict, expires_at: Optional[float]) -> None:
+        """Cache `principal` until `expires_at` (the token's exp) at the latest."""
+        if not settings.cache_enabled:
+            return
+        ttl = self._ttl(settings.principal_cache_ttl_seconds, expires_at)
+        if ttl <= 0:
+            return
+        cache.set(
+            PRINCIPAL_CACHE_NAMESPACE,
+            email,
+            {"principal": principal, "expires_at": expires_at},
+            ttl,
+        )
+        self._set_local(email, principal, expires_at)
+
+    def invalidate(self, email: str) -> None:
+        self.local.delete(email)
+        cache.delete(PRINCIPAL_CACHE_NAMESPACE, email)
+
+    def clear_local(self) -> None:
+        self.local.clear()
+
+    def _set_local(self, email: str, principal: dict, expires_at) -> None:
+        ttl = self._ttl(settings.principal_cache_local_ttl_seconds, expires_at)
+        if ttl > 0:
+            self.local.set(email, json.dumps(principal), ttl)
+
+    @staticmethod
+    def _ttl(limit: int, expires_at: Optional[float]) -> int:
+        if expires_at is None:
+            return limit
+        return min(limit, int(expires_at - time.time()))
+
+
+principal_cache = PrincipalCache()
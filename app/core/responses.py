@@ -0,0 +1,32 @@
+"""orjson-backed JSON responses.
+
+`ORJSONResponse` is the app's default response class. List endpoints return
+`success_response(...)` instead of a `SuccessResponse` model: the envelope is
+rendered straight to bytes, skipping FastAPI's `jsonable_encoder` walk over
+every item. Pydantic models inside `data` are dumped in JSON mode, so the body
+is the same as on the generic path.
+"""
+
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def success_response(message: str, data: Any = None) -> ORJSONResponse:
+    """A `SuccessResponse` body, serialized without re-encoding `data`."""
+    return ORJSONResponse({"success": True, "message": message, "data": data})
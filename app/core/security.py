@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta
 
 from authlib.integrations.starlette_client import OAuth
@@ -6,6 +7,7 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 
 from app.core.config import settings
+from app.core.principal_cache import principal_cache
 from app.services.user_service import UserService
 
 oauth = OAuth()
@@ -34,12 +36,26 @@ def create_access_token(data: dict):
     return encoded_jwt
 
 
-def get_current_user(request: Request):
+def _token_from_request(request: Request):
     token = request.cookies.get("access_token")
     if not token:
         auth_header = request.headers.get("Authorization")
         if auth_header and auth_header.lower().startswith("bearer "):
             token = auth_header.split(" ", 1)[1].strip()
+    return token
+
+
+def _user_dict(user):
+    return {
+        "id": user.id,
+        "email": user.email,
+        "name": user.name,
+        "picture": user.picture,
+    }
+
+
+def get_current_user(request: Request):
+    token = _token_from_request(request)
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
     try:
@@ -50,27 +66,57 @@ def get_current_user(request: Request):
         if email is None:
             raise HTTPException(status_code=401, detail="Invalid token")
 
+        principal = principal_cache.get(email)
+        if principal is not None:
+            return principal
+
         user_service = UserService()
         user = user_service.get_user_by_email(email)
         if user is None:
             raise HTTPException(status_code=401, detail="User not found")
 
-        return {
-            "id": user.id,
-            "email": user.email,
-            "name": user.name,
-            "picture": user.picture,
-        }
+        principal = _user_dict(user)
+        principal_cache.set(email, principal, payload.get("exp"))
+        return principal
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
 
-def get_current_user_optional(request: Request):
-    token = request.cookies.get("access_token")
+async def get_current_user_async(request: Request):
+    """`get_current_user` for async endpoints; the user lookup does not block."""
+    token = _token_from_request(request)
     if not token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.lower().startswith("bearer "):
-            token = auth_header.split(" ", 1)[1].strip()
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    try:
+        payload = jwt.decode(
+            token, settings.secret_key, algorithms=[settings.algorithm]
+        )
+        email: str = payload.get("sub")
+        if email is None:
+            raise HTTPException(status_code=401, detail="Invalid token")
+
+        principal = principal_cache.get_local(email)
+        if principal is None:
+            principal = await asyncio.to_thread(principal_cache.get, email)
+        if principal is not None:
+            return principal
+
+        user_service = UserService()
+        user = await user_service.get_user_by_email_async(email)
+        if user is None:
+            raise HTTPException(status_code=401, detail="User not found")
+
+        principal = _user_dict(user)
+        await asyncio.to_thread(
+            principal_cache.set, email, principal, payload.get("exp")
+        )
+        return principal
+    except JWTError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+
+def get_current_user_optional(request: Request):
+    token = _token_from_request(request)
     if not token:
         return None
     try:
@@ -81,17 +127,18 @@ def get_current_user_optional(request: Request):
         if email is None:
             return None
 
+        principal = principal_cache.get(email)
+        if principal is not None:
+            return principal
+
         user_service = UserService()
         user = user_service.get_user_by_email(email)
         if user is None:
             return None
 
-        return {
-            "id": user.id,
-            "email": user.email,
-            "name": user.name,
-            "picture": user.picture,
-        }
+        principal = _user_dict(user)
+        principal_cache.set(email, principal, payload.get("exp"))
+        return principal
     except JWTError:
         return None
 
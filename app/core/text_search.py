@@ -0,0 +1,218 @@
+"""Accent-insensitive text search: similarity-ranked and full-text.
+
+On PostgreSQL this relies on migration 8d1c4f7a2e35: `immutable_unaccent`
+(an IMMUTABLE wrapper around `unaccent`, so it can back an index) and pg_trgm,
+with a trigram GiST index over `immutable_unaccent(lower(column))`. The index
+answers the LIKE filter and also returns rows in `<->` (trigram distance)
+order, so a ranked top-k query stops after k matches instead of sorting every
+match of a common name. SQLite has neither, so every SQLite connection gets
+Python versions of `immutable_unaccent` and `similarity`; they fold and score
+text the same way.
+
+Full-text search uses PostgreSQL tsvectors (see `app.services.search_service`);
+`InvertedIndex` is the in-process equivalent for SQLite, with the same
+accent-insensitive tokens and `websearch_to_tsquery`-style queries.
+"""
+
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import Float, event, func, literal
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+# unaccent maps these directly; they have no combining-mark decomposition
+_STROKES = str.maketrans({"đ": "d", "Đ": "D", "ø": "o", "Ø": "O", "ł": "l", "Ł": "L"})
+_WORD = re.compile(r"[^\W_]+")
+
+
+def fold_text(value: str) -> str:
+    """Lowercase and strip diacritics: "Nguyễn Đức" -> "nguyen duc"."""
+    if value is None:
+        return None
+    decomposed = unicodedata.normalize("NFD", value.translate(_STROKES))
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def _trigrams(value: str) -> Set[str]:
+    grams = set()
+    for word in _WORD.findall(value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def trigram_similarity(left: str, right: str) -> float:
+    """pg_trgm's `similarity`: shared trigrams over all distinct trigrams."""
+    if left is None or right is None:
+        return None
+    a, b = _trigrams(left), _trigrams(right)
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@event.listens_for(Engine, "connect")
+def _register_sqlite_functions(dbapi_connection, connection_record):
+    create_function = getattr(dbapi_connection, "create_function", None)
+    if create_function is None:  # not SQLite
+        return
+    create_function("immutable_unaccent", 1, fold_text, deterministic=True)
+    create_function("similarity", 2, trigram_similarity, deterministic=True)
+
+
+def folded(expr):
+    """SQL for `expr` lowercased and unaccented, as the trigram indexes store it."""
+    return func.immutable_unaccent(func.lower(expr))
+
+
+class trigram_distance(FunctionElement):
+    """pg_trgm's `a <-> b`, i.e. 1 - similarity(a, b)."""
+
+    type = Float()
+    inherit_cache = True
+
+
+@compiles(trigram_distance)
+def _compile_trigram_distance(element, compiler, **kw):
+    left, right = element.clauses
+    return f"({compiler.process(left, **kw)} <-> {compiler.process(right, **kw)})"
+
+
+@compiles(trigram_distance, "sqlite")
+def _compile_trigram_distance_sqlite(element, compiler, **kw):
+    return f"(1 - similarity({compiler.process(element.clauses, **kw)}))"
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def text_match(column, query: str) -> Tuple:
+    """Return (filter, distance) for an accent-insensitive substring search.
+
+    The filter is a LIKE over the folded column; ordering by the distance
+    (ascending) puts the most similar matches first.
+    """
+    pattern = folded(literal(f"%{_escape_like(query)}%"))
+    target = folded(column)
+    return (
+        target.like(pattern, escape="\\"),
+        trigram_distance(target, folded(literal(query))),
+    )
+
+
+def tokenize(value: str) -> List[str]:
+    """Folded words of `value`, as the full-text index stores them."""
+    return _WORD.findall(fold_text(value or ""))
+
+
+_QUERY_CHUNK = re.compile(r'(-?)(?:"([^"]*)"?|(\S+))')
+
+
+def parse_web_query(query: str) -> Tuple[List[str], List[List[str]]]:
+    """Split a search box query into (required terms, excluded term groups).
+
+    Follows `websearch_to_tsquery` for the common cases: words are ANDed and
+    "-word" or '-"two words"' excludes. A quoted phrase matches its words
+    anywhere in the document, not only adjacent.
+    """
+    required, excluded = [], []
+    for negated, phrase, word in _QUERY_CHUNK.findall(query):
+        terms = tokenize(phrase or word)
+        if negated and terms:
+            excluded.append(terms)
+        else:
+            required.extend(terms)
+    return required, excluded
+
+
+def highlight(
+    text: str, terms: Iterable[str], max_words: int = 30, before: int = 10
+) -> str:
+    """Excerpt `text` around its first matching word, wrapping matches in <mark>.
+
+    The in-process counterpart of `ts_headline`.
+    """
+    terms = set(terms)
+    words = (text or "").split()
+    hits = {i for i, word in enumerate(words) if terms & set(tokenize(word))}
+    start = max(min(hits) - before, 0) if hits else 0
+    excerpt = [
+        f"<mark>{word}</mark>" if i in hits else word
+        for i, word in enumerate(words[start : start + max_words], start)
+    ]
+    return " ".join(excerpt)
+
+
+class InvertedIndex:
+    """Thread-safe term -> {doc id: weight} postings for in-process search.
+
+    A document is a list of (text, weight) fields; its score for a query is
+    the summed weight of every occurrence of a required term.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._terms: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def add(self, doc_id: int, fields: Iterable[Tuple[Optional[str], float]]) -> None:
+        weights: Dict[str, float] = defaultdict(float)
+        for text, weight in fields:
+            for term in tokenize(text):
+                weights[term] += weight
+        with self._lock:
+            self._remove(doc_id)
+            for term, weight in weights.items():
+                self._postings[term][doc_id] = weight
+            self._terms[doc_id] = set(weights)
+
+    def remove(self, doc_id: int) -> None:
+        with self._lock:
+            self._remove(doc_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._terms.clear()
+
+    def _remove(self, doc_id: int) -> None:
+        for term in self._terms.pop(doc_id, ()):
+            postings = self._postings[term]
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+
+    def search(
+        self, required: List[str], excluded: Iterable[List[str]] = ()
+    ) -> Dict[int, float]:
+        """Score documents containing every `required` term.
+
+        Documents containing all terms of any `excluded` group are dropped.
+        """
+        if not required:
+            return {}
+        with self._lock:
+            postings = sorted(
+                (self._postings.get(term, {}) for term in set(required)), key=len
+            )
+            scores = dict(postings[0])
+            for other in postings[1:]:
+                scores = {
+                    doc_id: score + other[doc_id]
+                    for doc_id, score in scores.items()
+                    if doc_id in other
+                }
+            for group in excluded:
+                for doc_id in list(scores):
+                    if all(doc_id in self._postings.get(term, ()) for term in group):
+                        del scores[doc_id]
+            return scores
@@ -0,0 +1,43 @@
+import argparse
+import json
+import os
+import sys
+
+from app.services.situation_import_service import (
+    IMPORT_FORMATS,
+    SituationImportService,
+)
+
+
+def import_file(
+    path: str, fmt: str = None, batch_size: int = None, user_id: int = None
+) -> dict:
+    """Bulk-import situations from a JSONL or CSV file ("-" reads stdin)."""
+    if fmt is None:
+        fmt = "csv" if path.lower().endswith(".csv") else "jsonl"
+    service = SituationImportService()
+    if path == "-":
+        report = service.import_stream(sys.stdin, fmt, batch_size, user_id)
+    else:
+        # newline="" lets the csv module handle quoted line breaks
+        with open(path, encoding="utf-8-sig", newline="") as stream:
+            report = service.import_stream(stream, fmt, batch_size, user_id)
+
+    print(
+        f"Imported {report['inserted']} situations from {os.path.basename(path)}: "
+        f"{report['duplicates']} duplicates, {report['rejected']} rejected "
+        f"in {report['elapsed_seconds']:.2f}s ({report['rows_per_second']} rows/s)"
+    )
+    for error in report["errors"]:
+        print(json.dumps(error, ensure_ascii=False), file=sys.stderr)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=import_file.__doc__)
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=IMPORT_FORMATS)
+    parser.add_argument("--batch-size", type=int)
+    parser.add_argument("--user-id", type=int, help="owner of the imported rows")
+    args = parser.parse_args()
+    import_file(args.path, args.format, args.batch_size, args.user_id)
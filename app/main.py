@@ -11,9 +11,17 @@ from starlette.middleware.sessions import SessionMiddleware
 
 from app.api.v1.api import router
 from app.core.config import settings
+from app.core.db_instrumentation import DBQueryStatsMiddleware
 from app.core.exceptions import APIException
 from app.core.logging_config import setup_logging
-from app.core.metrics_updater import start_metrics_updater
+from app.core.metrics_updater import (
+    flush_active_users,
+    start_active_user_flusher,
+    start_metrics_updater,
+)
+from app.core.responses import ORJSONResponse
+from app.services.analysis_service import analysis_queue, start_pending_recovery
+from app.services.sentiment_service import shutdown_pool as shutdown_sentiment_pool
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +33,7 @@ app = FastAPI(
     description="Emotional Intelligence Instagram API",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -36,6 +45,7 @@ app.add_middleware(
 )
 
 app.add_middleware(SessionMiddleware, secret_key=settings.secret_key)
+app.add_middleware(DBQueryStatsMiddleware)
 
 instrumentator = Instrumentator(
     should_group_status_codes=True,
@@ -113,6 +123,16 @@ app.include_router(router, prefix="/api/v1")
 async def startup_event():
     logger.info("Application_starting...")
     asyncio.create_task(start_metrics_updater())
+    asyncio.create_task(start_active_user_flusher())
+    analysis_queue.start()
+    asyncio.create_task(start_pending_recovery())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await analysis_queue.stop()
+    await flush_active_users()
+    shutdown_sentiment_pool()
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Float,
     ForeignKey,
     Integer,
     String,
@@ -55,6 +56,14 @@ class Situation(Base):
     )  # Đánh dấu tình huống do user đóng góp
     topic = relationship("Topic", back_populates="situations")
     answers = relationship("Answer", back_populates="situation")
+    # Denormalized stats, maintained on write by the comment/reaction repositories
+    comments_count = Column(Integer, nullable=False, default=0, server_default="0")
+    reactions_count = Column(Integer, nullable=False, default=0, server_default="0")
+    upvotes_count = Column(Integer, nullable=False, default=0, server_default="0")
+    downvotes_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # Content hash set by bulk imports so re-importing a file skips its rows;
+    # NULL for situations created through the API
+    import_key = Column(String, nullable=True, unique=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
@@ -66,6 +75,13 @@ class Answer(Base):
     answer_text = Column(String)
     scores = Column(JSON)  # 5 trụ EQ
     reasoning = Column(JSON)  # Giải thích cho từng trụ EQ
+    # pending -> completed | failed when analyzed in the background
+    status = Column(
+        String, nullable=False, default="completed", server_default="completed"
+    )
+    error = Column(String, nullable=True)
+    # When a process took a pending answer on; stale claims are recovered
+    claimed_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     situation = relationship("Situation", back_populates="answers")
     user = relationship("User")
@@ -85,7 +101,7 @@ class Comment(Base):
     situation_id = Column(Integer, ForeignKey("situations.id"))
     user_id = Column(Integer, ForeignKey("users.id"))
     content = Column(String)
-    sentiment_score = Column(Integer, nullable=True)
+    sentiment_score = Column(Float, nullable=True)
     sentiment_label = Column(String, nullable=True)
     sentiment_analysis = Column(JSON, nullable=True)  # Lưu kết quả sentiment analysis
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,22 @@
+import argparse
+import time
+
+from app.core.database import SessionLocal
+from app.repositories.situation_repository import SituationRepository
+
+
+def reconcile(batch_size: int = 1000) -> int:
+    """Backfill/repair the denormalized situation counters."""
+    start = time.perf_counter()
+    with SessionLocal() as db:
+        fixed = SituationRepository().reconcile_stats(db, batch_size=batch_size)
+    elapsed = time.perf_counter() - start
+    print(f"Reconciled situation stats: {fixed} rows corrected in {elapsed:.2f}s")
+    return fixed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=reconcile.__doc__)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    reconcile(batch_size=args.batch_size)
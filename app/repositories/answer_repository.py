@@ -1,4 +1,7 @@
 import json
+from datetime import datetime, timezone
+
+from sqlalchemy import insert, or_, select, update
 
 from app.models import Answer
 from app.repositories.base import BaseRepository
@@ -10,9 +13,14 @@ class AnswerRepository(BaseRepository[Answer, AnswerCreate, AnswerUpdate]):
         super().__init__(Answer)
 
     def get_by_situation(self, db, situation_id: int):
-        """Get answers by situation ID."""
+        """Get analyzed answers by situation ID."""
         return (
-            db.query(self.model).filter(self.model.situation_id == situation_id).all()
+            db.query(self.model)
+            .filter(
+                self.model.situation_id == situation_id,
+                self.model.status == "completed",
+            )
+            .all()
         )
 
     def create_answer(self, db, answer_data):
@@ -51,6 +59,114 @@ class AnswerRepository(BaseRepository[Answer, AnswerCreate, AnswerUpdate]):
 
         return db_answer
 
+    def bulk_create_with_analysis(self, db, rows: list):
+        """Insert analyzed answers in one statement.
+
+        Each row holds `situation_id`, `answer_text`, `user_id`, `scores` and
+        `reasoning`. Returns `(id, created_at)` per row, in input order.
+        """
+        if not rows:
+            return []
+        values = [
+            {
+                **row,
+                "scores": json.dumps(row["scores"]),
+                "reasoning": json.dumps(row["reasoning"]),
+            }
+            for row in rows
+        ]
+        created = db.execute(
+            insert(self.model).returning(
+                self.model.id, self.model.created_at, sort_by_parameter_order=True
+            ),
+            values,
+        ).all()
+        db.commit()
+        return created
+
+    def create_pending(self, db, answer_data, user_id: int = None):
+        """Create an answer that is still waiting for background analysis."""
+        if hasattr(answer_data, "dict"):
+            answer_data_dict = answer_data.dict()
+        else:
+            answer_data_dict = dict(answer_data)
+
+        # Claimed by the creating process, which queues it itself
+        db_answer = self.model(
+            **answer_data_dict,
+            user_id=user_id,
+            status="pending",
+            claimed_at=datetime.now(timezone.utc),
+        )
+        db.add(db_answer)
+        db.commit()
+        db.refresh(db_answer)
+
+        return db_answer
+
+    def complete(self, db, answer_id: int, scores: dict, reasoning: dict):
+        """Store the analysis result of an answer that is still pending."""
+        db.query(self.model).filter(
+            self.model.id == answer_id, self.model.status == "pending"
+        ).update(
+            {
+                "scores": json.dumps(scores),
+                "reasoning": json.dumps(reasoning),
+                "status": "completed",
+                "error": None,
+            },
+            synchronize_session=False,
+        )
+        db.commit()
+
+    def fail(self, db, answer_id: int, error: str):
+        """Mark an answer that is still pending as failed."""
+        db.query(self.model).filter(
+            self.model.id == answer_id, self.model.status == "pending"
+        ).update({"status": "failed", "error": error}, synchronize_session=False)
+        db.commit()
+
+    def claim_pending(self, db, stale_before: datetime, limit: int = 1000):
+        """Claim pending answers no live process is working on, oldest first.
+
+        An answer is claimable when it was never claimed or its claim is older
+        than `stale_before`. Claiming stamps `claimed_at` in one statement, and
+        rows another transaction is claiming are skipped, so concurrent
+        callers never get the same answer. Returns the claimed IDs.
+        """
+        claimable = (
+            select(self.model.id)
+            .where(
+                self.model.status == "pending",
+                or_(
+                    self.model.claimed_at.is_(None),
+                    self.model.claimed_at < stale_before,
+                ),
+            )
+            .order_by(self.model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        claimed = db.scalars(
+            update(self.model)
+            .where(self.model.id.in_(claimable))
+            .values(claimed_at=datetime.now(timezone.utc))
+            .returning(self.model.id)
+        ).all()
+        db.commit()
+        return sorted(claimed)
+
+    def refresh_claims(self, db, answer_ids) -> None:
+        """Re-stamp `claimed_at` on answers this process still has to finish."""
+        if not answer_ids:
+            return
+        db.execute(
+            update(self.model)
+            .where(self.model.id.in_(answer_ids), self.model.status == "pending")
+            .values(claimed_at=datetime.now(timezone.utc))
+        )
+        db.commit()
+
     def get_answer_by_id(self, db, answer_id: int):
         """Get answer by ID."""
         return self.get(db, answer_id)
@@ -22,6 +22,13 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     ) -> List[ModelType]:
         return db.query(self.model).offset(skip).limit(limit).all()
 
+    def get_many(self, db: Session, ids: List[Any]) -> Dict[Any, ModelType]:
+        """Fetch several rows by ID in one query, keyed by ID."""
+        if not ids:
+            return {}
+        rows = db.query(self.model).filter(self.model.id.in_(set(ids))).all()
+        return {row.id: row for row in rows}
+
     def create(
         self, db: Session, obj_in: Union[CreateSchemaType, Dict[str, Any]]
     ) -> ModelType:
@@ -31,6 +38,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             obj_data = obj_in.dict()
         db_obj = self.model(**obj_data)
         db.add(db_obj)
+        self._on_create(db, db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
@@ -55,6 +63,14 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def delete(self, db: Session, id: int) -> Optional[ModelType]:
         obj = db.query(self.model).get(id)
         if obj:
+            self._on_delete(db, obj)
             db.delete(obj)
             db.commit()
         return obj
+
+    def _on_create(self, db: Session, db_obj: ModelType) -> None:
+        """Hook for writes that must share the transaction of a create."""
+
+    def _on_delete(self, db: Session, db_obj: ModelType) -> None:
+        """Hook for writes that must share the transaction of a delete."""
+
@@ -1,33 +1,120 @@
-from app.models import Comment
+from sqlalchemy import select, update
+from sqlalchemy.orm import joinedload, load_only
+
+from app.core.pagination import seek_filter
+from app.models import Comment, User
 from app.repositories.base import BaseRepository
+from app.repositories.situation_repository import SituationRepository
 from app.schemas.comments import CommentCreate, CommentUpdate
 
 
+def sentiment_columns(sentiment_result: dict) -> dict:
+    """Map a SentimentService result onto the comment's sentiment columns."""
+    return {
+        "sentiment_analysis": sentiment_result,
+        "sentiment_score": sentiment_result.get("score"),
+        "sentiment_label": sentiment_result.get("sentiment"),
+    }
+
+
 class CommentRepository(BaseRepository[Comment, CommentCreate, CommentUpdate]):
     def __init__(self):
         super().__init__(Comment)
+        self.situation_repo = SituationRepository()
 
     def get_by_situation(self, db, situation_id: int):
-        """Get comments by situation ID."""
+        """Get comments by situation ID, oldest first, with their users."""
+        return db.scalars(self.by_situation_statement(situation_id)).all()
+
+    def by_situation_statement(self, situation_id: int):
+        """Select a situation's comments, oldest first, with their users."""
+        return self._with_users(situation_id).order_by(
+            self.model.created_at, self.model.id
+        )
+
+    def _with_users(self, situation_id: int):
+        # One joined query, loading only the columns CommentOut needs
         return (
-            db.query(self.model).filter(self.model.situation_id == situation_id).all()
+            select(self.model)
+            .options(
+                load_only(
+                    self.model.id,
+                    self.model.situation_id,
+                    self.model.user_id,
+                    self.model.content,
+                    self.model.sentiment_analysis,
+                    self.model.created_at,
+                ),
+                joinedload(self.model.user).load_only(
+                    User.id, User.email, User.name, User.picture
+                ),
+            )
+            .where(self.model.situation_id == situation_id)
         )
 
+    def page_by_situation_statement(
+        self, situation_id: int, position=None, backwards: bool = False, limit=20
+    ):
+        """Select up to `limit` + 1 comments past a (created_at, id) position.
+
+        Comments are read oldest first, or newest first with `backwards`; the
+        extra row tells the caller whether another page follows.
+        """
+        stmt = self._with_users(situation_id)
+        if position is not None:
+            created_at, last_id = position
+            stmt = stmt.where(
+                seek_filter(
+                    self.model.created_at, self.model.id, created_at, last_id, backwards
+                )
+            )
+        order = [self.model.created_at, self.model.id]
+        if backwards:
+            order = [column.desc() for column in order]
+        return stmt.order_by(*order).limit(limit + 1)
+
     def create_with_sentiment(
         self, db, comment_data: dict, user_id: int, sentiment_result: dict = None
     ):
         """Create comment with sentiment analysis."""
         comment_data["user_id"] = user_id
         if sentiment_result:
-            comment_data["sentiment_analysis"] = sentiment_result
+            comment_data.update(sentiment_columns(sentiment_result))
 
         db_comment = self.model(**comment_data)
         db.add(db_comment)
+        self._on_create(db, db_comment)
         db.commit()
         db.refresh(db_comment)
 
         return db_comment
 
+    def get_content_chunk(
+        self, db, after_id: int, limit: int, unscored_only: bool = False
+    ):
+        """Return up to `limit` (id, content) rows with id > `after_id`, by id.
+
+        With `unscored_only`, only comments without a sentiment label.
+        """
+        stmt = select(self.model.id, self.model.content).where(self.model.id > after_id)
+        if unscored_only:
+            stmt = stmt.where(self.model.sentiment_label.is_(None))
+        return db.execute(stmt.order_by(self.model.id).limit(limit)).all()
+
+    def bulk_update_sentiment(self, db, rows: list) -> None:
+        """Write sentiment columns for many comments in one executemany.
+
+        Each row is a dict with "id" plus the keys of `sentiment_columns`.
+        """
+        if rows:
+            db.execute(update(self.model), rows)
+
+    def _on_create(self, db, db_obj):
+        self.situation_repo.adjust_stats(db, db_obj.situation_id, comments_count=1)
+
+    def _on_delete(self, db, db_obj):
+        self.situation_repo.adjust_stats(db, db_obj.situation_id, comments_count=-1)
+
     def get_comment_by_id(self, db, comment_id: int):
         """Get comment by ID."""
         return self.get(db, comment_id)
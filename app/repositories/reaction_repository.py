@@ -1,16 +1,28 @@
-from app.models import Reaction
+from sqlalchemy import select
+from sqlalchemy.orm import contains_eager
+
+from app.models import Reaction, User
 from app.repositories.base import BaseRepository
+from app.repositories.situation_repository import SituationRepository
 from app.schemas.reactions import ReactionCreate, ReactionUpdate
 
 
+def _reaction_stats(reaction_type: str, sign: int) -> dict:
+    """Counter deltas for adding (sign=1) or removing (sign=-1) a reaction."""
+    return {
+        "reactions_count": sign,
+        "upvotes_count": sign if reaction_type == "upvote" else 0,
+        "downvotes_count": sign if reaction_type == "downvote" else 0,
+    }
+
+
 class ReactionRepository(BaseRepository[Reaction, ReactionCreate, ReactionUpdate]):
     def __init__(self):
         super().__init__(Reaction)
+        self.situation_repo = SituationRepository()
 
     def get_by_situation(self, db, situation_id: int):
         """Get reactions by situation ID."""
-        from app.models import User
-
         return (
             db.query(self.model)
             .join(User, self.model.user_id == User.id)
@@ -28,11 +40,52 @@ class ReactionRepository(BaseRepository[Reaction, ReactionCreate, ReactionUpdate
             .first()
         )
 
+    def by_situation_statement(self, situation_id: int):
+        """Select reactions for a situation joined with their users."""
+        return (
+            select(self.model)
+            .join(User, self.model.user_id == User.id)
+            .options(contains_eager(self.model.user))
+            .where(self.model.situation_id == situation_id)
+        )
+
+    def user_reactions_statement(self, user_id: int, situation_ids: list):
+        """Select (situation_id, reaction_type) of a user's reactions."""
+        return select(self.model.situation_id, self.model.reaction_type).where(
+            self.model.user_id == user_id,
+            self.model.situation_id.in_(situation_ids),
+        )
+
+    def get_user_reactions(self, db, user_id: int, situation_ids: list) -> dict:
+        """Map situation ID to the user's reaction type for the given situations."""
+        if not situation_ids:
+            return {}
+        rows = db.execute(self.user_reactions_statement(user_id, situation_ids))
+        return {situation_id: reaction_type for situation_id, reaction_type in rows}
+
     def update_reaction(self, db, reaction_id: int, reaction_type: str):
         """Update reaction type."""
         reaction = db.query(self.model).filter(self.model.id == reaction_id).first()
         if reaction:
+            if reaction.reaction_type != reaction_type:
+                removed = _reaction_stats(reaction.reaction_type, -1)
+                added = _reaction_stats(reaction_type, 1)
+                self.situation_repo.adjust_stats(
+                    db,
+                    reaction.situation_id,
+                    **{key: removed[key] + added[key] for key in removed},
+                )
             reaction.reaction_type = reaction_type
             db.commit()
             db.refresh(reaction)
         return reaction
+
+    def _on_create(self, db, db_obj):
+        self.situation_repo.adjust_stats(
+            db, db_obj.situation_id, **_reaction_stats(db_obj.reaction_type, 1)
+        )
+
+    def _on_delete(self, db, db_obj):
+        self.situation_repo.adjust_stats(
+            db, db_obj.situation_id, **_reaction_stats(db_obj.reaction_type, -1)
+        )
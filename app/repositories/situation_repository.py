@@ -1,4 +1,6 @@
-from app.models import Situation
+from sqlalchemy import and_, case, func, or_, select, update
+
+from app.models import Comment, Reaction, Situation
 from app.repositories.base import BaseRepository
 from app.schemas.situations import SituationCreate, SituationUpdate
 
@@ -26,6 +28,26 @@ class SituationRepository(BaseRepository[Situation, SituationCreate, SituationUp
             .all()
         )
 
+    def bulk_insert_ignore(self, db, rows: list) -> dict:
+        """Insert many situations in one multi-row INSERT ... ON CONFLICT DO NOTHING.
+
+        Rows whose `import_key` already exists are skipped. Returns
+        {import_key: id} for the inserted rows.
+        """
+        if not rows:
+            return {}
+        if db.get_bind().dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = (
+            insert(self.model)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["import_key"])
+            .returning(self.model.import_key, self.model.id)
+        )
+        return dict(db.execute(stmt).all())
+
     def get_with_user(self, db, situation_id: int):
         """Get situation with user info."""
         return db.query(self.model).filter(self.model.id == situation_id).first()
@@ -64,3 +86,85 @@ class SituationRepository(BaseRepository[Situation, SituationCreate, SituationUp
             .filter(self.model.user_id == user_id)
             .all()
         )
+
+    def adjust_stats(self, db, situation_id: int, **deltas: int):
+        """Apply counter deltas (e.g. comments_count=1) to a situation.
+
+        Issued as `SET col = col + delta` so concurrent writers don't lose
+        updates; the caller commits as part of its own transaction.
+        """
+        values = {
+            getattr(self.model, name): getattr(self.model, name) + delta
+            for name, delta in deltas.items()
+            if delta
+        }
+        if situation_id is None or not values:
+            return
+        db.query(self.model).filter(self.model.id == situation_id).update(
+            values, synchronize_session=False
+        )
+
+    def reconcile_stats(self, db, batch_size: int = 1000) -> int:
+        """Recompute denormalized stats from comments/reactions.
+
+        Walks situations in id ranges of `batch_size`, committing per batch,
+        and only rewrites rows whose counters drifted. Returns rows fixed.
+        """
+        comments_count = (
+            select(func.count(Comment.id))
+            .where(Comment.situation_id == self.model.id)
+            .scalar_subquery()
+        )
+        reactions_count = (
+            select(func.count(Reaction.id))
+            .where(Reaction.situation_id == self.model.id)
+            .scalar_subquery()
+        )
+        upvotes_count = (
+            select(
+                func.coalesce(
+                    func.sum(case((Reaction.reaction_type == "upvote", 1), else_=0)), 0
+                )
+            )
+            .where(Reaction.situation_id == self.model.id)
+            .scalar_subquery()
+        )
+        downvotes_count = (
+            select(
+                func.coalesce(
+                    func.sum(case((Reaction.reaction_type == "downvote", 1), else_=0)),
+                    0,
+                )
+            )
+            .where(Reaction.situation_id == self.model.id)
+            .scalar_subquery()
+        )
+
+        max_id = db.query(func.max(self.model.id)).scalar() or 0
+        fixed = 0
+        for start in range(0, max_id + 1, batch_size):
+            result = db.execute(
+                update(self.model)
+                .where(
+                    and_(
+                        self.model.id >= start,
+                        self.model.id < start + batch_size,
+                        or_(
+                            self.model.comments_count != comments_count,
+                            self.model.reactions_count != reactions_count,
+                            self.model.upvotes_count != upvotes_count,
+                            self.model.downvotes_count != downvotes_count,
+                        ),
+                    )
+                )
+                .values(
+                    comments_count=comments_count,
+                    reactions_count=reactions_count,
+                    upvotes_count=upvotes_count,
+                    downvotes_count=downvotes_count,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            fixed += result.rowcount or 0
+        return fixed
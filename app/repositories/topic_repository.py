@@ -1,3 +1,5 @@
+from sqlalchemy import select
+
 from app.models import Topic
 from app.repositories.base import BaseRepository
 from app.schemas.topics import TopicCreate, TopicUpdate
@@ -10,6 +12,10 @@ class TopicRepository(BaseRepository[Topic, TopicCreate, TopicUpdate]):
     def get_by_name(self, db, name: str):
         return db.query(self.model).filter(self.model.name == name).first()
 
+    def get_name_map(self, db) -> dict:
+        """Map every topic name to its id, in one query."""
+        return dict(db.execute(select(self.model.name, self.model.id)).all())
+
     def get_topic_by_id(self, db, topic_id: int):
         """Get topic by ID."""
         return self.get(db, topic_id)
@@ -1,4 +1,7 @@
+from sqlalchemy import select
+
 from app.core.database import SessionLocal
+from app.core.text_search import text_match
 from app.models import User
 from app.repositories.base import BaseRepository
 from app.schemas.users import UserCreate, UserUpdate
@@ -15,7 +18,8 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         query = db.query(self.model)
 
         if search:
-            query = query.filter(self.model.name.ilike(f"%{search}%"))
+            matches, distance = text_match(self.model.name, search)
+            query = query.filter(matches).order_by(distance, self.model.id)
 
         # pagination
         offset = (page - 1) * size
@@ -25,11 +29,13 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
 
     def search_users_by_name(self, db, query: str, limit: int = 10):
         """
-        Search users by name.
+        Search users by name, ignoring case and accents, most similar first.
         """
+        matches, distance = text_match(self.model.name, query)
         users = (
             db.query(self.model)
-            .filter(self.model.name.ilike(f"%{query}%"))
+            .filter(matches)
+            .order_by(distance, self.model.id)
             .limit(limit)
             .all()
         )
@@ -47,6 +53,12 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         """
         return db.query(self.model).filter(self.model.email == email).first()
 
+    def by_email_statement(self, email: str):
+        """
+        Select a user by email.
+        """
+        return select(self.model).where(self.model.email == email)
+
     def get_user_by_google_id(self, db, google_id: str):
         """
         Get user by Google ID.
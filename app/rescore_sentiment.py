@@ -0,0 +1,114 @@
+import argparse
+import json
+import os
+import time
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.repositories.comment_repository import CommentRepository, sentiment_columns
+from app.services.sentiment_service import get_sentiment_backend
+
+DEFAULT_CHECKPOINT = ".rescore_sentiment.json"
+
+
+def _backend_version(backend) -> str:
+    """Identifies the scorer: the lexicon version, or the backend's path."""
+    matcher = getattr(backend, "matcher", None)
+    if matcher is not None:
+        return matcher.version
+    return getattr(backend, "version", None) or settings.sentiment_backend
+
+
+def _load_checkpoint(path: str, lexicon_version: str) -> int:
+    """Return the last re-scored comment id, or 0 if the scorer changed."""
+    if not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        checkpoint = json.load(f)
+    if checkpoint.get("lexicon_version") != lexicon_version:
+        return 0
+    return checkpoint.get("last_id", 0)
+
+
+def _save_checkpoint(path: str, lexicon_version: str, last_id: int) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"lexicon_version": lexicon_version, "last_id": last_id}, f)
+    os.replace(tmp_path, path)
+
+
+def rescore(
+    chunk_size: int = 1000,
+    checkpoint_path: str = DEFAULT_CHECKPOINT,
+    restart: bool = False,
+    missing_only: bool = False,
+) -> int:
+    """Re-score stored comment sentiment with the configured backend.
+
+    Walks comments in id order, one committed chunk at a time, and records the
+    last id in a checkpoint file so an interrupted run resumes where it
+    stopped. A checkpoint written by another scorer is ignored.
+
+    `missing_only` scores just the comments left without a label, e.g. by a
+    failed deferred scoring, at any id; it neither reads nor writes the
+    checkpoint, as re-running it picks up whatever is still unscored.
+    """
+    service = get_sentiment_backend()
+    repo = CommentRepository()
+    version = _backend_version(service)
+    last_id = 0
+    if not (restart or missing_only):
+        last_id = _load_checkpoint(checkpoint_path, version)
+    if last_id:
+        print(f"Resuming after comment {last_id}")
+
+    start = time.perf_counter()
+    done = 0
+    with SessionLocal() as db:
+        while True:
+            chunk = repo.get_content_chunk(
+                db, after_id=last_id, limit=chunk_size, unscored_only=missing_only
+            )
+            if not chunk:
+                break
+            rows = [
+                {
+                    "id": comment_id,
+                    **sentiment_columns(service.analyze_sentiment(content or "")),
+                }
+                for comment_id, content in chunk
+            ]
+            repo.bulk_update_sentiment(db, rows)
+            db.commit()
+            last_id = chunk[-1].id
+            if not missing_only:
+                _save_checkpoint(checkpoint_path, version, last_id)
+            done += len(rows)
+            elapsed = time.perf_counter() - start
+            print(f"Re-scored {done} comments ({done / elapsed:.0f} rows/s)")
+
+    elapsed = time.perf_counter() - start
+    rate = done / elapsed if elapsed else 0.0
+    print(f"Re-scored {done} comments in {elapsed:.2f}s ({rate:.0f} rows/s)")
+    return done
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=rescore.__doc__.splitlines()[0])
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT)
+    parser.add_argument(
+        "--restart", action="store_true", help="ignore an existing checkpoint"
+    )
+    parser.add_argument(
+        "--missing-only",
+        action="store_true",
+        help="score only comments without a sentiment label",
+    )
+    args = parser.parse_args()
+    rescore(
+        chunk_size=args.chunk_size,
+        checkpoint_path=args.checkpoint,
+        restart=args.restart,
+        missing_only=args.missing_only,
+    )
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -20,11 +20,24 @@ class AnswerOut(BaseModel):
     question: str
     context: str
     created_at: datetime
+    status: str = "completed"
+    error: Optional[str] = None
 
     class Config:
         from_attributes = True
 
 
+class AnswerBatchCreate(BaseModel):
+    answers: List[AnswerCreate] = Field(..., min_length=1)
+
+
+class AnswerBatchItemOut(BaseModel):
+    index: int
+    success: bool
+    answer: Optional[AnswerOut] = None
+    error: Optional[str] = None
+
+
 class AnswerUpdate(BaseModel):
     answer_text: Optional[str] = None
 
@@ -33,6 +46,17 @@ class SentimentAnalysisRequest(BaseModel):
     content: str = Field(..., min_length=1, description="Content cannot be empty")
 
 
+class SentimentBatchRequest(BaseModel):
+    contents: List[str] = Field(..., min_length=1)
+
+
+class SentimentBatchItemOut(BaseModel):
+    index: int
+    success: bool
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
 # class ResultCreate(BaseModel):
 #     situation_id: int
 #     user_id: int
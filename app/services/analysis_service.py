@@ -1,13 +1,36 @@
+import asyncio
 import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import List, Set
 
-from app.core.database import SessionLocal
-from app.core.exceptions import NotFoundError
+from app.core.config import settings
+from app.core.database import SessionLocal, session_scope
+from app.core.exceptions import NotFoundError, ServiceUnavailableError
+from app.core.jobs import JobQueue
 from app.repositories.answer_repository import AnswerRepository
 from app.repositories.situation_repository import SituationRepository
-from app.schemas.analysis import AnswerCreate, AnswerOut, SentimentAnalysisRequest
+from app.schemas.analysis import (
+    AnswerBatchItemOut,
+    AnswerCreate,
+    AnswerOut,
+    SentimentAnalysisRequest,
+    SentimentBatchItemOut,
+)
 from app.services.openai_service import OpenAIService
 from app.services.sentiment_service import SentimentService
 
+logger = logging.getLogger(__name__)
+
+analysis_queue = JobQueue(
+    "analysis",
+    concurrency=settings.analysis_workers,
+    max_size=settings.analysis_queue_max_size,
+)
+# Answers queued or being analyzed by this process; their claims are kept
+# fresh so other processes do not recover them
+_claimed: Set[int] = set()
+
 
 class AnalysisService:
     def __init__(self, answer_repo=None, situation_repo=None, sentiment_service=None):
@@ -27,19 +50,62 @@ class AnalysisService:
                 return {}
         return {}
 
-    def analyze_answer(self, answer: AnswerCreate):
-        """Analyze answer using OpenAI EQ analysis."""
-        with SessionLocal() as db:
-            situation = self.situation_repo.get(db, answer.situation_id)
-            if not situation:
-                raise NotFoundError("Situation", answer.situation_id)
+    async def analyze_answer(self, answer: AnswerCreate):
+        """Analyze answer using OpenAI EQ analysis.
+
+        Database work runs in worker threads and no connection is held while
+        waiting on the model.
+        """
+        situation = await asyncio.to_thread(self._get_situation, answer.situation_id)
 
-            question = situation.question
+        scores, reasoning = await self.openai_service.analyze_eq(
+            situation.context, situation.question, answer.answer_text
+        )
 
-            scores, reasoning = self.openai_service.analyze_eq(
-                situation.context, question, answer.answer_text
+        return await asyncio.to_thread(
+            self._save_answer, answer, situation, scores, reasoning
+        )
+
+    async def analyze_answer_stream(self, answer: AnswerCreate):
+        """Look up the situation, then return an async iterator of SSE events.
+
+        Events are `pillar` for each pillar as the model completes it, then
+        `completed` with the saved answer, or `failed` with the error. The
+        lookup happens first so a missing situation is still a 404.
+        """
+        situation = await asyncio.to_thread(self._get_situation, answer.situation_id)
+        return self._stream_analysis(answer, situation)
+
+    async def _stream_analysis(self, answer: AnswerCreate, situation):
+        try:
+            async for event, data in self.openai_service.analyze_eq_stream(
+                situation.context, situation.question, answer.answer_text
+            ):
+                if event == "pillar":
+                    yield "pillar", data
+                else:
+                    scores, reasoning = data
+            result = await asyncio.to_thread(
+                self._save_answer, answer, situation, scores, reasoning
             )
+        except Exception as exc:
+            logger.warning(f"Streaming analysis failed: {exc}")
+            yield "failed", {"error": str(exc)}
+            return
+        yield "completed", result.model_dump(mode="json")
+
+    def _get_situation(self, situation_id: int):
+        # Looked up before a model call, so it uses a session of its own: the
+        # request session would keep its connection checked out until the
+        # request ends, across the whole model round trip
+        with SessionLocal() as db:
+            situation = self.situation_repo.get(db, situation_id)
+            if not situation:
+                raise NotFoundError("Situation", situation_id)
+            return situation
 
+    def _save_answer(self, answer: AnswerCreate, situation, scores, reasoning):
+        with session_scope(SessionLocal) as db:
             if isinstance(self.answer_repo, AnswerRepository):
                 db_answer = self.answer_repo.create_answer_with_analysis(
                     db, answer, scores, reasoning
@@ -51,27 +117,209 @@ class AnalysisService:
                 else:
                     db_answer = created
 
-            scores_val = self.safe_json_loads(db_answer.scores)
-            reasoning_val = self.safe_json_loads(db_answer.reasoning)
-
-            return AnswerOut(
-                id=db_answer.id,
-                situation_id=db_answer.situation_id,
-                answer_text=db_answer.answer_text,
-                scores=scores_val,
-                reasoning=reasoning_val,
-                question=question,
-                context=situation.context,
-                created_at=db_answer.created_at,
+            return self._answer_out(db_answer, situation)
+
+    def _answer_out(self, db_answer, situation, status="completed", error=None):
+        return AnswerOut(
+            id=db_answer.id,
+            situation_id=db_answer.situation_id,
+            answer_text=db_answer.answer_text,
+            scores=self.safe_json_loads(db_answer.scores),
+            reasoning=self.safe_json_loads(db_answer.reasoning),
+            question=situation.question,
+            context=situation.context,
+            created_at=db_answer.created_at,
+            status=status,
+            error=error,
+        )
+
+    async def submit_answer(self, answer: AnswerCreate, user_id: int = None):
+        """Persist a pending answer and analyze it on a background worker."""
+        pending = await asyncio.to_thread(self._create_pending, answer, user_id)
+        try:
+            self._enqueue(pending.id)
+        except ServiceUnavailableError as exc:
+            # Otherwise the row stays pending until the next restart
+            await asyncio.to_thread(
+                self._finish, pending.id, error=exc.detail["message"]
+            )
+            raise
+        return pending
+
+    def _create_pending(self, answer: AnswerCreate, user_id: int = None):
+        with session_scope(SessionLocal) as db:
+            situation = self.situation_repo.get(db, answer.situation_id)
+            if not situation:
+                raise NotFoundError("Situation", answer.situation_id)
+            db_answer = self.answer_repo.create_pending(db, answer, user_id)
+            return self._answer_out(db_answer, situation, status="pending")
+
+    def _enqueue(self, answer_id: int) -> None:
+        analysis_queue.enqueue(self.process_answer, answer_id)
+        _claimed.add(answer_id)
+
+    async def process_answer(self, answer_id: int):
+        """Analyze a pending answer and store the result or the failure."""
+        try:
+            await self._process(answer_id)
+        finally:
+            _claimed.discard(answer_id)
+
+    async def _process(self, answer_id: int):
+        # Picked up: restart the claim, however long the answer was queued
+        await asyncio.to_thread(self._refresh_claims, [answer_id])
+        pending = await asyncio.to_thread(self.get_answer, answer_id)
+        if pending.status != "pending":
+            return
+        try:
+            result = await self.openai_service.analyze_eq(
+                pending.context, pending.question, pending.answer_text
+            )
+            if isinstance(result, dict):
+                raise ValueError(result.get("error") or "Unparseable model reply")
+            scores, reasoning = result
+        except Exception as exc:
+            logger.warning(f"Analysis of answer {answer_id} failed: {exc}")
+            await asyncio.to_thread(self._finish, answer_id, error=str(exc))
+            return
+        await asyncio.to_thread(self._finish, answer_id, scores, reasoning)
+
+    async def refresh_claims(self) -> None:
+        """Keep the claims of answers queued or running here from going stale."""
+        await asyncio.to_thread(self._refresh_claims, list(_claimed))
+
+    def _refresh_claims(self, answer_ids: List[int]) -> None:
+        with session_scope(SessionLocal) as db:
+            self.answer_repo.refresh_claims(db, answer_ids)
+
+    def _finish(self, answer_id: int, scores=None, reasoning=None, error=None):
+        with session_scope(SessionLocal) as db:
+            if error is not None:
+                self.answer_repo.fail(db, answer_id, error)
+            else:
+                self.answer_repo.complete(db, answer_id, scores, reasoning)
+
+    def get_answer(self, answer_id: int):
+        """Get an answer, including its analysis status."""
+        with session_scope(SessionLocal) as db:
+            db_answer = self.answer_repo.get(db, answer_id)
+            if not db_answer:
+                raise NotFoundError("Answer", answer_id)
+            return self._answer_out(
+                db_answer, db_answer.situation, db_answer.status, db_answer.error
+            )
+
+    async def recover_pending(self, limit: int = 1000) -> int:
+        """Claim and re-queue answers left pending by a stopped process.
+
+        Answers another live process has claimed are left to it, so replicas
+        starting together do not analyze the same answer twice.
+        """
+        answer_ids = await asyncio.to_thread(self._claim_pending, limit)
+        recovered = [answer_id for answer_id in answer_ids if answer_id not in _claimed]
+        for answer_id in recovered:
+            self._enqueue(answer_id)
+        return len(recovered)
+
+    def _claim_pending(self, limit: int):
+        stale_before = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.analysis_claim_timeout_seconds
+        )
+        with session_scope(SessionLocal) as db:
+            return self.answer_repo.claim_pending(db, stale_before, limit=limit)
+
+    async def analyze_batch(self, answers: List[AnswerCreate], user_id: int = None):
+        """Analyze many answers with multi-answer prompts and one bulk insert.
+
+        Failures are reported per item; the rest of the batch is still saved.
+        """
+        situations = await asyncio.to_thread(
+            self._get_situations, [answer.situation_id for answer in answers]
+        )
+        results = [None] * len(answers)
+        pending = []
+        for index, answer in enumerate(answers):
+            if answer.situation_id in situations:
+                pending.append(index)
+            else:
+                results[index] = AnswerBatchItemOut(
+                    index=index,
+                    success=False,
+                    error=f"Situation with id {answer.situation_id} not found",
+                )
+
+        analyses = await self.openai_service.analyze_eq_batch(
+            [
+                (
+                    situations[answers[i].situation_id].context,
+                    situations[answers[i].situation_id].question,
+                    answers[i].answer_text,
+                )
+                for i in pending
+            ]
+        )
+
+        rows, scored = [], []
+        for index, analysis in zip(pending, analyses):
+            if isinstance(analysis, dict):
+                results[index] = AnswerBatchItemOut(
+                    index=index, success=False, error=analysis.get("error")
+                )
+                continue
+            scores, reasoning = analysis
+            rows.append(
+                {
+                    "situation_id": answers[index].situation_id,
+                    "answer_text": answers[index].answer_text,
+                    "user_id": user_id,
+                    "scores": scores,
+                    "reasoning": reasoning,
+                }
             )
+            scored.append(index)
+
+        created = await asyncio.to_thread(self._bulk_save, rows)
+        for index, row, (answer_id, created_at) in zip(scored, rows, created):
+            situation = situations[row["situation_id"]]
+            results[index] = AnswerBatchItemOut(
+                index=index,
+                success=True,
+                answer=AnswerOut(
+                    id=answer_id,
+                    situation_id=row["situation_id"],
+                    answer_text=row["answer_text"],
+                    scores=row["scores"],
+                    reasoning=row["reasoning"],
+                    question=situation.question,
+                    context=situation.context,
+                    created_at=created_at,
+                ),
+            )
+        return results
+
+    def _get_situations(self, situation_ids: List[int]):
+        # Own session, like `_get_situation`: the model call comes next
+        with SessionLocal() as db:
+            return self.situation_repo.get_many(db, situation_ids)
+
+    def _bulk_save(self, rows: list):
+        with session_scope(SessionLocal) as db:
+            return self.answer_repo.bulk_create_with_analysis(db, rows)
 
     def analyze_sentiment(self, text: SentimentAnalysisRequest):
         """Analyze sentiment of text content."""
         return self.sentiment_service.analyze_sentiment(text.content)
 
+    def analyze_sentiment_batch(self, contents: List[str]):
+        """Analyze many texts; each item reports its own success or error."""
+        return [
+            SentimentBatchItemOut(**item)
+            for item in self.sentiment_service.analyze_many(contents)
+        ]
+
     def get_answers_by_situation(self, situation_id: int):
         """Get all answers for a specific situation."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             answers = self.answer_repo.get_by_situation(db, situation_id)
             result = []
 
@@ -95,3 +343,22 @@ class AnalysisService:
                 )
 
             return result
+
+
+async def start_pending_recovery():
+    """Refresh this process's claims and recover abandoned pending answers.
+
+    Runs every third of `analysis_claim_timeout_seconds`, so the claims of
+    answers still queued or running here never go stale; only answers of a
+    process that stopped are recovered.
+    """
+    service = AnalysisService()
+    while True:
+        try:
+            await service.refresh_claims()
+            recovered = await service.recover_pending()
+            if recovered:
+                logger.info(f"Re-queued {recovered} pending answers for analysis")
+        except Exception as exc:
+            logger.warning(f"Skipping pending answer recovery: {exc}")
+        await asyncio.sleep(settings.analysis_claim_timeout_seconds / 3)
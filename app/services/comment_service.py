@@ -1,82 +1,199 @@
-from app.core.database import SessionLocal
-from app.core.exceptions import NotFoundError
-from app.repositories.comment_repository import CommentRepository
+import asyncio
+import logging
+from typing import Callable, Optional
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, SessionLocal, session_scope
+from app.core.exceptions import NotFoundError, ValidationError
+from app.core.pagination import decode_cursor, encode_cursor
+from app.repositories.comment_repository import CommentRepository, sentiment_columns
 from app.schemas.comments import CommentCreate, CommentOut, CommentUpdate
-from app.services.sentiment_service import SentimentService
+from app.services.sentiment_service import get_sentiment_backend
+
+logger = logging.getLogger(__name__)
 
 
 class CommentService:
     def __init__(self, repo=None, sentiment_service=None):
         self.repo = repo or CommentRepository()
-        self.sentiment_service = sentiment_service or SentimentService()
+        self.sentiment_service = sentiment_service or get_sentiment_backend()
 
     def get_comments_by_situation(self, situation_id: int):
-        with SessionLocal() as db:
+        cached = cache.get_or_set(
+            "comments",
+            str(situation_id),
+            lambda: [
+                c.model_dump(mode="json")
+                for c in self._load_comments_by_situation(situation_id)
+            ],
+        )
+        return [CommentOut(**c) for c in cached]
+
+    async def get_comments_by_situation_async(self, situation_id: int):
+        """Async variant of `get_comments_by_situation`."""
+        cached = await cache.get_or_set_async(
+            "comments",
+            str(situation_id),
+            lambda: self._load_comments_by_situation_async(situation_id),
+        )
+        return [CommentOut(**c) for c in cached]
+
+    async def _load_comments_by_situation_async(self, situation_id: int) -> list:
+        async with AsyncSessionLocal() as db:
+            comments = await db.scalars(self.repo.by_situation_statement(situation_id))
+            return [self._comment_out(c).model_dump(mode="json") for c in comments]
+
+    def get_comments_page(
+        self, situation_id: int, after: str = None, before: str = None, limit=20
+    ):
+        """One keyset page of a situation's comments, oldest first.
+
+        `after` continues from a page's `next_cursor` and `before` goes back
+        from its `prev_cursor`. With neither (or an empty `after`) the page
+        starts at the oldest comment; an empty `before` gives the newest page.
+        """
+        stmt, limit, backwards, cursor = self._page_statement(
+            situation_id, after, before, limit
+        )
+        with session_scope(SessionLocal) as db:
+            comments = db.scalars(stmt).all()
+            return self._page_body(comments, limit, backwards, bool(cursor))
+
+    async def get_comments_page_async(
+        self, situation_id: int, after: str = None, before: str = None, limit=20
+    ):
+        """Async variant of `get_comments_page`."""
+        stmt, limit, backwards, cursor = self._page_statement(
+            situation_id, after, before, limit
+        )
+        async with AsyncSessionLocal() as db:
+            comments = (await db.scalars(stmt)).all()
+            return self._page_body(comments, limit, backwards, bool(cursor))
+
+    def _page_statement(self, situation_id: int, after, before, limit):
+        if after is not None and before is not None:
+            raise ValidationError(
+                "Invalid pagination", ["pass either before or after, not both"]
+            )
+        if limit < 1 or limit > 100:
+            limit = 20
+        backwards = before is not None
+        cursor = before if backwards else after
+        position = decode_cursor(cursor) if cursor else None
+        stmt = self.repo.page_by_situation_statement(
+            situation_id, position, backwards, limit
+        )
+        return stmt, limit, backwards, cursor
+
+    def _page_body(self, comments, limit: int, backwards: bool, from_cursor: bool):
+        has_more = len(comments) > limit
+        comments = list(comments[:limit])
+        if backwards:
+            comments.reverse()
+        items = [self._comment_out(c) for c in comments]
+        # Paging from a cursor means that cursor's row lies on the other side
+        has_prev, has_next = (
+            (has_more, from_cursor) if backwards else (from_cursor, has_more)
+        )
+
+        prev_cursor = next_cursor = None
+        if items and has_prev:
+            prev_cursor = encode_cursor(items[0].created_at, items[0].id)
+        if items and has_next:
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        return {
+            "items": items,
+            "pagination": {
+                "limit": limit,
+                "prev_cursor": prev_cursor,
+                "next_cursor": next_cursor,
+                "has_prev": has_prev,
+                "has_next": has_next,
+            },
+        }
+
+    def _load_comments_by_situation(self, situation_id: int):
+        with session_scope(SessionLocal) as db:
             comments = self.repo.get_by_situation(db, situation_id)
-            results = []
-            for c in comments:
-                if isinstance(c, dict):
-                    results.append(CommentOut(**c))
-                    continue
-                user_dict = None
-                if getattr(c, "user", None) is not None:
-                    user = c.user
-                    user_dict = {
-                        "id": user.id,
-                        "email": getattr(user, "email", None),
-                        "name": getattr(user, "name", None),
-                        "picture": getattr(user, "picture", None),
-                    }
-                results.append(
-                    CommentOut(
-                        id=c.id,
-                        content=c.content,
-                        situation_id=c.situation_id,
-                        user_id=c.user_id,
-                        sentiment_analysis=getattr(c, "sentiment_analysis", None),
-                        created_at=c.created_at,
-                        user=user_dict,
-                    )
-                )
-            return results
+            return [self._comment_out(c) for c in comments]
 
-    def create_comment(self, comment_in: CommentCreate, user_id: int):
-        with SessionLocal() as db:
-            try:
-                sentiment_result = self.sentiment_service.analyze_sentiment(
-                    comment_in.content
-                )
-                comment = self.repo.create_with_sentiment(
-                    db, comment_in.dict(), user_id, sentiment_result
-                )
-            except Exception:
+    def _comment_out(self, c):
+        if isinstance(c, dict):
+            return CommentOut(**c)
+        user_dict = None
+        if getattr(c, "user", None) is not None:
+            user = c.user
+            user_dict = {
+                "id": user.id,
+                "email": getattr(user, "email", None),
+                "name": getattr(user, "name", None),
+                "picture": getattr(user, "picture", None),
+            }
+        return CommentOut(
+            id=c.id,
+            content=c.content,
+            situation_id=c.situation_id,
+            user_id=c.user_id,
+            sentiment_analysis=getattr(c, "sentiment_analysis", None),
+            created_at=c.created_at,
+            user=user_dict,
+        )
+
+    def create_comment(
+        self, comment_in: CommentCreate, user_id: int, defer: Optional[Callable] = None
+    ):
+        """Create a comment, scoring its sentiment inline or after the response.
+
+        In "deferred" sentiment mode the comment is inserted unscored and
+        `score_comment` is handed to `defer` (e.g. `BackgroundTasks.add_task`);
+        without `defer` the comment is scored inline.
+        """
+        with session_scope(SessionLocal) as db:
+            if settings.sentiment_mode == "deferred" and defer is not None:
                 comment = self.repo.create_with_sentiment(
                     db, comment_in.dict(), user_id
                 )
-            if isinstance(comment, dict):
-                return CommentOut(**comment)
-            user_dict = None
-            if getattr(comment, "user", None) is not None:
-                user = comment.user
-                user_dict = {
-                    "id": user.id,
-                    "email": getattr(user, "email", None),
-                    "name": getattr(user, "name", None),
-                    "picture": getattr(user, "picture", None),
-                }
-            return CommentOut(
-                id=comment.id,
-                content=comment.content,
-                situation_id=comment.situation_id,
-                user_id=comment.user_id,
-                sentiment_analysis=getattr(comment, "sentiment_analysis", None),
-                created_at=comment.created_at,
-                user=user_dict,
+                defer(
+                    self.score_comment,
+                    comment.id,
+                    comment_in.situation_id,
+                    comment_in.content,
+                )
+            else:
+                comment = self._create_scored(db, comment_in, user_id)
+            self._invalidate_situation_comments(comment_in.situation_id)
+            return self._comment_out(comment)
+
+    def _create_scored(self, db, comment_in: CommentCreate, user_id: int):
+        try:
+            sentiment_result = self.sentiment_service.analyze_sentiment(
+                comment_in.content
+            )
+            return self.repo.create_with_sentiment(
+                db, comment_in.dict(), user_id, sentiment_result
             )
+        except Exception:
+            return self.repo.create_with_sentiment(db, comment_in.dict(), user_id)
+
+    def score_comment(self, comment_id: int, situation_id: int, content: str):
+        """Score a stored comment and write its sentiment columns."""
+        try:
+            sentiment_result = self.sentiment_service.analyze_sentiment(content)
+            with session_scope(SessionLocal) as db:
+                self.repo.bulk_update_sentiment(
+                    db, [{"id": comment_id, **sentiment_columns(sentiment_result)}]
+                )
+                db.commit()
+        except Exception as exc:
+            # The comment stays unscored; app.rescore_sentiment can backfill it
+            logger.warning(f"Scoring comment {comment_id} failed: {exc}")
+            return
+        cache.invalidate("comments", str(situation_id))
 
     def get_comment(self, comment_id: int):
         """Get comment by ID."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             comment = self.repo.get(db, comment_id)
             if not comment:
                 raise NotFoundError("Comment", comment_id)
@@ -103,11 +220,12 @@ class CommentService:
 
     def update_comment(self, comment_id: int, comment_in: CommentUpdate):
         """Update comment."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             comment = self.repo.get(db, comment_id)
             if not comment:
                 raise NotFoundError("Comment", comment_id)
             updated_comment = self.repo.update(db, comment, comment_in)
+            self._invalidate_situation_comments(getattr(comment, "situation_id", None))
             if isinstance(updated_comment, dict):
                 return CommentOut(**updated_comment)
             user_dict = None
@@ -131,9 +249,16 @@ class CommentService:
 
     def delete_comment(self, comment_id: int):
         """Delete comment."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             comment = self.repo.get(db, comment_id)
             if not comment:
                 raise NotFoundError("Comment", comment_id)
             self.repo.delete(db, comment_id)
+            self._invalidate_situation_comments(getattr(comment, "situation_id", None))
             return {"message": "Comment deleted successfully"}
+
+    def _invalidate_situation_comments(self, situation_id: int):
+        if situation_id is not None:
+            cache.invalidate("comments", str(situation_id))
+        # Feed items embed comments_count
+        cache.invalidate("feed")
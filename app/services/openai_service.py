@@ -1,38 +1,363 @@
+import asyncio
+import hashlib
 import json
 import re
+import time
+import unicodedata
 
+import httpx
 import openai
 
-from app.constants.prompt_library import SITUATION_ANALYZE_PROMPT
+from app.constants.prompt_library import (
+    SITUATION_ANALYZE_PROMPT,
+    SITUATION_BATCH_ANALYZE_PROMPT,
+)
+from app.core.cache import cache
 from app.core.config import settings
+from app.core.json_stream import JSONStreamScanner
+from app.core.metrics import (
+    mark_eq_analysis_cache_saved,
+    track_eq_analysis,
+    track_eq_analysis_first_pillar,
+)
 
+ANALYSIS_CACHE_NAMESPACE = "eq_analysis"
+EQ_PILLARS = (
+    "self_awareness",
+    "empathy",
+    "self_regulation",
+    "communication",
+    "decision_making",
+)
 
-class OpenAIService:
-    def __init__(self):
-        pass
 
-    def analyze_eq(self, situation: str, question: str, answer_text: str) -> tuple:
-        prompt = SITUATION_ANALYZE_PROMPT
-        client = openai.OpenAI(
-            api_key=settings.openai_api_key, base_url=settings.openai_base_url
+def prompt_version(prompt: str) -> str:
+    """Digest of a prompt; editing it retires every result cached under it."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+
+
+PROMPT_VERSION = prompt_version(SITUATION_ANALYZE_PROMPT)
+# Batch results come from their own prompt, so they are cached apart
+BATCH_PROMPT_VERSION = prompt_version(SITUATION_BATCH_ANALYZE_PROMPT)
+
+_client = None
+_limiter = None
+_client_loop = None
+
+
+def _shared_client():
+    """Return the process-wide `AsyncOpenAI` client and its concurrency limiter.
+
+    Both are bound to the running event loop, so they are rebuilt if the loop
+    changes (which only happens in tests). Retries with exponential backoff on
+    connection errors, 429 and 5xx are handled by the SDK (`max_retries`).
+    """
+    global _client, _limiter, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = openai.AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            base_url=settings.openai_base_url,
+            timeout=httpx.Timeout(
+                settings.openai_timeout_seconds,
+                connect=settings.openai_connect_timeout_seconds,
+            ),
+            max_retries=settings.openai_max_retries,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.openai_max_concurrency,
+                    max_keepalive_connections=settings.openai_max_concurrency,
+                )
+            ),
         )
-        response = client.chat.completions.create(
-            model="gemini-1.5-flash",
-            messages=[
-                {"role": "system", "content": prompt},
-                {
-                    "role": "user",
-                    "content": f"""
+        _limiter = asyncio.Semaphore(settings.openai_max_concurrency)
+        _client_loop = loop
+    return _client, _limiter
+
+
+def normalize_answer(text: str) -> str:
+    """Fold case, Unicode form and whitespace so near-identical answers match."""
+    return " ".join(unicodedata.normalize("NFC", text).split()).casefold()
+
+
+def analysis_cache_key(
+    situation: str,
+    question: str,
+    answer_text: str,
+    version: str = PROMPT_VERSION,
+) -> str:
+    parts = [
+        version,
+        settings.openai_model,
+        situation,
+        question,
+        normalize_answer(answer_text),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token) for prompt budgeting."""
+    return len(text) // 4 + 1
+
+
+def pack_batches(items: list, token_budget: int, max_items: int) -> list:
+    """Group (index, situation, question, answer_text) items into prompt batches.
+
+    Items are ordered by situation so each batch states a shared situation
+    once. A batch closes when the next item would exceed `token_budget` or
+    `max_items`; an item that is larger than the budget on its own still gets
+    a batch.
+    """
+    batches, current, seen, used = [], [], set(), 0
+    for item in sorted(items, key=lambda item: (item[1], item[2], item[0])):
+        _, situation, question, answer_text = item
+        cost = estimate_tokens(answer_text)
+        if (situation, question) not in seen:
+            cost += estimate_tokens(situation) + estimate_tokens(question)
+        if current and (used + cost > token_budget or len(current) >= max_items):
+            batches.append(current)
+            current, seen, used = [], set(), 0
+            cost = sum(estimate_tokens(part) for part in item[1:])
+        current.append(item)
+        seen.add((situation, question))
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _batch_message(batch: list) -> str:
+    labels, situations, answers = {}, [], []
+    for index, situation, question, answer_text in batch:
+        label = labels.setdefault((situation, question), len(labels) + 1)
+        if label > len(situations):
+            situations.append(
+                f"SITUATION {label}: {situation}\nQUESTION {label}: {question}"
+            )
+        answers.append(f"ITEM {index} (SITUATION {label}):\nANSWER: {answer_text}")
+    return "\n\n".join(situations + answers)
+
+
+def _answer_messages(prompt: str, situation: str, question: str, answer_text: str):
+    return [
+        {"role": "system", "content": prompt},
+        {
+            "role": "user",
+            "content": f"""
 SITUATION: {situation}
 
 QUESTION: {question}
 
 ANSWER: {answer_text}
 """,
-                },
-            ],
-            temperature=0.3,
+        },
+    ]
+
+
+def _complete_analysis(scores, reasoning) -> bool:
+    """Whether a parsed reply scores and explains every pillar."""
+    return (
+        isinstance(scores, dict)
+        and isinstance(reasoning, dict)
+        and all(
+            isinstance(scores.get(pillar), (int, float))
+            and not isinstance(scores.get(pillar), bool)
+            and isinstance(reasoning.get(pillar), str)
+            for pillar in EQ_PILLARS
+        )
+    )
+
+
+def _pillar_event(pillar: str, scores: dict, reasoning: dict) -> dict:
+    return {
+        "pillar": pillar,
+        "score": scores.get(pillar),
+        "reasoning": reasoning.get(pillar),
+    }
+
+
+class OpenAIService:
+    def __init__(self):
+        pass
+
+    async def analyze_eq(
+        self, situation: str, question: str, answer_text: str
+    ) -> tuple:
+        """Score an answer, serving repeated (situation, answer) pairs from cache.
+
+        Only parsed results are cached; the failure fallback dict never is.
+        """
+        key = analysis_cache_key(situation, question, answer_text)
+        cached = await self._cached_result(key)
+        if cached is not None:
+            return cached
+
+        started = time.perf_counter()
+        result = await self._analyze_eq_uncached(situation, question, answer_text)
+        latency = time.perf_counter() - started
+        track_eq_analysis(latency)
+
+        if isinstance(result, tuple):
+            await self._store_result(key, result, latency)
+        return result
+
+    async def analyze_eq_stream(self, situation: str, question: str, answer_text: str):
+        """Score an answer, yielding each pillar as soon as the model finishes it.
+
+        Yields `("pillar", {"pillar", "score", "reasoning"})` events followed by
+        one `("result", (scores, reasoning))`. A cached result is replayed as
+        pillar events without a model call. Raises ValueError if the reply is
+        not a complete scores/reasoning object.
+        """
+        key = analysis_cache_key(situation, question, answer_text)
+        cached = await self._cached_result(key)
+        if cached is not None:
+            for pillar in cached[0]:
+                yield "pillar", _pillar_event(pillar, *cached)
+            yield "result", cached
+            return
+
+        started = time.perf_counter()
+        sections = {"scores": {}, "reasoning": {}}
+        scores, reasoning = sections["scores"], sections["reasoning"]
+        emitted = set()
+        scanner = JSONStreamScanner()
+        client, limiter = _shared_client()
+        async with limiter:
+            stream = await client.chat.completions.create(
+                model=settings.openai_model,
+                messages=_answer_messages(
+                    SITUATION_ANALYZE_PROMPT, situation, question, answer_text
+                ),
+                temperature=0.3,
+                stream=True,
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                for path, value in scanner.feed(chunk.choices[0].delta.content or ""):
+                    if len(path) != 2 or path[0] not in sections:
+                        continue
+                    section, pillar = path
+                    sections[section][pillar] = value
+                    # A pillar is complete once both its score and reasoning are in
+                    if pillar in emitted or not (
+                        pillar in scores and pillar in reasoning
+                    ):
+                        continue
+                    if not emitted:
+                        track_eq_analysis_first_pillar(time.perf_counter() - started)
+                    emitted.add(pillar)
+                    yield "pillar", _pillar_event(pillar, scores, reasoning)
+
+        if not scanner.done or not scores:
+            raise ValueError("Incomplete or unparseable model reply")
+        for pillar in scores:
+            if pillar not in emitted:
+                yield "pillar", _pillar_event(pillar, scores, reasoning)
+        latency = time.perf_counter() - started
+        track_eq_analysis(latency)
+        await self._store_result(key, (scores, reasoning), latency)
+        yield "result", (scores, reasoning)
+
+    async def _cached_result(self, key: str):
+        cached = await asyncio.to_thread(cache.get, ANALYSIS_CACHE_NAMESPACE, key)
+        if cached is None:
+            return None
+        mark_eq_analysis_cache_saved(cached["latency"])
+        return cached["scores"], cached["reasoning"]
+
+    async def _store_result(self, key: str, result: tuple, latency: float):
+        scores, reasoning = result
+        await asyncio.to_thread(
+            cache.set,
+            ANALYSIS_CACHE_NAMESPACE,
+            key,
+            {"scores": scores, "reasoning": reasoning, "latency": latency},
+            settings.eq_analysis_cache_ttl_seconds,
+            settings.eq_analysis_cache_max_entries,
+        )
+
+    async def analyze_eq_batch(self, items: list) -> list:
+        """Score many (situation, question, answer_text) items, several per call.
+
+        Returns one entry per item, in order: a (scores, reasoning) tuple, or a
+        dict with an "error" key when that item could not be scored or its
+        reply misses a pillar. Cached items are served without a model call;
+        batch results are cached under the batch prompt's version, apart from
+        single analyses.
+        """
+        results = [None] * len(items)
+        keys = [
+            analysis_cache_key(*item, version=BATCH_PROMPT_VERSION) for item in items
+        ]
+        misses = []
+        for index, (item, key) in enumerate(zip(items, keys)):
+            results[index] = await self._cached_result(key)
+            if results[index] is None:
+                misses.append((index, *item))
+
+        batches = pack_batches(
+            misses,
+            settings.analysis_batch_token_budget,
+            settings.analysis_batch_max_items,
+        )
+        outcomes = await asyncio.gather(
+            *(self._analyze_batch_uncached(batch) for batch in batches)
         )
+        for batch, (batch_results, latency) in zip(batches, outcomes):
+            for index, *_ in batch:
+                result = batch_results[index]
+                results[index] = result
+                if isinstance(result, tuple):
+                    await self._store_result(keys[index], result, latency / len(batch))
+        return results
+
+    async def _analyze_batch_uncached(self, batch: list):
+        """Run one multi-item prompt; return ({index: result}, latency)."""
+        client, limiter = _shared_client()
+        started = time.perf_counter()
+        try:
+            async with limiter:
+                response = await client.chat.completions.create(
+                    model=settings.openai_model,
+                    messages=[
+                        {"role": "system", "content": SITUATION_BATCH_ANALYZE_PROMPT},
+                        {"role": "user", "content": _batch_message(batch)},
+                    ],
+                    temperature=0.3,
+                )
+            reply = response.choices[0].message.content
+            json_str = re.search(r"\{.*\}", reply, re.DOTALL).group()
+            parsed = {
+                int(entry["item"]): (
+                    (entry["scores"], entry["reasoning"])
+                    if _complete_analysis(entry["scores"], entry["reasoning"])
+                    else {"error": "Incomplete analysis in model reply"}
+                )
+                for entry in json.loads(json_str)["results"]
+            }
+        except Exception as e:
+            return {index: {"error": str(e)} for index, *_ in batch}, 0.0
+        latency = time.perf_counter() - started
+        track_eq_analysis(latency)
+        return {
+            index: parsed.get(index, {"error": "Missing from model reply"})
+            for index, *_ in batch
+        }, latency
+
+    async def _analyze_eq_uncached(
+        self, situation: str, question: str, answer_text: str
+    ) -> tuple:
+        prompt = SITUATION_ANALYZE_PROMPT
+        client, limiter = _shared_client()
+        async with limiter:
+            response = await client.chat.completions.create(
+                model=settings.openai_model,
+                messages=_answer_messages(prompt, situation, question, answer_text),
+                temperature=0.3,
+            )
 
         reply = response.choices[0].message.content
         try:
@@ -1,4 +1,5 @@
-from app.core.database import SessionLocal
+from app.core.cache import cache
+from app.core.database import AsyncSessionLocal, SessionLocal, session_scope
 from app.repositories.reaction_repository import ReactionRepository
 from app.schemas.reactions import ReactionOut
 
@@ -9,32 +10,36 @@ class ReactionService:
 
     def get_reactions_by_situation(self, situation_id: int):
         """Get reactions by situation ID."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             reactions = self.repo.get_by_situation(db, situation_id)
-            result = []
-            for reaction in reactions:
-                user_dict = None
-                if hasattr(reaction, "user") and reaction.user:
-                    user_dict = {
-                        "id": reaction.user.id,
-                        "name": reaction.user.name,
-                        "picture": reaction.user.picture,
-                    }
-                result.append(
-                    ReactionOut(
-                        id=reaction.id,
-                        situation_id=reaction.situation_id,
-                        user_id=reaction.user_id,
-                        reaction_type=reaction.reaction_type,
-                        created_at=reaction.created_at,
-                        user=user_dict,
-                    )
-                )
-            return result
+            return [self._reaction_out(reaction) for reaction in reactions]
+
+    async def get_reactions_by_situation_async(self, situation_id: int):
+        """Async variant of `get_reactions_by_situation`."""
+        async with AsyncSessionLocal() as db:
+            reactions = await db.scalars(self.repo.by_situation_statement(situation_id))
+            return [self._reaction_out(reaction) for reaction in reactions]
+
+    def _reaction_out(self, reaction):
+        user_dict = None
+        if hasattr(reaction, "user") and reaction.user:
+            user_dict = {
+                "id": reaction.user.id,
+                "name": reaction.user.name,
+                "picture": reaction.user.picture,
+            }
+        return ReactionOut(
+            id=reaction.id,
+            situation_id=reaction.situation_id,
+            user_id=reaction.user_id,
+            reaction_type=reaction.reaction_type,
+            created_at=reaction.created_at,
+            user=user_dict,
+        )
 
     def create_reaction(self, situation_id: int, reaction_type: str, user_id: int):
         """Create a reaction."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             existing_reaction = self.repo.get_by_user_and_situation(
                 db, user_id, situation_id
             )
@@ -49,6 +54,8 @@ class ReactionService:
                     "reaction_type": reaction_type,
                 }
                 reaction = self.repo.create(db, reaction_data)
+            # Feed items embed reaction counts
+            cache.invalidate("feed")
 
             user_dict = None
             if hasattr(reaction, "user") and reaction.user:
@@ -69,7 +76,8 @@ class ReactionService:
 
     def delete_reaction(self, situation_id: int, reaction_type: str, user_id: int):
         """Delete a reaction."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             reaction = self.repo.get_by_user_and_situation(db, user_id, situation_id)
             if reaction and reaction.reaction_type == reaction_type:
                 self.repo.delete(db, reaction.id)
+                cache.invalidate("feed")
@@ -0,0 +1,317 @@
+"""Full-text search over situations and comments.
+
+On PostgreSQL both tables carry a generated `search_vector` tsvector column
+with a GIN index (migration 5b7e2c9d4f18), so PostgreSQL keeps it current on
+every write. Queries go through `websearch_to_tsquery`, results are ranked
+with `ts_rank` and snippets come from `ts_headline`, all under the
+`eq_unaccent` text search configuration, so accents are ignored.
+
+Other databases (SQLite in tests) use `InMemorySearchBackend`: inverted
+indexes loaded from the database on first use and then updated from ORM
+flushes when the transaction commits. A hit whose row was changed or deleted
+outside the ORM is re-indexed and dropped; rows inserted outside the ORM are
+only found once passed to `index_rows` (or after `reset()`).
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+from sqlalchemy import (
+    REAL,
+    and_,
+    cast,
+    event,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+)
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal, session_scope
+from app.core.pagination import decode_rank_cursor, encode_rank_cursor
+from app.core.text_search import InvertedIndex, highlight, parse_web_query
+from app.models import Comment, Situation
+
+SEARCH_CONFIG = "eq_unaccent"
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=10"
+# ts_rank's default weights for the A (question) and B (context) labels;
+# comment content is unlabeled (D)
+WEIGHT_A, WEIGHT_B, WEIGHT_D = 1.0, 0.4, 0.1
+
+SearchHit = Tuple[Any, float, str]
+
+
+class SearchBackend(Protocol):
+    """Relevance-ordered search; `after` is the (rank, id) of the last hit seen."""
+
+    def search(
+        self,
+        db,
+        kind: str,
+        query: str,
+        topic_id: Optional[int],
+        after: Optional[Tuple[float, int]],
+        limit: int,
+    ) -> List[SearchHit]: ...
+
+
+class PostgresSearchBackend:
+    def search(self, db, kind, query, topic_id, after, limit):
+        model = Comment if kind == "comments" else Situation
+        config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+        tsquery = func.websearch_to_tsquery(config, query)
+        vector = literal_column(f"{model.__tablename__}.search_vector")
+        rank = func.ts_rank(vector, tsquery)
+
+        stmt = select(model.id, rank.label("rank")).where(vector.op("@@")(tsquery))
+        if topic_id is not None:
+            if model is Comment:
+                stmt = stmt.join(Situation, Comment.situation_id == Situation.id)
+            stmt = stmt.where(Situation.topic_id == topic_id)
+        if after is not None:
+            # ts_rank is a real; compare as real so the cursor row is excluded
+            last_rank = cast(literal(after[0]), REAL)
+            stmt = stmt.where(
+                or_(rank < last_rank, and_(rank == last_rank, model.id < after[1]))
+            )
+        page = stmt.order_by(rank.desc(), model.id.desc()).limit(limit).subquery()
+
+        # Headlines are costly, so they are built for the page rows only
+        text = (
+            Comment.content
+            if model is Comment
+            else func.concat_ws(" ", Situation.question, Situation.context)
+        )
+        headline = func.ts_headline(config, text, tsquery, HEADLINE_OPTIONS)
+        rows = db.execute(
+            select(model, page.c.rank, headline)
+            .join(page, model.id == page.c.id)
+            .order_by(page.c.rank.desc(), model.id.desc())
+        ).all()
+        return [(row, float(rank), snippet) for row, rank, snippet in rows]
+
+
+class InMemorySearchBackend:
+    def __init__(self):
+        self.indexes = {"situations": InvertedIndex(), "comments": InvertedIndex()}
+        # The values each document was indexed from, to spot stale hits
+        self._values: Dict[str, Dict[int, tuple]] = {"situations": {}, "comments": {}}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            for kind, index in self.indexes.items():
+                index.clear()
+                self._values[kind].clear()
+            self._loaded = False
+
+    def index(self, kind: str, doc_id: int, values: Optional[tuple]) -> None:
+        """Index one row's searchable values, or remove it when `values` is None."""
+        if values is None:
+            self.indexes[kind].remove(doc_id)
+            self._values[kind].pop(doc_id, None)
+            return
+        if kind == "situations":
+            question, context, _ = values
+            fields = [(question, WEIGHT_A), (context, WEIGHT_B)]
+        else:
+            fields = [(values[0], WEIGHT_D)]
+        self.indexes[kind].add(doc_id, fields)
+        self._values[kind][doc_id] = values
+
+    def _ensure_loaded(self, db) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+            situations = db.execute(
+                select(
+                    Situation.id,
+                    Situation.question,
+                    Situation.context,
+                    Situation.topic_id,
+                )
+            )
+            for situation_id, *values in situations:
+                self.index("situations", situation_id, tuple(values))
+            comments = db.execute(
+                select(Comment.id, Comment.content, Comment.situation_id)
+            )
+            for comment_id, *values in comments:
+                self.index("comments", comment_id, tuple(values))
+            self._loaded = True
+
+    def _topic(self, kind: str, doc_id: int) -> Optional[int]:
+        values = self._values[kind].get(doc_id)
+        if values and kind == "comments":
+            values = self._values["situations"].get(values[1])
+        return values[2] if values else None
+
+    def search(self, db, kind, query, topic_id, after, limit):
+        self._ensure_loaded(db)
+        required, excluded = parse_web_query(query)
+        scores = self.indexes[kind].search(required, excluded)
+        ordered = sorted(
+            (
+                (rank, doc_id)
+                for doc_id, rank in scores.items()
+                if (topic_id is None or self._topic(kind, doc_id) == topic_id)
+                and (after is None or (rank, doc_id) < tuple(after))
+            ),
+            reverse=True,
+        )
+
+        model = Comment if kind == "comments" else Situation
+        hits = []
+        for start in range(0, len(ordered), limit):
+            chunk = ordered[start : start + limit]
+            ids = [doc_id for _, doc_id in chunk]
+            rows = {
+                row.id: row
+                for row in db.scalars(select(model).where(model.id.in_(ids)))
+            }
+            for rank, doc_id in chunk:
+                row = rows.get(doc_id)
+                values = _searchable_values(row) if row is not None else None
+                if values != self._values[kind].get(doc_id):
+                    # Written outside the ORM: fix the index, skip the stale hit
+                    self.index(kind, doc_id, values)
+                    continue
+                hits.append((row, rank, highlight(_text(row), required)))
+                if len(hits) == limit:
+                    return hits
+        return hits
+
+
+def _searchable_values(row) -> tuple:
+    if isinstance(row, Situation):
+        return (row.question, row.context, row.topic_id)
+    return (row.content, row.situation_id)
+
+
+def _text(row) -> str:
+    if isinstance(row, Situation):
+        return " ".join(part for part in (row.question, row.context) if part)
+    return row.content or ""
+
+
+_postgres_backend = PostgresSearchBackend()
+_memory_backend: Optional[InMemorySearchBackend] = None
+_memory_backend_lock = threading.Lock()
+
+
+def memory_backend() -> InMemorySearchBackend:
+    """The process-wide in-memory backend, kept current from ORM writes."""
+    global _memory_backend
+    with _memory_backend_lock:
+        if _memory_backend is None:
+            _memory_backend = InMemorySearchBackend()
+            event.listen(Session, "after_flush", _collect_changes)
+            event.listen(Session, "after_commit", _apply_changes)
+            event.listen(Session, "after_rollback", _discard_changes)
+        return _memory_backend
+
+
+def index_rows(kind: str, rows: Dict[int, tuple]) -> None:
+    """Index rows committed outside the ORM, such as bulk Core inserts.
+
+    `rows` maps ids to the values `InMemorySearchBackend.index` takes. A no-op
+    unless the in-memory backend is in use; PostgreSQL indexes on write.
+    """
+    if _memory_backend is not None:
+        for doc_id, values in rows.items():
+            _memory_backend.index(kind, doc_id, values)
+
+
+def _collect_changes(session, flush_context) -> None:
+    changes = session.info.setdefault("search_changes", [])
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, (Situation, Comment)):
+            changes.append((_kind(obj), obj.id, _searchable_values(obj)))
+    for obj in session.deleted:
+        if isinstance(obj, (Situation, Comment)):
+            changes.append((_kind(obj), obj.id, None))
+
+
+def _apply_changes(session) -> None:
+    for kind, doc_id, values in session.info.pop("search_changes", ()):
+        _memory_backend.index(kind, doc_id, values)
+
+
+def _discard_changes(session) -> None:
+    session.info.pop("search_changes", None)
+
+
+def _kind(obj) -> str:
+    return "situations" if isinstance(obj, Situation) else "comments"
+
+
+def get_search_backend(db) -> SearchBackend:
+    """The backend named by `settings.search_backend`; "auto" picks by dialect."""
+    name = settings.search_backend
+    if name == "auto":
+        dialect = db.get_bind().dialect.name
+        name = "postgres" if dialect == "postgresql" else "memory"
+    if name == "postgres":
+        return _postgres_backend
+    return memory_backend()
+
+
+class SearchService:
+    def search(
+        self,
+        query: str,
+        kind: str = "situations",
+        topic_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ):
+        """Search situations (question, context) or comments, most relevant first.
+
+        Pages are keyset-paginated on (rank, id): `next_cursor` resumes after
+        the last hit. Each item carries a `snippet` with matches in <mark>.
+        """
+        if limit < 1 or limit > 100:
+            limit = 10
+        after = decode_rank_cursor(cursor) if cursor else None
+        with session_scope(SessionLocal) as db:
+            backend = get_search_backend(db)
+            hits = backend.search(db, kind, query, topic_id, after, limit + 1)
+            has_next = len(hits) > limit
+            hits = hits[:limit]
+            items = [self._item(row, rank, snippet) for row, rank, snippet in hits]
+
+        next_cursor = None
+        if has_next:
+            last = items[-1]
+            next_cursor = encode_rank_cursor(last["rank"], last["id"])
+        return {
+            "items": items,
+            "pagination": {
+                "limit": limit,
+                "next_cursor": next_cursor,
+                "has_next": has_next,
+            },
+        }
+
+    def _item(self, row, rank: float, snippet: str) -> dict:
+        if isinstance(row, Situation):
+            item = {
+                "id": row.id,
+                "topic_id": row.topic_id,
+                "user_id": row.user_id,
+                "question": row.question,
+                "context": row.context,
+            }
+        else:
+            item = {
+                "id": row.id,
+                "situation_id": row.situation_id,
+                "user_id": row.user_id,
+                "content": row.content,
+            }
+        item.update(created_at=row.created_at, rank=rank, snippet=snippet)
+        return item
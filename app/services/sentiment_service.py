@@ -1,57 +1,234 @@
+"""Keyword-based sentiment scoring for Vietnamese comments.
+
+Keywords are compiled into one regular expression, shaped like a trie so that
+keywords sharing a prefix share a branch, and each comment is scanned once.
+Matches must be whole words: "vl" does not match inside a longer word. Both
+the lexicon and the text are NFC-normalized and case-folded, so text typed
+with decomposed (NFD) diacritics matches the same keywords.
+"""
+
+import hashlib
+import importlib
+import json
+import re
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Protocol
+
+from app.core.config import settings
+
+NEGATIVE_KEYWORDS = [
+    "chán",
+    "mệt",
+    "stress",
+    "khó chịu",
+    "bực",
+    "tức",
+    "giận",
+    "buồn",
+    "thất vọng",
+    "không thích",
+    "ghét",
+    "khó khăn",
+    "vấn đề",
+    "lo lắng",
+    "sợ",
+    "hoảng",
+    "tuyệt vọng",
+    "đau khổ",
+    "khổ sở",
+    "mệt mỏi",
+    "kiệt sức",
+    "bế tắc",
+    "vl",
+]
+
+POSITIVE_KEYWORDS = [
+    "vui",
+    "hạnh phúc",
+    "tốt",
+    "tuyệt",
+    "thích",
+    "yêu",
+    "thú vị",
+    "thành công",
+    "may mắn",
+    "tích cực",
+    "lạc quan",
+    "hy vọng",
+    "niềm vui",
+    "hài lòng",
+]
+
+
+def normalize_text(text: str) -> str:
+    return unicodedata.normalize("NFC", text).casefold()
+
+
+def _trie_pattern(node: dict) -> str:
+    branches = [
+        (r"\s+" if char == " " else re.escape(char)) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    group = "(?:" + "|".join(branches) + ")"
+    # Greedy optional: the longer keyword wins, the shorter one is the fallback
+    return group + "?" if "" in node else group
+
+
+class KeywordMatcher:
+    def __init__(self, lexicon: Dict[str, Iterable[str]]):
+        self.labels: Dict[str, str] = {}
+        trie: dict = {}
+        for label, keywords in lexicon.items():
+            for keyword in keywords:
+                keyword = " ".join(normalize_text(keyword).split())
+                if not keyword or keyword in self.labels:
+                    continue
+                self.labels[keyword] = label
+                node = trie
+                for char in keyword:
+                    node = node.setdefault(char, {})
+                node[""] = {}
+        # Identifies the lexicon, e.g. to tell whether stored scores are stale
+        self.version = hashlib.sha256(
+            json.dumps(sorted(self.labels.items()), ensure_ascii=False).encode()
+        ).hexdigest()[:12]
+        body = _trie_pattern(trie) if trie else "(?!)"
+        self._pattern = re.compile(rf"(?<!\w){body}(?!\w)")
+
+    def find(self, text: str) -> Dict[str, set]:
+        """Return the distinct keywords found in `text`, grouped by label."""
+        found = {label: set() for label in self.labels.values()}
+        for match in self._pattern.finditer(normalize_text(text)):
+            keyword = " ".join(match.group().split())
+            found[self.labels[keyword]].add(keyword)
+        return found
+
+
+def load_lexicon(path: str) -> Dict[str, list]:
+    """Read a JSON lexicon: {"negative": [...], "positive": [...]}."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {
+        "negative": list(data.get("negative", [])),
+        "positive": list(data.get("positive", [])),
+    }
+
+
+@lru_cache(maxsize=None)
+def get_matcher(lexicon_path: Optional[str] = None) -> KeywordMatcher:
+    """Build the matcher once per process (per lexicon file)."""
+    if lexicon_path:
+        return KeywordMatcher(load_lexicon(lexicon_path))
+    return KeywordMatcher(
+        {"negative": NEGATIVE_KEYWORDS, "positive": POSITIVE_KEYWORDS}
+    )
+
+
+class SentimentBackend(Protocol):
+    """What comment scoring needs from a sentiment scorer."""
+
+    def analyze_sentiment(self, content: str) -> dict: ...
+
+
+@lru_cache(maxsize=None)
+def get_sentiment_backend(name: Optional[str] = None) -> SentimentBackend:
+    """Build the backend named by `settings.sentiment_backend`, once per process.
+
+    "keyword" is the built-in lexicon scorer; any other value is a
+    "package.module:ClassName" path to a class taking no arguments.
+    """
+    name = name or settings.sentiment_backend
+    if name == "keyword":
+        return SentimentService()
+    module_name, _, class_name = name.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _process_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=settings.sentiment_pool_workers)
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+def _analyze_chunk(texts: list, lexicon_path: Optional[str]) -> list:
+    # Runs in a pool worker, which builds its own matcher once
+    return [SentimentService(get_matcher(lexicon_path))._analyze_item(t) for t in texts]
+
+
 class SentimentService:
-    def __init__(self):
-        # Negative keywords
-        self.negative_keywords = [
-            "chán",
-            "mệt",
-            "stress",
-            "khó chịu",
-            "bực",
-            "tức",
-            "giận",
-            "buồn",
-            "thất vọng",
-            "không thích",
-            "ghét",
-            "khó khăn",
-            "vấn đề",
-            "lo lắng",
-            "sợ",
-            "hoảng",
-            "tuyệt vọng",
-            "đau khổ",
-            "khổ sở",
-            "mệt mỏi",
-            "kiệt sức",
-            "bế tắc",
-            "vl",
-        ]
-
-        self.positive_keywords = [
-            "vui",
-            "hạnh phúc",
-            "tốt",
-            "tuyệt",
-            "thích",
-            "yêu",
-            "thú vị",
-            "thành công",
-            "may mắn",
-            "tích cực",
-            "lạc quan",
-            "hy vọng",
-            "niềm vui",
-            "hài lòng",
-        ]
+    def __init__(self, matcher: Optional[KeywordMatcher] = None):
+        # Pool workers rebuild the matcher from the lexicon path, so a
+        # hand-built matcher keeps the batch in this process
+        self._poolable = matcher is None
+        self.matcher = matcher or get_matcher(settings.sentiment_lexicon_path)
+
+    def analyze_many(self, texts: List[str]) -> List[dict]:
+        """Analyze a list of texts; results are in input order.
+
+        Each item is `{"index", "success", "result", "error"}`, so one bad text
+        does not fail the batch. Batches of at least `sentiment_pool_min_batch`
+        texts are split across a process pool when `sentiment_pool_workers`
+        is above one.
+        """
+        workers = settings.sentiment_pool_workers
+        if (
+            self._poolable
+            and workers > 1
+            and len(texts) >= settings.sentiment_pool_min_batch
+        ):
+            size = -(-len(texts) // workers)
+            chunks = [texts[i : i + size] for i in range(0, len(texts), size)]
+            lexicon_path = settings.sentiment_lexicon_path
+            items = [
+                item
+                for chunk in _process_pool().map(
+                    _analyze_chunk, chunks, [lexicon_path] * len(chunks)
+                )
+                for item in chunk
+            ]
+        else:
+            items = [self._analyze_item(text) for text in texts]
+        return [{"index": index, **item} for index, item in enumerate(items)]
+
+    def _analyze_item(self, text) -> dict:
+        if not isinstance(text, str) or not text.strip():
+            return {
+                "success": False,
+                "result": None,
+                "error": "Content cannot be empty",
+            }
+        try:
+            return {
+                "success": True,
+                "result": self.analyze_sentiment(text),
+                "error": None,
+            }
+        except Exception as exc:
+            return {"success": False, "result": None, "error": str(exc)}
 
     def analyze_sentiment(self, content: str):
         """Analyze sentiment of text content."""
-        text_lower = content.lower()
-
-        negative_count = sum(1 for word in self.negative_keywords if word in text_lower)
-        positive_count = sum(1 for word in self.positive_keywords if word in text_lower)
+        found = self.matcher.find(content)
+        negative_count = len(found.get("negative", ()))
+        positive_count = len(found.get("positive", ()))
 
-        total_words = len(text_lower.split())
+        total_words = len(content.split())
         if total_words == 0:
             sentiment_score = 0
         else:
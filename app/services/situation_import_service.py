@@ -0,0 +1,157 @@
+import csv
+import hashlib
+import json
+import time
+from typing import Any, Dict, Iterator, TextIO, Tuple
+
+from pydantic import ValidationError as PydanticValidationError
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.database import SessionLocal, session_scope
+from app.core.exceptions import ValidationError
+from app.core.metrics import track_situation_import
+from app.repositories.situation_repository import SituationRepository
+from app.repositories.topic_repository import TopicRepository
+from app.schemas.situations import SituationBase
+from app.services.search_service import index_rows
+
+IMPORT_FORMATS = ("jsonl", "csv")
+
+
+def import_key(context: str, question: str) -> str:
+    """Dedup key of an imported situation: a hash of its context and question."""
+    return hashlib.sha256(f"{context}\x1f{question}".encode()).hexdigest()
+
+
+def read_records(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Any]]:
+    """Yield (line number, record) from a JSONL or CSV text stream.
+
+    Records are dicts; a JSONL line that does not parse is yielded as the
+    exception instead. CSV input needs a header row, and empty cells are
+    treated as missing.
+    """
+    if fmt == "jsonl":
+        for line_no, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_no, json.loads(line)
+            except ValueError as exc:
+                yield line_no, exc
+    elif fmt == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, {
+                k: v for k, v in record.items() if v not in ("", None)
+            }
+    else:
+        raise ValidationError(
+            "Unsupported import format",
+            [f"format must be one of: {', '.join(IMPORT_FORMATS)}"],
+        )
+
+
+class SituationImportService:
+    def __init__(self):
+        self.repo = SituationRepository()
+        self.topic_repo = TopicRepository()
+
+    def import_stream(
+        self,
+        stream: TextIO,
+        fmt: str = "jsonl",
+        batch_size: int = None,
+        user_id: int = None,
+        max_errors: int = 100,
+    ) -> Dict[str, Any]:
+        """Validate and insert situations from a JSONL or CSV stream.
+
+        Each record has "context", "question" and optionally "topic" (a topic
+        name) or "topic_id". Rows are validated with `SituationBase` and
+        inserted one committed batch at a time; rows already imported (same
+        context and question) are counted as duplicates. The report lists up
+        to `max_errors` rejected rows with their line numbers.
+        """
+        batch_size = batch_size or settings.situation_import_batch_size
+        report = {"inserted": 0, "duplicates": 0, "rejected": 0, "errors": []}
+        start = time.perf_counter()
+        with session_scope(SessionLocal) as db:
+            topics = self.topic_repo.get_name_map(db)
+            topic_ids = set(topics.values())
+            batch = []
+            for line_no, record in read_records(stream, fmt):
+                try:
+                    batch.append(self._row(record, topics, topic_ids, user_id))
+                except ValueError as exc:
+                    report["rejected"] += 1
+                    if len(report["errors"]) < max_errors:
+                        report["errors"].append(
+                            {"line": line_no, "errors": _errors(exc)}
+                        )
+                    continue
+                if len(batch) >= batch_size:
+                    self._insert(db, batch, report)
+                    batch = []
+            self._insert(db, batch, report)
+
+        elapsed = time.perf_counter() - start
+        processed = report["inserted"] + report["duplicates"] + report["rejected"]
+        report["elapsed_seconds"] = round(elapsed, 3)
+        report["rows_per_second"] = round(processed / elapsed) if elapsed else 0
+        track_situation_import(
+            report["inserted"], report["duplicates"], report["rejected"]
+        )
+        if report["inserted"]:
+            cache.invalidate("feed")
+        return report
+
+    def _row(self, record, topics: dict, topic_ids: set, user_id) -> dict:
+        if isinstance(record, Exception):
+            raise ValueError(f"invalid JSON: {record}")
+        if not isinstance(record, dict):
+            raise ValueError("expected a JSON object")
+        record = dict(record)
+        name = record.pop("topic", None)
+        if name is not None and record.get("topic_id") is None:
+            if str(name).strip() not in topics:
+                raise ValueError(f"unknown topic: {name}")
+            record["topic_id"] = topics[str(name).strip()]
+        situation = SituationBase.model_validate(record)
+        if situation.topic_id is not None and situation.topic_id not in topic_ids:
+            raise ValueError(f"unknown topic_id: {situation.topic_id}")
+        return {
+            **situation.model_dump(),
+            "user_id": user_id,
+            "import_key": import_key(situation.context, situation.question),
+        }
+
+    def _insert(self, db, batch: list, report: dict) -> None:
+        if not batch:
+            return
+        # Rows repeated within the batch would otherwise abort the INSERT
+        unique = {row["import_key"]: row for row in batch}
+        ids = self.repo.bulk_insert_ignore(db, list(unique.values()))
+        db.commit()
+        report["inserted"] += len(ids)
+        report["duplicates"] += len(batch) - len(ids)
+        index_rows(
+            "situations",
+            {
+                situation_id: (
+                    unique[key]["question"],
+                    unique[key]["context"],
+                    unique[key]["topic_id"],
+                )
+                for key, situation_id in ids.items()
+            },
+        )
+
+
+def _errors(exc: ValueError) -> list:
+    if isinstance(exc, PydanticValidationError):
+        return [
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            for error in exc.errors()
+        ]
+    return [str(exc)]
@@ -1,9 +1,16 @@
+import asyncio
 import time
 
-from app.core.database import SessionLocal
+from sqlalchemy import func, select
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, SessionLocal, session_scope
 from app.core.exceptions import NotFoundError
-from app.core.metrics import DB_QUERY_DURATION, SITUATIONS_CREATED
-from app.models import Comment, Reaction, User
+from app.core.metrics import SITUATIONS_CREATED
+from app.core.pagination import decode_cursor, encode_cursor, seek_filter
+from app.models import Reaction, User
+from app.repositories.reaction_repository import ReactionRepository
 from app.repositories.situation_repository import SituationRepository
 from app.repositories.topic_repository import TopicRepository
 from app.schemas.situations import (
@@ -15,90 +22,126 @@ from app.schemas.situations import (
 )
 
 
+def _feed_timestamp(value) -> str:
+    # Same text as strftime("%Y-%m-%d %H:%M:%S"), at a fraction of the cost;
+    # the slice drops any UTC offset
+    return value.isoformat(" ", "seconds")[:19] if value else ""
+
+
 class SituationService:
-    def __init__(self, repo=None):
+    def __init__(self, repo=None, reaction_repo=None):
         self.repo = repo or SituationRepository()
+        self.reaction_repo = reaction_repo or ReactionRepository()
+        self._feed_total_cache = None
 
     def get_situations_by_topic(self, topic_id: int):
         """Get situations by topic ID."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             situations = self.repo.get_by_topic(db, topic_id)
             return [SituationOut.from_orm(situation) for situation in situations]
 
-    def get_contributed_situations(self):
-        """Get all contributed situations with user info."""
-        start_time = time.time()
-        with SessionLocal() as db:
-            situations = self.repo.get_contributed_situations_with_user_info(db)
-            result = []
-            for situation in situations:
-                user_dict = None
-                if hasattr(situation, "user") and situation.user:
-                    user_dict = {
-                        "id": situation.user.id,
-                        "name": situation.user.name,
-                        "picture": situation.user.picture,
-                    }
-
-                comments_count = (
-                    db.query(Comment)
-                    .filter(Comment.situation_id == situation.id)
-                    .count()
-                )
-                reactions_count = (
-                    db.query(Reaction)
-                    .filter(Reaction.situation_id == situation.id)
-                    .count()
-                )
-                upvotes_count = (
-                    db.query(Reaction)
-                    .filter(
-                        Reaction.situation_id == situation.id,
-                        Reaction.reaction_type == "upvote",
-                    )
-                    .count()
-                )
-                downvotes_count = (
-                    db.query(Reaction)
-                    .filter(
-                        Reaction.situation_id == situation.id,
-                        Reaction.reaction_type == "downvote",
-                    )
-                    .count()
+    def _feed_statement(self, current_user_id: int = None):
+        """Build the situations select with user info and stats.
+
+        Stats are read from the denormalized counters on each situation, so a
+        page of results costs O(page size) and is fetched in one round trip.
+        The statement runs unchanged on both `Session` and `AsyncSession`.
+        """
+        model = self.repo.model
+        columns = [
+            model,
+            User,
+            model.comments_count,
+            model.reactions_count,
+            model.upvotes_count,
+            model.downvotes_count,
+        ]
+
+        if current_user_id is not None:
+            user_reaction_subquery = (
+                select(
+                    Reaction.situation_id,
+                    Reaction.reaction_type.label("user_reaction"),
                 )
+                .where(Reaction.user_id == current_user_id)
+                .subquery()
+            )
+            columns.append(user_reaction_subquery.c.user_reaction)
 
-                result.append(
-                    {
-                        "id": situation.id,
-                        "topic_id": situation.topic_id,
-                        "user_id": situation.user_id,
-                        "user": user_dict,
-                        "image_url": getattr(situation, "image_url", None),
-                        "context": situation.context,
-                        "question": situation.question,
-                        "created_at": (
-                            situation.created_at.strftime("%Y-%m-%d %H:%M:%S")
-                            if situation.created_at
-                            else ""
-                        ),
-                        "stats": {
-                            "comments_count": comments_count,
-                            "reactions_count": reactions_count,
-                            "upvotes_count": upvotes_count,
-                            "downvotes_count": downvotes_count,
-                        },
-                    }
-                )
-            duration = time.time() - start_time
-            DB_QUERY_DURATION.labels(
-                operation="feed_query", table="situations"
-            ).observe(duration)
+        stmt = select(*columns).outerjoin(User, model.user_id == User.id)
 
-            return result
+        if current_user_id is not None:
+            stmt = stmt.outerjoin(
+                user_reaction_subquery,
+                model.id == user_reaction_subquery.c.situation_id,
+            )
+
+        return stmt
+
+    def _feed_items(self, rows, current_user_id: int = None):
+        """Map rows from `_feed_statement` to feed item dicts."""
+        result = []
+        for row in rows:
+            if current_user_id is not None:
+                (
+                    situation,
+                    user,
+                    comments_count,
+                    reactions_count,
+                    upvotes_count,
+                    downvotes_count,
+                    user_reaction,
+                ) = row
+            else:
+                (
+                    situation,
+                    user,
+                    comments_count,
+                    reactions_count,
+                    upvotes_count,
+                    downvotes_count,
+                ) = row
+                user_reaction = None
+
+            user_dict = None
+            if user:
+                user_dict = {
+                    "id": user.id,
+                    "name": user.name,
+                    "picture": user.picture,
+                }
+
+            result.append(
+                {
+                    "id": situation.id,
+                    "topic_id": situation.topic_id,
+                    "user_id": situation.user_id,
+                    "user": user_dict,
+                    "image_url": getattr(situation, "image_url", None),
+                    "context": situation.context,
+                    "question": situation.question,
+                    "created_at": _feed_timestamp(situation.created_at),
+                    "stats": {
+                        "comments_count": int(comments_count or 0),
+                        "reactions_count": int(reactions_count or 0),
+                        "upvotes_count": int(upvotes_count or 0),
+                        "downvotes_count": int(downvotes_count or 0),
+                    },
+                    "user_reaction": user_reaction,
+                }
+            )
+        return result
+
+    def get_contributed_situations(self, page: int = 1, limit: int = 10):
+        """Get contributed situations with user info and stats, paginated."""
+        return self.get_situations_feed_paginated(page=page, limit=limit)
 
     def get_situations_feed(self):
-        """Get situations feed (deprecated, use get_situations_feed_paginated)."""
-        return self.get_contributed_situations()
+        """Get situations feed (deprecated, use get_situations_feed_paginated).
+
+        Still a list, for its existing callers: the first page's items.
+        """
+        return self.get_contributed_situations()["items"]
 
     def get_situations_feed_paginated(
         self,
@@ -109,245 +152,335 @@ class SituationService:
         current_user_id: int = None,
     ):
         """Get situations feed with pagination and sorting, including user's reaction."""
-        with SessionLocal() as db:
-            if page < 1:
-                page = 1
-            if limit < 1 or limit > 100:
-                limit = 10
-
-            from sqlalchemy import case, func
+        if page < 1:
+            page = 1
+        if limit < 1 or limit > 100:
+            limit = 10
+
+        page_body = cache.get_or_set(
+            "feed",
+            f"page:{page}:{limit}:{sort_by}:{sort_order}",
+            lambda: self._load_feed_page(page, limit, sort_by, sort_order),
+        )
+        return self._with_user_reactions(page_body, current_user_id)
+
+    def _feed_order(self, descending: bool):
+        model = self.repo.model
+        if descending:
+            return (model.created_at.desc(), model.id.desc())
+        return (model.created_at.asc(), model.id.asc())
+
+    def _feed_page_statements(
+        self, page: int, limit: int, sort_by: str, sort_order: str
+    ):
+        """Return the (page, total count) statements for an offset feed page."""
+        model = self.repo.model
+        stmt = self._feed_statement().where(model.topic_id.isnot(None))
+        if sort_by == "created_at":
+            stmt = stmt.order_by(*self._feed_order(sort_order == "desc"))
+        stmt = stmt.offset((page - 1) * limit).limit(limit)
+        count_stmt = select(func.count(model.id)).where(model.topic_id.isnot(None))
+        return stmt, count_stmt
+
+    def _feed_page_body(self, rows, page: int, limit: int, total_count: int):
+        return {
+            "items": self._feed_items(rows),
+            "pagination": {
+                "page": page,
+                "limit": limit,
+                "total": total_count,
+                "pages": (total_count + limit - 1) // limit,
+                "has_next": page * limit < total_count,
+                "has_prev": page > 1,
+            },
+        }
+
+    def _load_feed_page(self, page: int, limit: int, sort_by: str, sort_order: str):
+        stmt, count_stmt = self._feed_page_statements(page, limit, sort_by, sort_order)
+        with session_scope(SessionLocal) as db:
+            total_count = db.execute(count_stmt).scalar() or 0
+            rows = db.execute(stmt).all()
+            return self._feed_page_body(rows, page, limit, total_count)
+
+    async def _load_feed_page_async(
+        self, page: int, limit: int, sort_by: str, sort_order: str
+    ):
+        stmt, count_stmt = self._feed_page_statements(page, limit, sort_by, sort_order)
+        async with AsyncSessionLocal() as db:
+            total_count = (await db.execute(count_stmt)).scalar() or 0
+            rows = (await db.execute(stmt)).all()
+            return self._feed_page_body(rows, page, limit, total_count)
 
-            comments_subquery = (
-                db.query(
-                    Comment.situation_id, func.count(Comment.id).label("comments_count")
-                )
-                .group_by(Comment.situation_id)
-                .subquery()
-            )
+    async def get_situations_feed_paginated_async(
+        self,
+        page: int = 1,
+        limit: int = 10,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        current_user_id: int = None,
+    ):
+        """Async variant of `get_situations_feed_paginated`."""
+        if page < 1:
+            page = 1
+        if limit < 1 or limit > 100:
+            limit = 10
+
+        page_body = await cache.get_or_set_async(
+            "feed",
+            f"page:{page}:{limit}:{sort_by}:{sort_order}",
+            lambda: self._load_feed_page_async(page, limit, sort_by, sort_order),
+        )
+        return await self._with_user_reactions_async(page_body, current_user_id)
+
+    def get_situations_feed_cursor(
+        self,
+        cursor: str = None,
+        limit: int = 10,
+        sort_order: str = "desc",
+        current_user_id: int = None,
+        include_total: bool = False,
+    ):
+        """Get situations feed with keyset pagination on (created_at, id).
+
+        Each page seeks past the last row of the previous one instead of using
+        OFFSET, so deep pages cost the same as the first. The total count is
+        only computed when requested and is cached briefly.
+        """
+        if limit < 1 or limit > 100:
+            limit = 10
+        descending = sort_order != "asc"
+
+        page_body = cache.get_or_set(
+            "feed",
+            f"cursor:{cursor}:{limit}:{descending}:{include_total}",
+            lambda: self._load_feed_cursor_page(
+                cursor, limit, descending, include_total
+            ),
+        )
+        return self._with_user_reactions(page_body, current_user_id)
+
+    def _feed_cursor_statement(self, cursor: str, limit: int, descending: bool):
+        """Select one row past `limit` so `has_next` needs no extra query."""
+        model = self.repo.model
+        stmt = self._feed_statement().where(model.topic_id.isnot(None))
+        if cursor:
+            created_at, last_id = decode_cursor(cursor)
+            stmt = stmt.where(self._seek_filter(created_at, last_id, descending))
+        return stmt.order_by(*self._feed_order(descending)).limit(limit + 1)
+
+    def _feed_cursor_body(self, rows, limit: int, total: int = None):
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor = None
+        if has_next:
+            last = rows[-1][0]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        pagination = {
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "has_next": has_next,
+        }
+        if total is not None:
+            pagination["total"] = total
+
+        return {
+            "items": self._feed_items(rows),
+            "pagination": pagination,
+        }
+
+    def _load_feed_cursor_page(
+        self, cursor: str, limit: int, descending: bool, include_total: bool
+    ):
+        stmt = self._feed_cursor_statement(cursor, limit, descending)
+        with session_scope(SessionLocal) as db:
+            rows = db.execute(stmt).all()
+            total = self._feed_total(db) if include_total else None
+            return self._feed_cursor_body(rows, limit, total)
+
+    async def _load_feed_cursor_page_async(
+        self, cursor: str, limit: int, descending: bool, include_total: bool
+    ):
+        stmt = self._feed_cursor_statement(cursor, limit, descending)
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(stmt)).all()
+            total = await self._feed_total_async(db) if include_total else None
+            return self._feed_cursor_body(rows, limit, total)
 
-            reactions_subquery = (
-                db.query(
-                    Reaction.situation_id,
-                    func.count(Reaction.id).label("reactions_count"),
-                    func.sum(
-                        case((Reaction.reaction_type == "upvote", 1), else_=0)
-                    ).label("upvotes_count"),
-                    func.sum(
-                        case((Reaction.reaction_type == "downvote", 1), else_=0)
-                    ).label("downvotes_count"),
-                )
-                .group_by(Reaction.situation_id)
-                .subquery()
+    async def get_situations_feed_cursor_async(
+        self,
+        cursor: str = None,
+        limit: int = 10,
+        sort_order: str = "desc",
+        current_user_id: int = None,
+        include_total: bool = False,
+    ):
+        """Async variant of `get_situations_feed_cursor`."""
+        if limit < 1 or limit > 100:
+            limit = 10
+        descending = sort_order != "asc"
+
+        page_body = await cache.get_or_set_async(
+            "feed",
+            f"cursor:{cursor}:{limit}:{descending}:{include_total}",
+            lambda: self._load_feed_cursor_page_async(
+                cursor, limit, descending, include_total
+            ),
+        )
+        return await self._with_user_reactions_async(page_body, current_user_id)
+
+    def _with_user_reactions(self, page_body: dict, current_user_id: int = None):
+        """Overlay the caller's own reactions onto a shared (cacheable) feed page."""
+        if current_user_id is None or not page_body["items"]:
+            return page_body
+        situation_ids = [item["id"] for item in page_body["items"]]
+        with session_scope(SessionLocal) as db:
+            user_reactions = self.reaction_repo.get_user_reactions(
+                db, current_user_id, situation_ids
             )
+        return self._overlay_user_reactions(page_body, user_reactions)
 
-            if current_user_id is not None:
-                user_reaction_subquery = (
-                    db.query(
-                        Reaction.situation_id,
-                        Reaction.reaction_type.label("user_reaction"),
-                    )
-                    .filter(Reaction.user_id == current_user_id)
-                    .subquery()
-                )
-
-                query = (
-                    db.query(
-                        self.repo.model,
-                        User,
-                        func.coalesce(comments_subquery.c.comments_count, 0).label(
-                            "comments_count"
-                        ),
-                        func.coalesce(reactions_subquery.c.reactions_count, 0).label(
-                            "reactions_count"
-                        ),
-                        func.coalesce(reactions_subquery.c.upvotes_count, 0).label(
-                            "upvotes_count"
-                        ),
-                        func.coalesce(reactions_subquery.c.downvotes_count, 0).label(
-                            "downvotes_count"
-                        ),
-                        user_reaction_subquery.c.user_reaction,
-                    )
-                    .outerjoin(User, self.repo.model.user_id == User.id)
-                    .outerjoin(
-                        comments_subquery,
-                        self.repo.model.id == comments_subquery.c.situation_id,
-                    )
-                    .outerjoin(
-                        reactions_subquery,
-                        self.repo.model.id == reactions_subquery.c.situation_id,
-                    )
-                    .outerjoin(
-                        user_reaction_subquery,
-                        self.repo.model.id == user_reaction_subquery.c.situation_id,
-                    )
-                )
-            else:
-                query = (
-                    db.query(
-                        self.repo.model,
-                        User,
-                        func.coalesce(comments_subquery.c.comments_count, 0).label(
-                            "comments_count"
-                        ),
-                        func.coalesce(reactions_subquery.c.reactions_count, 0).label(
-                            "reactions_count"
-                        ),
-                        func.coalesce(reactions_subquery.c.upvotes_count, 0).label(
-                            "upvotes_count"
-                        ),
-                        func.coalesce(reactions_subquery.c.downvotes_count, 0).label(
-                            "downvotes_count"
-                        ),
-                    )
-                    .outerjoin(User, self.repo.model.user_id == User.id)
-                    .outerjoin(
-                        comments_subquery,
-                        self.repo.model.id == comments_subquery.c.situation_id,
-                    )
-                    .outerjoin(
-                        reactions_subquery,
-                        self.repo.model.id == reactions_subquery.c.situation_id,
-                    )
+    async def _with_user_reactions_async(
+        self, page_body: dict, current_user_id: int = None
+    ):
+        if current_user_id is None or not page_body["items"]:
+            return page_body
+        situation_ids = [item["id"] for item in page_body["items"]]
+        async with AsyncSessionLocal() as db:
+            rows = await db.execute(
+                self.reaction_repo.user_reactions_statement(
+                    current_user_id, situation_ids
                 )
-
-            query = query.filter(self.repo.model.topic_id.isnot(None))
-
-            if sort_by == "created_at":
-                if sort_order == "desc":
-                    query = query.order_by(self.repo.model.created_at.desc())
-                else:
-                    query = query.order_by(self.repo.model.created_at.asc())
-
-            total_count = (
-                db.query(self.repo.model)
-                .filter(self.repo.model.topic_id.isnot(None))
-                .count()
             )
-
-            offset = (page - 1) * limit
-            results = query.offset(offset).limit(limit).all()
-
-            result = []
-            for row in results:
-                if current_user_id is not None:
-                    (
-                        situation,
-                        user,
-                        comments_count,
-                        reactions_count,
-                        upvotes_count,
-                        downvotes_count,
-                        user_reaction,
-                    ) = row
-                else:
-                    (
-                        situation,
-                        user,
-                        comments_count,
-                        reactions_count,
-                        upvotes_count,
-                        downvotes_count,
-                    ) = row
-                    user_reaction = None
-
-                user_dict = None
-                if user:
-                    user_dict = {
-                        "id": user.id,
-                        "name": user.name,
-                        "picture": user.picture,
-                    }
-
-                result.append(
-                    {
-                        "id": situation.id,
-                        "topic_id": situation.topic_id,
-                        "user_id": situation.user_id,
-                        "user": user_dict,
-                        "image_url": getattr(situation, "image_url", None),
-                        "context": situation.context,
-                        "question": situation.question,
-                        "created_at": (
-                            situation.created_at.strftime("%Y-%m-%d %H:%M:%S")
-                            if situation.created_at
-                            else ""
-                        ),
-                        "stats": {
-                            "comments_count": int(comments_count),
-                            "reactions_count": int(reactions_count),
-                            "upvotes_count": int(upvotes_count),
-                            "downvotes_count": int(downvotes_count),
-                        },
-                        "user_reaction": user_reaction,
-                    }
-                )
-
-            return {
-                "items": result,
-                "pagination": {
-                    "page": page,
-                    "limit": limit,
-                    "total": total_count,
-                    "pages": (total_count + limit - 1) // limit,
-                    "has_next": page * limit < total_count,
-                    "has_prev": page > 1,
-                },
-            }
+            user_reactions = {situation_id: kind for situation_id, kind in rows}
+        return self._overlay_user_reactions(page_body, user_reactions)
+
+    def _overlay_user_reactions(self, page_body: dict, user_reactions: dict):
+        items = [
+            {**item, "user_reaction": user_reactions.get(item["id"])}
+            for item in page_body["items"]
+        ]
+        return {**page_body, "items": items}
+
+    def _seek_filter(self, created_at, last_id: int, descending: bool):
+        """Filter rows that sort after the (created_at, id) cursor position."""
+        model = self.repo.model
+        return seek_filter(model.created_at, model.id, created_at, last_id, descending)
+
+    def _feed_count_statement(self):
+        model = self.repo.model
+        return select(func.count(model.id)).where(model.topic_id.isnot(None))
+
+    def _cached_feed_total(self):
+        if self._feed_total_cache and self._feed_total_cache[1] > time.monotonic():
+            return self._feed_total_cache[0]
+        return None
+
+    def _store_feed_total(self, total: int) -> int:
+        expires_at = time.monotonic() + settings.feed_total_cache_ttl_seconds
+        self._feed_total_cache = (total, expires_at)
+        return total
+
+    def _feed_total(self, db):
+        """Count feed situations, cached for `feed_total_cache_ttl_seconds`."""
+        total = self._cached_feed_total()
+        if total is not None:
+            return total
+        return self._store_feed_total(
+            db.execute(self._feed_count_statement()).scalar() or 0
+        )
+
+    async def _feed_total_async(self, db):
+        total = self._cached_feed_total()
+        if total is not None:
+            return total
+        result = await db.execute(self._feed_count_statement())
+        return self._store_feed_total(result.scalar() or 0)
 
     def get_situation(self, situation_id: int):
         """Get situation by ID."""
-        with SessionLocal() as db:
+        cached = cache.get_or_set(
+            "situation", str(situation_id), lambda: self._load_situation(situation_id)
+        )
+        return SituationOut(**cached)
+
+    def _load_situation(self, situation_id: int) -> dict:
+        with session_scope(SessionLocal) as db:
             situation = self.repo.get(db, situation_id)
             if not situation:
                 raise NotFoundError("Situation", situation_id)
-            return SituationOut.from_orm(situation)
+            return SituationOut.from_orm(situation).model_dump(mode="json")
+
+    async def get_situation_async(self, situation_id: int):
+        """Async variant of `get_situation`."""
+        cached = await cache.get_or_set_async(
+            "situation",
+            str(situation_id),
+            lambda: self._load_situation_async(situation_id),
+        )
+        return SituationOut(**cached)
+
+    async def _load_situation_async(self, situation_id: int) -> dict:
+        async with AsyncSessionLocal() as db:
+            situation = await db.get(self.repo.model, situation_id)
+            if not situation:
+                raise NotFoundError("Situation", situation_id)
+            return SituationOut.from_orm(situation).model_dump(mode="json")
 
     def create_situation(self, situation_in: SituationBase, user_id):
         """Create new situation."""
         situation_data = situation_in.dict()
         if situation_data.get("topic_id"):
             topic_repo = TopicRepository()
-            with SessionLocal() as db:
+            with session_scope(SessionLocal) as db:
                 topic = topic_repo.get(db, situation_data["topic_id"])
                 if not topic:
                     situation_data["topic_id"] = None
 
         situation = SituationCreate(**situation_data, user_id=user_id)
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             situation = self.repo.create(db, situation)
+            cache.invalidate("feed")
             return SituationOut.from_orm(situation)
 
     def contribute_situation(self, situation_data: dict, user_id: int):
         """Create a contributed situation."""
         SITUATIONS_CREATED.inc()
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             situation = self.repo.create_contributed_situation(
                 db, situation_data, user_id
             )
+            cache.invalidate("feed")
             return SituationContributeOut.from_orm(situation)
 
     def update_situation(self, situation_id: int, situation_in: SituationUpdate):
         """Update situation."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             situation = self.repo.get(db, situation_id)
             if not situation:
                 raise NotFoundError("Situation", situation_id)
             updated_situation = self.repo.update(db, situation, situation_in)
+            self._invalidate_situation(situation_id)
             return SituationOut.from_orm(updated_situation)
 
     def delete_situation(self, situation_id: int):
         """Delete situation."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             situation = self.repo.get(db, situation_id)
             if not situation:
                 raise NotFoundError("Situation", situation_id)
             self.repo.delete(db, situation_id)
+            self._invalidate_situation(situation_id)
             return {"message": "Situation deleted successfully"}
 
+    def _invalidate_situation(self, situation_id: int):
+        cache.invalidate("situation", str(situation_id))
+        cache.invalidate("feed")
+
     def get_situations_by_user(self, user_id: int):
         """Get situations by user ID."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             situations = self.repo.get_by_user(db, user_id)
             return [SituationOut.from_orm(situation) for situation in situations]
 
@@ -355,160 +488,10 @@ class SituationService:
         self, user_id: int, current_user_id: int = None
     ):
         """Get situations by user ID with user info and stats for feed display."""
-        with SessionLocal() as db:
-            from sqlalchemy import case, func
-
-            comments_subquery = (
-                db.query(
-                    Comment.situation_id, func.count(Comment.id).label("comments_count")
-                )
-                .group_by(Comment.situation_id)
-                .subquery()
-            )
-
-            reactions_subquery = (
-                db.query(
-                    Reaction.situation_id,
-                    func.count(Reaction.id).label("reactions_count"),
-                    func.sum(
-                        case((Reaction.reaction_type == "upvote", 1), else_=0)
-                    ).label("upvotes_count"),
-                    func.sum(
-                        case((Reaction.reaction_type == "downvote", 1), else_=0)
-                    ).label("downvotes_count"),
-                )
-                .group_by(Reaction.situation_id)
-                .subquery()
+        with session_scope(SessionLocal) as db:
+            stmt = (
+                self._feed_statement(current_user_id)
+                .where(self.repo.model.user_id == user_id)
+                .order_by(self.repo.model.created_at.desc())
             )
-
-            if current_user_id is not None:
-                user_reaction_subquery = (
-                    db.query(
-                        Reaction.situation_id,
-                        Reaction.reaction_type.label("user_reaction"),
-                    )
-                    .filter(Reaction.user_id == current_user_id)
-                    .subquery()
-                )
-
-                query = (
-                    db.query(
-                        self.repo.model,
-                        User,
-                        func.coalesce(comments_subquery.c.comments_count, 0).label(
-                            "comments_count"
-                        ),
-                        func.coalesce(reactions_subquery.c.reactions_count, 0).label(
-                            "reactions_count"
-                        ),
-                        func.coalesce(reactions_subquery.c.upvotes_count, 0).label(
-                            "upvotes_count"
-                        ),
-                        func.coalesce(reactions_subquery.c.downvotes_count, 0).label(
-                            "downvotes_count"
-                        ),
-                        user_reaction_subquery.c.user_reaction,
-                    )
-                    .outerjoin(User, self.repo.model.user_id == User.id)
-                    .outerjoin(
-                        comments_subquery,
-                        self.repo.model.id == comments_subquery.c.situation_id,
-                    )
-                    .outerjoin(
-                        reactions_subquery,
-                        self.repo.model.id == reactions_subquery.c.situation_id,
-                    )
-                    .outerjoin(
-                        user_reaction_subquery,
-                        self.repo.model.id == user_reaction_subquery.c.situation_id,
-                    )
-                )
-            else:
-                query = (
-                    db.query(
-                        self.repo.model,
-                        User,
-                        func.coalesce(comments_subquery.c.comments_count, 0).label(
-                            "comments_count"
-                        ),
-                        func.coalesce(reactions_subquery.c.reactions_count, 0).label(
-                            "reactions_count"
-                        ),
-                        func.coalesce(reactions_subquery.c.upvotes_count, 0).label(
-                            "upvotes_count"
-                        ),
-                        func.coalesce(reactions_subquery.c.downvotes_count, 0).label(
-                            "downvotes_count"
-                        ),
-                    )
-                    .outerjoin(User, self.repo.model.user_id == User.id)
-                    .outerjoin(
-                        comments_subquery,
-                        self.repo.model.id == comments_subquery.c.situation_id,
-                    )
-                    .outerjoin(
-                        reactions_subquery,
-                        self.repo.model.id == reactions_subquery.c.situation_id,
-                    )
-                )
-
-            query = query.filter(self.repo.model.user_id == user_id)
-            query = query.order_by(self.repo.model.created_at.desc())
-
-            results = query.all()
-
-            result = []
-            for row in results:
-                if current_user_id is not None:
-                    (
-                        situation,
-                        user,
-                        comments_count,
-                        reactions_count,
-                        upvotes_count,
-                        downvotes_count,
-                        user_reaction,
-                    ) = row
-                else:
-                    (
-                        situation,
-                        user,
-                        comments_count,
-                        reactions_count,
-                        upvotes_count,
-                        downvotes_count,
-                    ) = row
-                    user_reaction = None
-
-                user_dict = None
-                if user:
-                    user_dict = {
-                        "id": user.id,
-                        "name": user.name,
-                        "picture": user.picture,
-                    }
-
-                result.append(
-                    {
-                        "id": situation.id,
-                        "topic_id": situation.topic_id,
-                        "user_id": situation.user_id,
-                        "user": user_dict,
-                        "image_url": getattr(situation, "image_url", None),
-                        "context": situation.context,
-                        "question": situation.question,
-                        "created_at": (
-                            situation.created_at.strftime("%Y-%m-%d %H:%M:%S")
-                            if situation.created_at
-                            else ""
-                        ),
-                        "stats": {
-                            "comments_count": int(comments_count),
-                            "reactions_count": int(reactions_count),
-                            "upvotes_count": int(upvotes_count),
-                            "downvotes_count": int(downvotes_count),
-                        },
-                        "user_reaction": user_reaction,
-                    }
-                )
-            return result
+            return self._feed_items(db.execute(stmt).all(), current_user_id)
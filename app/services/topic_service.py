@@ -1,4 +1,5 @@
-from app.core.database import SessionLocal
+from app.core.cache import cache
+from app.core.database import SessionLocal, session_scope
 from app.core.exceptions import NotFoundError
 from app.repositories.topic_repository import TopicRepository
 from app.schemas.topics import TopicCreate, TopicOut, TopicUpdate
@@ -10,13 +11,19 @@ class TopicService:
 
     def list_topics(self):
         """List all topics."""
-        with SessionLocal() as db:
-            topics = self.repo.get_multi(db)
-            return [TopicOut.from_orm(topic) for topic in topics]
+        cached = cache.get_or_set("topics", "all", self._load_topics)
+        return [TopicOut(**topic) for topic in cached]
+
+    def _load_topics(self) -> list:
+        with session_scope(SessionLocal) as db:
+            return [
+                TopicOut.from_orm(topic).model_dump()
+                for topic in self.repo.get_multi(db)
+            ]
 
     def get_topic(self, topic_id: int):
         """Get topic by ID."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             topic = self.repo.get(db, topic_id)
             if not topic:
                 raise NotFoundError("Topic", topic_id)
@@ -24,24 +31,27 @@ class TopicService:
 
     def create_topic(self, topic_in: TopicCreate):
         """Create new topic."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             topic = self.repo.create(db, topic_in)
+            cache.invalidate("topics", "all")
             return TopicOut.from_orm(topic)
 
     def update_topic(self, topic_id: int, topic_in: TopicUpdate):
         """Update topic."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             topic = self.repo.get(db, topic_id)
             if not topic:
                 raise NotFoundError("Topic", topic_id)
             updated_topic = self.repo.update(db, topic, topic_in)
+            cache.invalidate("topics", "all")
             return TopicOut.from_orm(updated_topic)
 
     def delete_topic(self, topic_id: int):
         """Delete topic."""
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             topic = self.repo.get(db, topic_id)
             if not topic:
                 raise NotFoundError("Topic", topic_id)
             self.repo.delete(db, topic_id)
+            cache.invalidate("topics", "all")
             return {"message": "Topic deleted successfully"}
@@ -1,5 +1,6 @@
-from app.core.database import SessionLocal
+from app.core.database import AsyncSessionLocal, SessionLocal, session_scope
 from app.core.exceptions import NotFoundError
+from app.core.principal_cache import principal_cache
 from app.repositories.user_repository import UserRepository
 from app.schemas.users import UserProfileOut, UserShortOut
 
@@ -12,7 +13,7 @@ class UserService:
         """
         List users with optional search and pagination.
         """
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             users = self.user_repo.list_users(db, search=search, page=page, size=size)
             return [
                 UserShortOut(id=user.id, name=user.name, picture=user.picture)
@@ -26,7 +27,7 @@ class UserService:
         if not query or len(query) < 2:
             return []
 
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             users = self.user_repo.search_users_by_name(db, query=query, limit=limit)
             return [
                 UserShortOut(id=user.id, name=user.name, picture=user.picture)
@@ -37,7 +38,7 @@ class UserService:
         """
         Get user profile by ID.
         """
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             user = self.user_repo.get_user_by_id(db, user_id=user_id)
             if not user:
                 raise NotFoundError("User", user_id)
@@ -54,32 +55,42 @@ class UserService:
         """
         Get user by email.
         """
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             return self.user_repo.get_user_by_email(db, email=email)
 
+    async def get_user_by_email_async(self, email: str):
+        """
+        Async variant of `get_user_by_email`.
+        """
+        async with AsyncSessionLocal() as db:
+            return await db.scalar(self.user_repo.by_email_statement(email))
+
     def create_user(self, user_data: dict):
         """
         Create new user.
         """
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             return self.user_repo.create_user(db, user_data=user_data)
 
     def update_user(self, user_id: int, update_data: dict):
         """
         Update user information.
         """
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             user = self.user_repo.get_user_by_id(db, user_id=user_id)
             if not user:
                 raise NotFoundError("User", user_id)
 
-            return self.user_repo.update_user(db, user=user, update_data=update_data)
+            email = user.email
+            updated = self.user_repo.update_user(db, user=user, update_data=update_data)
+            principal_cache.invalidate(email)
+            return updated
 
     def update_user_refresh_token(self, user_id: int, refresh_token: str):
         """
         Update user refresh token.
         """
-        with SessionLocal() as db:
+        with session_scope(SessionLocal) as db:
             return self.user_repo.update_user_refresh_token(
                 db, user_id=user_id, refresh_token=refresh_token
             )
@@ -0,0 +1,42 @@
+"""comment sentiment score float
+
+Revision ID: 3f6d2a9c81be
+Revises: 96f270b5c92b
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f6d2a9c81be"
+down_revision: Union[str, None] = "96f270b5c92b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Sentiment scores are fractions in [-1, 1]; an integer column kept only 0
+    op.alter_column(
+        "comments",
+        "sentiment_score",
+        existing_type=sa.Integer(),
+        type_=sa.Float(),
+        existing_nullable=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "comments",
+        "sentiment_score",
+        existing_type=sa.Float(),
+        type_=sa.Integer(),
+        existing_nullable=True,
+        postgresql_using="round(sentiment_score)::integer",
+    )
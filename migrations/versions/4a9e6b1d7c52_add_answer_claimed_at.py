@@ -0,0 +1,33 @@
+"""add answer claimed_at
+
+Revision ID: 4a9e6b1d7c52
+Revises: 7c2d9e4f1a63
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4a9e6b1d7c52"
+down_revision: Union[str, None] = "7c2d9e4f1a63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Pending answers are claimed by one process at a time; rows left pending
+    # before this migration start unclaimed and are recovered once
+    op.add_column(
+        "answers",
+        sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("answers", "claimed_at")
@@ -0,0 +1,77 @@
+"""add full text search columns
+
+Revision ID: 5b7e2c9d4f18
+Revises: 8d1c4f7a2e35
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7e2c9d4f18"
+down_revision: Union[str, None] = "8d1c4f7a2e35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        # SQLite searches through app.services.search_service's in-memory index
+        return
+    # "simple" keeps every word (content is mostly Vietnamese, which has no
+    # stemmer); unaccent makes "cong viec" match "công việc"
+    op.execute(
+        """
+        DO $$ BEGIN
+            CREATE TEXT SEARCH CONFIGURATION eq_unaccent (COPY = simple);
+        EXCEPTION WHEN unique_violation THEN NULL;
+        END $$
+        """
+    )
+    op.execute(
+        "ALTER TEXT SEARCH CONFIGURATION eq_unaccent "
+        "ALTER MAPPING FOR hword, hword_part, word WITH unaccent, simple"
+    )
+    # Generated columns, so every write path (ORM, Core, raw SQL) keeps them
+    # current without a trigger. The two-argument to_tsvector is IMMUTABLE.
+    op.execute(
+        """
+        ALTER TABLE situations ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('eq_unaccent', coalesce(question, '')), 'A')
+            || setweight(to_tsvector('eq_unaccent', coalesce(context, '')), 'B')
+        ) STORED
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE comments ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('eq_unaccent', coalesce(content, '')))
+        STORED
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_situations_search "
+            "ON situations USING gin (search_vector)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_comments_search "
+            "ON comments USING gin (search_vector)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_comments_search")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_situations_search")
+    op.execute("ALTER TABLE comments DROP COLUMN IF EXISTS search_vector")
+    op.execute("ALTER TABLE situations DROP COLUMN IF EXISTS search_vector")
+    op.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS eq_unaccent")
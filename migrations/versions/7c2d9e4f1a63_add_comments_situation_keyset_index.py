@@ -0,0 +1,36 @@
+"""add comments situation keyset index
+
+Revision ID: 7c2d9e4f1a63
+Revises: e41a7c3b9d20
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2d9e4f1a63"
+down_revision: Union[str, None] = "e41a7c3b9d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Matches the comment pages' WHERE situation_id = ? ORDER BY created_at, id
+    # (scanned backwards for the newest page)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_comments_situation_created_at_id",
+            "comments",
+            ["situation_id", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_comments_situation_created_at_id", table_name="comments")
@@ -0,0 +1,50 @@
+"""add user name trigram index
+
+Revision ID: 8d1c4f7a2e35
+Revises: 3f6d2a9c81be
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d1c4f7a2e35"
+down_revision: Union[str, None] = "3f6d2a9c81be"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        # SQLite gets Python versions of the functions from app.core.text_search
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    # unaccent() is only STABLE; index expressions need an IMMUTABLE function
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+        """
+    )
+    # GiST rather than GIN: besides LIKE '%q%' it can return rows ordered by
+    # trigram distance, so ranked searches for common names stop at the limit
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_name_trgm "
+            "ON users USING gist (immutable_unaccent(lower(name)) gist_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_users_name_trgm")
+    op.execute("DROP FUNCTION IF EXISTS immutable_unaccent(text)")
@@ -0,0 +1,42 @@
+"""add answer analysis status
+
+Revision ID: 96f270b5c92b
+Revises: ca2791c74ef0
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "96f270b5c92b"
+down_revision: Union[str, None] = "ca2791c74ef0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "answers",
+        sa.Column("status", sa.String(), nullable=False, server_default="completed"),
+    )
+    op.add_column("answers", sa.Column("error", sa.String(), nullable=True))
+    # Startup recovery scans for answers that are still pending
+    op.create_index(
+        "idx_answers_pending",
+        "answers",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_answers_pending", table_name="answers")
+    op.drop_column("answers", "error")
+    op.drop_column("answers", "status")
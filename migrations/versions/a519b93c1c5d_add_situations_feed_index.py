@@ -0,0 +1,35 @@
+"""add situations feed keyset index
+
+Revision ID: a519b93c1c5d
+Revises: bb9ea76cc252
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a519b93c1c5d"
+down_revision: Union[str, None] = "bb9ea76cc252"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Matches the feed's ORDER BY created_at, id (scanned backwards for DESC)
+    op.create_index(
+        "idx_situations_feed_created_at_id",
+        "situations",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("topic_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_situations_feed_created_at_id", table_name="situations")
@@ -0,0 +1,58 @@
+"""add denormalized situation stats counters
+
+Revision ID: ca2791c74ef0
+Revises: a519b93c1c5d
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ca2791c74ef0"
+down_revision: Union[str, None] = "a519b93c1c5d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTERS = ("comments_count", "reactions_count", "upvotes_count", "downvotes_count")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name in COUNTERS:
+        op.add_column(
+            "situations",
+            sa.Column(name, sa.Integer(), nullable=False, server_default="0"),
+        )
+    # Initial backfill; afterwards run `python -m app.reconcile_stats` to repair drift
+    op.execute(
+        """
+        UPDATE situations SET
+            comments_count = (
+                SELECT COUNT(*) FROM comments WHERE comments.situation_id = situations.id
+            ),
+            reactions_count = (
+                SELECT COUNT(*) FROM reactions
+                WHERE reactions.situation_id = situations.id
+            ),
+            upvotes_count = (
+                SELECT COUNT(*) FROM reactions
+                WHERE reactions.situation_id = situations.id
+                AND reactions.reaction_type = 'upvote'
+            ),
+            downvotes_count = (
+                SELECT COUNT(*) FROM reactions
+                WHERE reactions.situation_id = situations.id
+                AND reactions.reaction_type = 'downvote'
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in COUNTERS:
+        op.drop_column("situations", name)
@@ -0,0 +1,39 @@
+"""add situation import key
+
+Revision ID: e41a7c3b9d20
+Revises: 5b7e2c9d4f18
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e41a7c3b9d20"
+down_revision: Union[str, None] = "5b7e2c9d4f18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nullable with no default, so adding it does not rewrite the table
+    op.add_column("situations", sa.Column("import_key", sa.String(), nullable=True))
+    # Bulk imports insert with ON CONFLICT (import_key) DO NOTHING
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_situations_import_key",
+            "situations",
+            ["import_key"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_situations_import_key", table_name="situations")
+    op.drop_column("situations", "import_key")
@@ -0,0 +1,78 @@
+"""Compare the sync and async database paths under concurrent load.
+
+The sync path runs service calls in AnyIO's worker threadpool, the way FastAPI
+serves `def` endpoints; the async path awaits the `_async` variants on the
+event loop. Runs against the configured DATABASE_URL with the cache disabled.
+
+    python -m scripts.bench_async_db --requests 2000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import anyio.to_thread
+
+from app.core.config import settings
+from app.core.database import async_engine, engine
+from app.services.situation_service import SituationService
+
+
+def _percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _run(label: str, call, requests: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{label:<6} p50={statistics.median(latencies) * 1000:8.2f}ms "
+        f"p99={_percentile(latencies, 99) * 1000:8.2f}ms "
+        f"throughput={requests / elapsed:8.1f} req/s"
+    )
+
+
+async def bench(requests: int, concurrency: int, limit: int):
+    settings.cache_enabled = False
+    svc = SituationService()
+
+    def sync_call():
+        return anyio.to_thread.run_sync(
+            lambda: svc.get_situations_feed_paginated(page=1, limit=limit)
+        )
+
+    def async_call():
+        return svc.get_situations_feed_paginated_async(page=1, limit=limit)
+
+    # Warm both pools so connection setup is not measured
+    await sync_call()
+    await async_call()
+
+    await _run("sync", sync_call, requests, concurrency)
+    await _run("async", async_call, requests, concurrency)
+
+    await async_engine.dispose()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(bench(args.requests, args.concurrency, args.limit))
@@ -0,0 +1,113 @@
+"""Compare the generic and orjson response paths for large list payloads.
+
+"generic" is what FastAPI does with a returned `SuccessResponse`:
+`jsonable_encoder` followed by `JSONResponse`. "orjson" is
+`success_response`. Payloads are synthetic feed pages (plain dicts) and comment
+lists (`CommentOut` models); no database is needed.
+
+    python -m scripts.bench_json_response --items 100 --iterations 2000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.responses import success_response
+from app.schemas.comments import CommentOut
+from app.schemas.responses import SuccessResponse
+from app.services.situation_service import _feed_timestamp
+
+MESSAGE = "Items retrieved successfully"
+
+
+def _feed_page(items: int, timestamp):
+    created = datetime(2026, 1, 1, 12, 0, 0)
+    return {
+        "items": [
+            {
+                "id": i,
+                "topic_id": 1,
+                "user_id": i % 50,
+                "user": {"id": i % 50, "name": f"User {i}", "picture": None},
+                "image_url": None,
+                "context": "Một tình huống ở nơi làm việc " * 8,
+                "question": "Bạn sẽ phản ứng thế nào?",
+                "created_at": timestamp(created + timedelta(minutes=i)),
+                "stats": {
+                    "comments_count": i,
+                    "reactions_count": 2 * i,
+                    "upvotes_count": i,
+                    "downvotes_count": 0,
+                },
+                "user_reaction": None,
+            }
+            for i in range(items)
+        ],
+        "pagination": {"page": 1, "limit": items, "total": 10 * items},
+    }
+
+
+def _comments(items: int):
+    return [
+        CommentOut(
+            id=i,
+            user_id=i % 50,
+            situation_id=1,
+            content="Mình nghĩ nên bình tĩnh lắng nghe trước đã. " * 4,
+            sentiment_analysis={"label": "positive", "score": 0.4},
+            created_at=datetime(2026, 1, 1, 12, 0, 0) + timedelta(seconds=i),
+            user={"id": i % 50, "name": f"User {i}", "picture": None},
+        )
+        for i in range(items)
+    ]
+
+
+def _generic(data) -> bytes:
+    return JSONResponse(
+        jsonable_encoder(SuccessResponse(message=MESSAGE, data=data))
+    ).body
+
+
+def _orjson(data) -> bytes:
+    return success_response(MESSAGE, data).body
+
+
+def _measure(label: str, render, build, iterations: int):
+    size = 0
+    wall, cpu = time.perf_counter(), time.process_time()
+    for _ in range(iterations):
+        size += len(render(build()))
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    print(
+        f"{label:<22} {size / wall / 1e6:8.1f} MB/s "
+        f"cpu/response={cpu / iterations * 1e6:8.1f}us"
+    )
+
+
+def _strftime(value):
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def bench(items: int, iterations: int):
+    feed_before = _feed_page(items, _strftime)
+    comments = _comments(items)
+
+    # Building the feed page is timed too, for the strftime change
+    _measure("feed generic", _generic, lambda: _feed_page(items, _strftime), iterations)
+    _measure(
+        "feed orjson", _orjson, lambda: _feed_page(items, _feed_timestamp), iterations
+    )
+    _measure("comments generic", _generic, lambda: comments, iterations)
+    _measure("comments orjson", _orjson, lambda: comments, iterations)
+    assert _feed_page(items, _feed_timestamp) == feed_before
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+    bench(args.items, args.iterations)
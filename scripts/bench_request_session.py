@@ -0,0 +1,96 @@
+"""Count connection-pool checkouts per request, with and without the request session.
+
+Drives authenticated requests through the app (auth lookup plus service calls)
+and counts checkouts on the sync engine's pool. The "per-call" run overrides
+the request-session dependency, so every service call opens its own session
+as before. Runs against the configured DATABASE_URL with the cache disabled;
+the situations it creates are deleted again.
+
+    python -m scripts.bench_request_session --email someone@example.com
+"""
+
+import argparse
+import logging
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+
+from app.api.v1.deps import use_request_session
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.core.security import create_access_token
+from app.main import app
+from app.models import User
+
+_checkouts = 0
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    global _checkouts
+    _checkouts += 1
+
+
+def _workload(client: TestClient, headers: dict):
+    """One round of typical authenticated calls; returns the request count."""
+    client.get("/api/v1/situations/user/me", headers=headers)
+    created = client.post(
+        "/api/v1/situations/",
+        json={"context": "Benchmark context", "question": "Benchmark question?"},
+        headers=headers,
+    )
+    situation_id = created.json()["data"]["id"]
+    client.put(
+        f"/api/v1/situations/{situation_id}",
+        json={"question": "Updated benchmark question?"},
+        headers=headers,
+    )
+    client.delete(f"/api/v1/situations/{situation_id}", headers=headers)
+    return 4
+
+
+def _run(label: str, client: TestClient, headers: dict, rounds: int):
+    global _checkouts
+    _workload(client, headers)  # warm up
+    _checkouts = 0
+    requests = 0
+    started = time.perf_counter()
+    for _ in range(rounds):
+        requests += _workload(client, headers)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:<9} checkouts/request={_checkouts / requests:5.2f} "
+        f"mean latency={elapsed / requests * 1000:7.2f}ms"
+    )
+
+
+def bench(email: str, rounds: int):
+    settings.cache_enabled = False
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    if email is None:
+        with SessionLocal() as db:
+            email = db.execute(select(User.email).limit(1)).scalar()
+        if email is None:
+            raise SystemExit("No users in the database; pass --email")
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+
+    event.listen(engine, "checkout", _on_checkout)
+    # Without a context manager the client skips startup (workers, flusher)
+    client = TestClient(app)
+    try:
+        app.dependency_overrides[use_request_session] = lambda: None
+        _run("per-call", client, headers, rounds)
+        del app.dependency_overrides[use_request_session]
+        _run("request", client, headers, rounds)
+    finally:
+        app.dependency_overrides.pop(use_request_session, None)
+        event.remove(engine, "checkout", _on_checkout)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--email", help="existing user to authenticate as")
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+    bench(args.email, args.rounds)
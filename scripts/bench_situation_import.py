@@ -0,0 +1,86 @@
+"""Compare one-at-a-time situation creation with the bulk import pipeline.
+
+"per-row" mirrors POST /situations/: an ORM add, commit and refresh per
+situation. "bulk" is `SituationImportService.import_stream` over the same
+rows as JSONL. Runs against a throwaway SQLite file unless --url is given;
+rows carry a unique marker in `context` and are deleted afterwards.
+
+    python -m scripts.bench_situation_import --rows 20000
+"""
+
+import argparse
+import io
+import json
+import os
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import sessionmaker
+
+import app.services.situation_import_service as import_module
+from app.core.database import Base
+from app.models import Situation
+from app.services.situation_import_service import SituationImportService
+
+
+def _rows(count: int, marker: str):
+    return [
+        {"context": f"{marker} bối cảnh {i}", "question": f"Bạn sẽ làm gì? {i}"}
+        for i in range(count)
+    ]
+
+
+def _per_row(factory, rows):
+    with factory() as db:
+        for row in rows:
+            situation = Situation(**row)
+            db.add(situation)
+            db.commit()
+            db.refresh(situation)
+
+
+def _bulk(factory, rows, batch_size):
+    import_module.SessionLocal = factory
+    stream = io.StringIO("\n".join(json.dumps(row) for row in rows))
+    return SituationImportService().import_stream(stream, "jsonl", batch_size)
+
+
+def bench(rows: int, batch_size: int, url: str = None):
+    path = None
+    if url is None:
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        url = f"sqlite:///{path}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    marker = f"bench-{uuid.uuid4().hex[:8]}"
+    try:
+        for label, run in (
+            ("per-row", lambda: _per_row(factory, _rows(rows, f"{marker}-a"))),
+            ("bulk", lambda: _bulk(factory, _rows(rows, f"{marker}-b"), batch_size)),
+        ):
+            started = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - started
+            print(
+                f"{label:<8} {rows} rows in {elapsed:7.2f}s ({rows / elapsed:8.0f} rows/s)"
+            )
+    finally:
+        with factory() as db:
+            db.execute(delete(Situation).where(Situation.context.startswith(marker)))
+            db.commit()
+        engine.dispose()
+        if path:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--url", help="database URL; a temporary SQLite file if unset")
+    args = parser.parse_args()
+    bench(args.rows, args.batch_size, args.url)
@@ -0,0 +1,95 @@
+"""Time user search against the configured DATABASE_URL.
+
+With --seed N, first inserts N synthetic users with Vietnamese-style names
+(emails end in @bench.invalid; --cleanup deletes them afterwards). On
+PostgreSQL the plan of the first query is printed, so you can check that it
+uses idx_users_name_trgm.
+
+    python -m scripts.bench_user_search --seed 1000000 --cleanup
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from sqlalchemy import delete, insert, select, text
+
+from app.core.database import SessionLocal, engine
+from app.core.text_search import text_match
+from app.models import User
+from app.repositories.user_repository import UserRepository
+
+BENCH_DOMAIN = "@bench.invalid"
+FAMILY = ["Nguyễn", "Trần", "Lê", "Phạm", "Hoàng", "Huỳnh", "Phan", "Vũ", "Đặng"]
+MIDDLE = ["Văn", "Thị", "Đức", "Minh", "Ngọc", "Thanh", "Quốc", "Gia", "Hữu"]
+GIVEN = ["An", "Anh", "Bình", "Châu", "Dũng", "Giang", "Hà", "Hùng", "Khoa", "Linh"]
+QUERIES = ["nguyen", "Đức Anh", "thi linh", "hung", "quoc khoa", "pham gia"]
+
+
+def _seed(count: int, batch: int = 10000) -> None:
+    rng = random.Random(0)
+    with SessionLocal() as db:
+        for start in range(0, count, batch):
+            rows = [
+                {
+                    "name": f"{rng.choice(FAMILY)} {rng.choice(MIDDLE)} "
+                    f"{rng.choice(GIVEN)} {i}",
+                    "email": f"user{i}{BENCH_DOMAIN}",
+                    "google_id": f"bench-{i}",
+                }
+                for i in range(start, min(start + batch, count))
+            ]
+            db.execute(insert(User), rows)
+            db.commit()
+    if engine.dialect.name == "postgresql":
+        with engine.connect() as conn:
+            conn.execute(text("ANALYZE users"))
+            conn.commit()
+
+
+def _explain(query: str) -> None:
+    matches, distance = text_match(User.name, query)
+    stmt = select(User.id).where(matches).order_by(distance, User.id).limit(10)
+    with engine.connect() as conn:
+        compiled = stmt.compile(conn, compile_kwargs={"literal_binds": True})
+        plan = conn.execute(text(f"EXPLAIN ANALYZE {compiled}"))
+        print("\n".join(row[0] for row in plan))
+
+
+def bench(seed: int, cleanup: bool, iterations: int) -> None:
+    if seed:
+        started = time.perf_counter()
+        _seed(seed)
+        print(f"Seeded {seed} users in {time.perf_counter() - started:.1f}s")
+    try:
+        if engine.dialect.name == "postgresql":
+            _explain(QUERIES[0])
+        repo = UserRepository()
+        with SessionLocal() as db:
+            for query in QUERIES:
+                latencies = []
+                for _ in range(iterations):
+                    started = time.perf_counter()
+                    found = repo.search_users_by_name(db, query, limit=10)
+                    latencies.append(time.perf_counter() - started)
+                print(
+                    f"{query!r:<14} p50={statistics.median(latencies) * 1000:7.2f}ms "
+                    f"max={max(latencies) * 1000:7.2f}ms "
+                    f"top={found[0].name if found else '-'}"
+                )
+    finally:
+        if cleanup:
+            with SessionLocal() as db:
+                db.execute(delete(User).where(User.email.endswith(BENCH_DOMAIN)))
+                db.commit()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cleanup", action="store_true")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    bench(args.seed, args.cleanup, args.iterations)
@@ -5,9 +5,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.api.v1.deps import get_db
+from app.core.config import settings
 from app.core.database import Base
 from app.main import app
 from app.seed_data import seed
@@ -52,6 +55,45 @@ def setup_database():
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def disable_cache(monkeypatch):
+    """Keep the read-through cache from leaking data between tests."""
+    monkeypatch.setattr(settings, "cache_enabled", False)
+
+
+@pytest.fixture
+def async_session_factory(tmp_path, monkeypatch):
+    """Point the services' sync and async session factories at one SQLite file.
+
+    Yields the sync factory for seeding; async service methods read the same
+    rows through aiosqlite.
+    """
+    import app.services.comment_service as comment_service_module
+    import app.services.reaction_service as reaction_service_module
+    import app.services.situation_service as situation_service_module
+    import app.services.user_service as user_service_module
+
+    db_path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{db_path}", poolclass=NullPool)
+    Base.metadata.create_all(bind=sync_engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
+    async_factory = async_sessionmaker(
+        bind=create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    for module in (
+        comment_service_module,
+        reaction_service_module,
+        situation_service_module,
+        user_service_module,
+    ):
+        monkeypatch.setattr(module, "SessionLocal", factory)
+        monkeypatch.setattr(module, "AsyncSessionLocal", async_factory)
+    yield factory
+    sync_engine.dispose()
+
+
 @pytest.fixture
 def db_session():
     """Create database session for testing"""
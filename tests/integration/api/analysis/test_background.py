@@ -0,0 +1,46 @@
+import time
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def test_background_analysis_poll_and_stream(sample_situation, auth_headers):
+    answer_data = {"answer_text": "I would listen", "situation_id": sample_situation.id}
+
+    with (
+        patch("app.services.openai_service.OpenAIService.analyze_eq") as mock_analyze,
+        TestClient(app) as client,
+    ):
+        mock_analyze.return_value = ({"empathy": 9}, {"empathy": "Great"})
+
+        response = client.post(
+            "/api/v1/analysis/analyze?background=true",
+            json=answer_data,
+            headers=auth_headers,
+        )
+        assert response.status_code == 202
+        answer = response.json()["data"]
+        assert answer["status"] == "pending"
+
+        for _ in range(50):
+            polled = client.get(
+                f"/api/v1/analysis/answers/{answer['id']}", headers=auth_headers
+            ).json()["data"]
+            if polled["status"] != "pending":
+                break
+            time.sleep(0.02)
+        assert polled["status"] == "completed"
+        assert polled["scores"] == {"empathy": 9}
+
+        stream = client.get(
+            f"/api/v1/analysis/answers/{answer['id']}/stream", headers=auth_headers
+        )
+        assert stream.headers["content-type"].startswith("text/event-stream")
+        assert stream.text.startswith("event: completed\n")
+
+
+def test_get_answer_not_found(client, auth_headers):
+    response = client.get("/api/v1/analysis/answers/999999", headers=auth_headers)
+    assert response.status_code == 404
@@ -4,6 +4,7 @@ from unittest.mock import patch
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.config import settings
 from app.models import Answer
 
 
@@ -203,3 +204,29 @@ def test_get_answers_by_situation_unauthorized(client, sample_situation):
     """Test getting answers without authentication."""
     response = client.get(f"/api/v1/analysis/situations/{sample_situation.id}/answers")
     assert response.status_code == 401  # Unauthorized
+
+
+def test_analyze_sentiment_batch(client, auth_headers):
+    response = client.post(
+        "/api/v1/analysis/analyze-sentiment/batch",
+        json={"contents": ["Tôi rất vui", ""]},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    items = response.json()["data"]
+    assert items[0]["success"] is True
+    assert items[0]["result"]["sentiment"] == "positive"
+    assert items[1]["success"] is False
+    assert items[1]["error"] == "Content cannot be empty"
+
+
+def test_analyze_sentiment_batch_too_large(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "sentiment_batch_max_size", 1)
+    response = client.post(
+        "/api/v1/analysis/analyze-sentiment/batch",
+        json={"contents": ["a", "b"]},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,37 @@
+from unittest.mock import patch
+
+
+def test_analyze_batch_endpoint(client, sample_situation, auth_headers):
+    payload = {
+        "answers": [
+            {"situation_id": sample_situation.id, "answer_text": "first"},
+            {"situation_id": 999999, "answer_text": "orphan"},
+        ]
+    }
+
+    with patch(
+        "app.services.openai_service.OpenAIService.analyze_eq_batch"
+    ) as mock_batch:
+        mock_batch.return_value = [({"empathy": 6}, {"empathy": "ok"})]
+
+        response = client.post(
+            "/api/v1/analysis/analyze-batch", json=payload, headers=auth_headers
+        )
+
+    assert response.status_code == 200
+    items = response.json()["data"]
+    assert items[0]["success"] is True
+    assert items[0]["answer"]["scores"] == {"empathy": 6}
+    assert items[1] == {
+        "index": 1,
+        "success": False,
+        "answer": None,
+        "error": "Situation with id 999999 not found",
+    }
+
+
+def test_analyze_batch_rejects_empty(client, auth_headers):
+    response = client.post(
+        "/api/v1/analysis/analyze-batch", json={"answers": []}, headers=auth_headers
+    )
+    assert response.status_code == 422
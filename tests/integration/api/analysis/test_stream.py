@@ -0,0 +1,61 @@
+import json
+from unittest.mock import patch
+
+
+def _events(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        event, data = block.split("\n")
+        events.append((event[len("event: ") :], json.loads(data[len("data: ") :])))
+    return events
+
+
+def test_analyze_stream_emits_pillars_then_saved_answer(
+    client, sample_situation, auth_headers
+):
+    async def fake_stream(self, situation, question, answer_text):
+        yield "pillar", {"pillar": "empathy", "score": 9, "reasoning": "Great"}
+        yield "result", ({"empathy": 9}, {"empathy": "Great"})
+
+    answer_data = {"answer_text": "I would listen", "situation_id": sample_situation.id}
+    with patch(
+        "app.services.openai_service.OpenAIService.analyze_eq_stream", fake_stream
+    ):
+        response = client.post(
+            "/api/v1/analysis/analyze/stream", json=answer_data, headers=auth_headers
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    (pillar, pillar_data), (done, answer) = _events(response.text)
+    assert pillar == "pillar" and pillar_data["pillar"] == "empathy"
+    assert done == "completed"
+    assert answer["scores"] == {"empathy": 9}
+    assert answer["id"] is not None
+
+
+def test_analyze_stream_reports_model_failure(client, sample_situation, auth_headers):
+    async def broken_stream(self, situation, question, answer_text):
+        raise ValueError("Incomplete or unparseable model reply")
+        yield  # pragma: no cover
+
+    answer_data = {"answer_text": "I would listen", "situation_id": sample_situation.id}
+    with patch(
+        "app.services.openai_service.OpenAIService.analyze_eq_stream", broken_stream
+    ):
+        response = client.post(
+            "/api/v1/analysis/analyze/stream", json=answer_data, headers=auth_headers
+        )
+
+    assert _events(response.text) == [
+        ("failed", {"error": "Incomplete or unparseable model reply"})
+    ]
+
+
+def test_analyze_stream_missing_situation(client, auth_headers):
+    response = client.post(
+        "/api/v1/analysis/analyze/stream",
+        json={"answer_text": "x", "situation_id": 999999},
+        headers=auth_headers,
+    )
+    assert response.status_code == 404
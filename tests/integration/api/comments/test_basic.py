@@ -3,6 +3,7 @@ from datetime import datetime
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.config import settings
 from app.models import Comment
 
 
@@ -26,8 +27,7 @@ def test_get_comments_by_situation_success(
     data = response.json()
     assert data["success"] is True
     assert data["message"] == "Comments retrieved successfully"
-    assert isinstance(data["data"], list)
-    assert len(data["data"]) >= 1
+    assert len(data["data"]["items"]) >= 1
 
 
 def test_get_comments_by_situation_empty(client, sample_situation, db_session):
@@ -43,7 +43,7 @@ def test_get_comments_by_situation_empty(client, sample_situation, db_session):
     data = response.json()
     assert data["success"] is True
     assert data["message"] == "Comments retrieved successfully"
-    assert len(data["data"]) == 0
+    assert data["data"]["items"] == []
 
 
 def test_get_comments_by_situation_invalid_id(client):
@@ -67,6 +67,26 @@ def test_create_comment_success(client, sample_situation, auth_headers):
     assert data["data"]["content"] == comment_data["content"]
 
 
+def test_create_comment_deferred_sentiment(
+    client, sample_situation, auth_headers, db_session, monkeypatch
+):
+    """In deferred mode the comment is scored after the response is built."""
+    monkeypatch.setattr(settings, "sentiment_mode", "deferred")
+    response = client.post(
+        f"/api/v1/situations/{sample_situation.id}/comments",
+        json={"content": "Tôi rất vui và hạnh phúc"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["sentiment_analysis"] is None
+
+    comment = db_session.get(Comment, data["id"])
+    db_session.refresh(comment)
+    assert comment.sentiment_label == "positive"
+    assert comment.sentiment_score > 0
+
+
 def test_create_comment_invalid_data(client, sample_situation, auth_headers):
     """Test creating comment with invalid data."""
     comment_data = {"content": ""}  # Empty content should be invalid
@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta
+
+from app.models import Comment
+
+
+def test_get_comments_page(client, sample_situation, sample_user, db_session):
+    start = datetime(2026, 1, 1, 12, 0, 0)
+    db_session.add_all(
+        Comment(
+            content=f"comment {i}",
+            situation_id=sample_situation.id,
+            user_id=sample_user.id,
+            created_at=start + timedelta(seconds=i),
+        )
+        for i in range(3)
+    )
+    db_session.commit()
+    url = f"/api/v1/situations/{sample_situation.id}/comments"
+
+    first = client.get(url, params={"limit": 2}).json()["data"]
+    cursor = first["pagination"]["next_cursor"]
+    second = client.get(url, params={"limit": 2, "after": cursor}).json()["data"]
+
+    assert [c["content"] for c in first["items"]] == ["comment 0", "comment 1"]
+    assert first["items"][0]["user"]["name"] == sample_user.name
+    assert [c["content"] for c in second["items"]] == ["comment 2"]
+    assert second["pagination"]["has_next"] is False
+    assert client.get(url, params={"after": "%%"}).status_code == 422
+
+
+def test_get_comments_defaults_to_first_page(
+    client, sample_situation, sample_user, db_session
+):
+    db_session.add_all(
+        Comment(
+            content=f"c{i}", situation_id=sample_situation.id, user_id=sample_user.id
+        )
+        for i in range(25)
+    )
+    db_session.commit()
+    url = f"/api/v1/situations/{sample_situation.id}/comments"
+
+    page = client.get(url).json()["data"]
+    full = client.get(url, params={"all": "true"}).json()["data"]
+
+    assert len(page["items"]) == 20
+    assert page["pagination"]["has_next"] is True
+    assert len(full) == 25
+    assert client.get(url, params={"all": "true", "limit": 5}).status_code == 422
@@ -11,7 +11,7 @@ def test_prefixed_get_comments_by_situation(
     assert res.status_code == 200
     body = res.json()
     assert body["success"] is True
-    assert isinstance(body["data"], list)
+    assert [c["content"] for c in body["data"]["items"]] == ["hi"]
 
 
 def test_prefixed_create_comment_unauthorized(client, sample_situation):
@@ -191,7 +191,8 @@ def test_get_contributed_situations_success(client, sample_situation, auth_heade
     data = response.json()
     assert data["success"] is True
     assert data["message"] == "Contributed situations retrieved successfully"
-    assert isinstance(data["data"], list)
+    assert isinstance(data["data"]["items"], list)
+    assert data["data"]["pagination"]["page"] == 1
 
 
 def test_get_contributed_situations_unauthorized(client):
@@ -0,0 +1,45 @@
+from app.core.config import settings
+from app.models import Situation
+
+
+def test_import_requires_admin(client, auth_headers):
+    response = client.post(
+        "/api/v1/situations/import",
+        content='{"context": "c", "question": "q"}\n',
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 403
+
+
+def test_import_jsonl_body(
+    client, auth_headers, sample_user, sample_topic, db_session, monkeypatch
+):
+    monkeypatch.setattr(settings, "admin_emails", [sample_user.email])
+    body = (
+        f'{{"topic": "{sample_topic.name}", "context": "c1", "question": "q1"}}\n'
+        '{"context": "c2"}\n'
+    )
+
+    response = client.post(
+        "/api/v1/situations/import", content=body.encode(), headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    report = response.json()["data"]
+    assert (report["inserted"], report["rejected"]) == (1, 1)
+    assert report["errors"] == [{"line": 2, "errors": ["question: Field required"]}]
+    situation = db_session.query(Situation).filter_by(question="q1").one()
+    assert situation.topic_id == sample_topic.id
+
+
+def test_import_rejects_non_utf8_body(client, auth_headers, sample_user, monkeypatch):
+    monkeypatch.setattr(settings, "admin_emails", [sample_user.email])
+
+    response = client.post(
+        "/api/v1/situations/import?format=csv",
+        content="context,question\nc\xe1,q\n".encode("latin-1"),
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,46 @@
+from app.models import Comment
+
+
+def test_search_situations(client, auth_headers, sample_situation, sample_topic):
+    response = client.get(
+        "/api/v1/situations/search",
+        params={"q": "test situation", "topic_id": sample_topic.id},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [item["id"] for item in data["items"]] == [sample_situation.id]
+    assert "<mark>situation</mark>" in data["items"][0]["snippet"]
+    assert data["pagination"]["has_next"] is False
+
+
+def test_search_comments(client, auth_headers, db_session, sample_situation):
+    comment = Comment(situation_id=sample_situation.id, user_id=1, content="Stay calm")
+    db_session.add(comment)
+    db_session.commit()
+
+    response = client.get(
+        "/api/v1/situations/search",
+        params={"q": "calm", "target": "comments"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    items = response.json()["data"]["items"]
+    assert [item["id"] for item in items] == [comment.id]
+    assert items[0]["snippet"] == "Stay <mark>calm</mark>"
+
+
+def test_search_rejects_unknown_target_and_bad_cursor(client, auth_headers):
+    url = "/api/v1/situations/search"
+
+    assert client.get(url, params={"q": "calm"}).status_code == 401
+    response = client.get(
+        url, params={"q": "calm", "target": "users"}, headers=auth_headers
+    )
+    assert response.status_code == 422
+    response = client.get(
+        url, params={"q": "calm", "cursor": "%%"}, headers=auth_headers
+    )
+    assert response.status_code in (400, 422)
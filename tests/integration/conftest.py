@@ -1,3 +1,5 @@
+import os
+import tempfile
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -6,8 +8,9 @@ from fastapi import HTTPException, Request
 from fastapi.testclient import TestClient
 from jose import jwt
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 from app.api.v1.deps import get_current_user_dep, get_db
 from app.core.config import settings
@@ -17,16 +20,27 @@ from app.core.security import get_current_user as real_get_current_user
 from app.main import app
 from app.models import Answer, Comment, Situation, Topic, User
 
-# Test database setup - use SQLite in-memory for testing
-SQLALCHEMY_DATABASE_URL = "sqlite://"
+# Test database setup - a temporary SQLite file, so the sync engine and the
+# aiosqlite engine used by async endpoints see the same data
+_db_fd, _db_path = tempfile.mkstemp(suffix=".db")
+os.close(_db_fd)
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{_db_path}"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+    poolclass=NullPool,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+    f"sqlite+aiosqlite:///{_db_path}",
+    poolclass=NullPool,
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def override_get_db():
     """Override database dependency for testing."""
@@ -48,6 +62,8 @@ core_db_module.SessionLocal = TestingSessionLocal
 
 import app.services.analysis_service as analysis_service_module
 import app.services.comment_service as comment_service_module
+import app.services.reaction_service as reaction_service_module
+import app.services.search_service as search_service_module
 import app.services.situation_service as situation_service_module
 import app.services.topic_service as topic_service_module
 
@@ -59,6 +75,12 @@ situation_service_module.SessionLocal = TestingSessionLocal
 analysis_service_module.SessionLocal = TestingSessionLocal
 comment_service_module.SessionLocal = TestingSessionLocal
 topic_service_module.SessionLocal = TestingSessionLocal
+search_service_module.SessionLocal = TestingSessionLocal
+
+user_service_module.AsyncSessionLocal = TestingAsyncSessionLocal
+situation_service_module.AsyncSessionLocal = TestingAsyncSessionLocal
+comment_service_module.AsyncSessionLocal = TestingAsyncSessionLocal
+reaction_service_module.AsyncSessionLocal = TestingAsyncSessionLocal
 
 
 # Override auth dependency: require Bearer token and resolve user from DB; else 401
@@ -98,6 +120,7 @@ def db_engine():
     Base.metadata.create_all(bind=engine)
     yield engine
     Base.metadata.drop_all(bind=engine)
+    os.unlink(_db_path)
 
 
 @pytest.fixture
@@ -55,7 +55,7 @@ def test_complete_user_workflow(
     assert response.status_code == 200
     data = response.json()
     assert data["success"] is True
-    assert len(data["data"]) >= 1
+    assert len(data["data"]["items"]) >= 1
 
     # 7. Analyze an answer
     with patch("app.services.openai_service.OpenAIService.analyze_eq") as mock_analyze:
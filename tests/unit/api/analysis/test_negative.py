@@ -12,7 +12,7 @@ def test_analyze_situation_not_found(client: TestClient, monkeypatch):
     # Monkeypatch service to raise 404-like behavior by returning None and letting router/service handle
     from app.services.analysis_service import AnalysisService
 
-    def fake_analyze_answer(self, answer):
+    async def fake_analyze_answer(self, answer):
         raise Exception("Situation not found")
 
     monkeypatch.setattr(AnalysisService, "analyze_answer", fake_analyze_answer)
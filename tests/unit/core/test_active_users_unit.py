@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from app.core.active_users import ACTIVE_USERS_KEY, ActiveUserTracker
+from app.core.config import settings
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.ops.append((name, args))
+            return self
+
+        return queue
+
+    def execute(self):
+        self.redis.executes += 1
+        if self.redis.fail:
+            raise ConnectionError("redis down")
+        return [getattr(self.redis, name)(*args) for name, args in self.ops]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.zsets = {}
+        self.executes = 0
+        self.fail = False
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def zremrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        stale = [member for member, score in zset.items() if score <= high]
+        for member in stale:
+            del zset[member]
+        return len(stale)
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def expire(self, key, seconds):
+        return True
+
+
+def test_touches_are_coalesced_per_window_and_flushed_in_one_pipeline():
+    tracker, redis = ActiveUserTracker(), FakeRedis()
+
+    for _ in range(50):
+        tracker.touch(1)
+    tracker.touch(2)
+
+    assert tracker.flush(redis) == 2
+    assert redis.executes == 1
+    assert set(redis.zsets[ACTIVE_USERS_KEY]) == {"1", "2"}
+    # Still inside the window: nothing new to write
+    tracker.touch(1)
+    assert tracker.flush(redis) == 0
+
+
+def test_touch_after_window_is_written_again(monkeypatch):
+    monkeypatch.setattr(settings, "active_users_touch_window_seconds", 0)
+    tracker, redis = ActiveUserTracker(), FakeRedis()
+
+    tracker.touch(1)
+    tracker.flush(redis)
+    tracker.touch(1)
+
+    assert tracker.flush(redis) == 1
+
+
+def test_replicas_share_one_count_and_idle_users_expire():
+    redis = FakeRedis()
+    replica_a, replica_b = ActiveUserTracker(), ActiveUserTracker()
+    replica_a.touch(1)
+    replica_b.touch(1)
+    replica_b.touch(2)
+    replica_a.flush(redis)
+    replica_b.flush(redis)
+    redis.zsets[ACTIVE_USERS_KEY]["3"] = (
+        time.time() - settings.active_users_ttl_seconds - 1
+    )
+
+    assert replica_a.count(redis) == 2
+    assert "3" not in redis.zsets[ACTIVE_USERS_KEY]
+
+
+def test_failed_flush_requeues_touches():
+    tracker, redis = ActiveUserTracker(), FakeRedis()
+    tracker.touch(1)
+    redis.fail = True
+
+    assert tracker.flush(redis) == 0
+    assert tracker.pending() == 1
+
+    redis.fail = False
+    assert tracker.flush(redis) == 1
@@ -0,0 +1,218 @@
+import pytest
+
+from app.core.cache import Cache, _LocalStore
+from app.core.config import settings
+from app.core.metrics import CACHE_HITS, CACHE_MISSES
+
+
+class FakeRedis:
+    def __init__(self, fail=False):
+        self.data = {}
+        self.fail = fail
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("redis down")
+
+    def ping(self):
+        self._check()
+        return True
+
+    def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    def mget(self, keys):
+        self._check()
+        return [self.data.get(key) for key in keys]
+
+    def expire(self, key, seconds):
+        return key in self.data
+
+    def setex(self, key, ttl, value):
+        self._check()
+        self.data[key] = value
+
+    def delete(self, *keys):
+        self._check()
+        for key in keys:
+            self.data.pop(key, None)
+
+    def incr(self, key):
+        self._check()
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def zadd(self, key, mapping):
+        self._check()
+        self.data.setdefault(key, {}).update(mapping)
+
+    def zcard(self, key):
+        return len(self.data.get(key, {}))
+
+    def zpopmin(self, key, count):
+        members = sorted(self.data.get(key, {}).items(), key=lambda kv: kv[1])
+        for member, _ in members[:count]:
+            del self.data[key][member]
+        return members[:count]
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, op):
+        return lambda *args: self.calls.append((op, args))
+
+    def execute(self):
+        return [getattr(self.redis, op)(*args) for op, args in self.calls]
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(settings, "cache_enabled", True)
+
+
+def _counter(metric, namespace):
+    return metric.labels(namespace=namespace)._value.get()
+
+
+def test_local_fallback_roundtrip_and_invalidate(enabled):
+    c = Cache(redis_url="redis://localhost:1/0")
+    hits, misses = _counter(CACHE_HITS, "t"), _counter(CACHE_MISSES, "t")
+
+    assert c.get("t", "k") is None
+    c.set("t", "k", {"a": [1, 2]})
+    assert c.get("t", "k") == {"a": [1, 2]}
+    assert _counter(CACHE_MISSES, "t") == misses + 1
+    assert _counter(CACHE_HITS, "t") == hits + 1
+
+    c.invalidate("t")
+    assert c.get("t", "k") is None
+
+    c.set("t", "k", 1)
+    c.delete("t", "k")
+    assert c.get("t", "k") is None
+
+
+def test_redis_used_when_available(enabled):
+    c = Cache()
+    fake = FakeRedis()
+    c._redis = fake
+
+    c.set("t", "k", "v")
+    assert any(key.startswith("cache:t:0:") for key in fake.data)
+    c.invalidate("t")
+    assert fake.data["cache:gen:t"] == "1"
+    assert c.get("t", "k") is None
+
+
+def test_redis_error_falls_back_to_local(enabled):
+    c = Cache()
+    c._redis = FakeRedis(fail=True)
+
+    c.set("t", "k", "v")
+    assert c._redis is None
+    assert c.get("t", "k") == "v"
+
+
+def test_get_or_set_and_disabled(monkeypatch, enabled):
+    c = Cache(redis_url="redis://localhost:1/0")
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [1]
+
+    assert c.get_or_set("t", "x", loader) == [1]
+    assert c.get_or_set("t", "x", loader) == [1]
+    assert len(calls) == 1
+
+    monkeypatch.setattr(settings, "cache_enabled", False)
+    assert c.get("t", "x") is None
+
+
+def test_get_or_set_does_not_store_a_load_raced_by_invalidate(enabled):
+    c = Cache()
+    c._redis = FakeRedis()
+
+    def loader():
+        # A write lands between the loader's read and the cache fill
+        c.invalidate("t")
+        return "stale"
+
+    assert c.get_or_set("t", "x", loader) == "stale"
+    assert c.get_or_set("t", "x", lambda: "fresh") == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_async_does_not_store_a_load_raced_by_invalidate(enabled):
+    c = Cache()
+    c._redis = FakeRedis()
+
+    async def loader():
+        c.invalidate("t")
+        return "stale"
+
+    async def fresh():
+        return "fresh"
+
+    assert await c.get_or_set_async("t", "x", loader) == "stale"
+    assert await c.get_or_set_async("t", "x", fresh) == "fresh"
+
+
+@pytest.mark.parametrize("redis_up", [True, False])
+def test_key_invalidation_retires_a_fill_raced_by_the_write(enabled, redis_up):
+    c = Cache(redis_url="redis://localhost:1/0")
+    if redis_up:
+        c._redis = FakeRedis()
+    c.set("t", "other", "kept")
+
+    def loader():
+        # The writer commits and invalidates while this read is in flight
+        c.invalidate("t", "x")
+        return "stale"
+
+    assert c.get_or_set("t", "x", loader) == "stale"
+    assert c.get_or_set("t", "x", lambda: "fresh") == "fresh"
+    assert c.get("t", "other") == "kept"
+
+
+def test_local_store_lru_and_expiry(monkeypatch):
+    store = _LocalStore(max_entries=2)
+    store.set("a", "1")
+    store.set("b", "2")
+    store.get("a")
+    store.set("c", "3")
+    assert store.get("b") is None
+    assert store.get("a") == "1"
+
+    store.incr("gen")
+    for i in range(5):
+        store.set(f"k{i}", "v")
+    assert store.get("gen") == "1"
+
+    now = [100.0]
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now[0])
+    store.set("ttl", "v", ttl=5)
+    now[0] += 6
+    assert store.get("ttl") is None
+
+
+def test_set_with_max_entries_evicts_oldest_in_redis(enabled, monkeypatch):
+    c = Cache()
+    c._redis = FakeRedis()
+    clock = iter(range(100))
+    monkeypatch.setattr("app.core.cache.time.time", lambda: next(clock))
+
+    for key in ("a", "b", "c"):
+        c.set("bounded", key, key, max_entries=2)
+
+    assert c.get("bounded", "a") is None
+    assert c.get("bounded", "b") == "b"
+    assert c.get("bounded", "c") == "c"
+    assert c._redis.zcard("cache:idx:bounded") == 2
@@ -0,0 +1,117 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app.core import database
+from app.core.config import settings
+from app.core.db_instrumentation import InstrumentedQueuePool
+from app.core.metrics import DB_POOL_CAPACITY, DB_POOL_STALE_CONNECTIONS, track_db_pool
+
+PG_URL = "postgresql://u:p@db:5432/eq"
+ASYNC_PG_URL = "postgresql+asyncpg://u:p@db:5432/eq"
+
+
+def test_pool_options_follow_settings(monkeypatch):
+    monkeypatch.setattr(settings, "db_pool_size", 20)
+    monkeypatch.setattr(settings, "db_max_overflow", 5)
+    monkeypatch.setattr(settings, "db_pool_timeout_seconds", 3.0)
+    monkeypatch.setattr(settings, "db_pool_recycle_seconds", 600)
+    monkeypatch.setattr(settings, "db_pool_pre_ping", "always")
+
+    options = database._pool_options(PG_URL, InstrumentedQueuePool)
+
+    assert options == {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": 20,
+        "max_overflow": 5,
+        "pool_timeout": 3.0,
+        "pool_recycle": 600,
+        "pool_pre_ping": True,
+    }
+
+
+def test_pool_size_zero_selects_null_pool(monkeypatch):
+    monkeypatch.setattr(settings, "db_pool_size", 0)
+    monkeypatch.setattr(settings, "db_pool_pre_ping", "idle")
+
+    options = database._pool_options(PG_URL, InstrumentedQueuePool)
+
+    assert options == {"poolclass": NullPool, "pool_pre_ping": False}
+
+
+def test_sqlite_keeps_its_default_pool(monkeypatch):
+    options = database._pool_options("sqlite:///x.db", InstrumentedQueuePool)
+
+    assert "poolclass" not in options and "pool_size" not in options
+
+
+def test_statement_timeout_is_a_startup_option(monkeypatch):
+    monkeypatch.setattr(settings, "db_statement_timeout_ms", 5000)
+    monkeypatch.setattr(settings, "db_pgbouncer", False)
+
+    assert database._connect_args(PG_URL)["options"] == "-c statement_timeout=5000"
+    async_args = database._async_connect_args(ASYNC_PG_URL)
+    assert async_args["server_settings"]["statement_timeout"] == "5000"
+    assert "statement_cache_size" not in async_args
+
+
+def test_pgbouncer_mode_disables_prepared_statements(monkeypatch):
+    monkeypatch.setattr(settings, "db_statement_timeout_ms", 5000)
+    monkeypatch.setattr(settings, "db_pgbouncer", True)
+
+    assert "options" not in database._connect_args(PG_URL)
+    args = database._async_connect_args(ASYNC_PG_URL)
+    assert args["statement_cache_size"] == 0
+    assert args["prepared_statement_cache_size"] == 0
+    assert "statement_timeout" not in args["server_settings"]
+    name_func = args["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+
+@pytest.fixture
+def pool_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool)
+    yield engine
+    engine.dispose()
+
+
+def test_idle_pre_ping_skips_recently_used_connections(pool_engine, monkeypatch):
+    monkeypatch.setattr(settings, "db_pool_pre_ping_idle_seconds", 60.0)
+    pings = []
+    monkeypatch.setattr(pool_engine.dialect, "do_ping", lambda conn: pings.append(1))
+    database._ping_idle_connections(pool_engine, "sync")
+
+    for _ in range(3):
+        with pool_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    assert pings == []
+
+
+def test_idle_pre_ping_replaces_stale_connections(pool_engine, monkeypatch):
+    monkeypatch.setattr(settings, "db_pool_pre_ping_idle_seconds", 0.0)
+
+    def failing_ping(conn):
+        raise OSError("server closed the connection")
+
+    with pool_engine.connect() as conn:
+        first = conn.connection.dbapi_connection
+    monkeypatch.setattr(pool_engine.dialect, "do_ping", failing_ping)
+    database._ping_idle_connections(pool_engine, "sync")
+    # The first connection was checked in before the listener existed
+    with pool_engine.connect():
+        pass
+    before = DB_POOL_STALE_CONNECTIONS.labels(engine="sync")._value.get()
+
+    with pool_engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+        assert conn.connection.dbapi_connection is not first
+
+    after = DB_POOL_STALE_CONNECTIONS.labels(engine="sync")._value.get()
+    assert after == before + 1
+
+
+def test_track_db_pool_exports_capacity():
+    track_db_pool("sync", in_use=3, capacity=15)
+
+    assert DB_POOL_CAPACITY.labels(engine="sync")._value.get() == 15
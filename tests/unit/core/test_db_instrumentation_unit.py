@@ -0,0 +1,108 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, text
+
+from app.core.config import settings
+from app.core.db_instrumentation import (
+    DBQueryStatsMiddleware,
+    InstrumentedQueuePool,
+    after_cursor_execute,
+    before_cursor_execute,
+    classify_statement,
+)
+from app.core.metrics import (
+    DB_N_PLUS_ONE,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_IN_USE,
+    DB_QUERIES_PER_REQUEST,
+    DB_QUERY_DURATION,
+    DB_SLOW_QUERIES,
+)
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        ("SELECT users.id FROM users WHERE users.email = ?", ("select", "users")),
+        (
+            "SELECT count(*) FROM (SELECT situations.id FROM situations) AS anon_1",
+            ("select", "situations"),
+        ),
+        ('INSERT INTO "comments" (content) VALUES (?)', ("insert", "comments")),
+        ("UPDATE answers SET status=? WHERE answers.id = ?", ("update", "answers")),
+        ("DELETE FROM reactions WHERE reactions.id = ?", ("delete", "reactions")),
+        ("WITH x AS (SELECT 1) SELECT * FROM topics", ("select", "topics")),
+        ("SAVEPOINT sa_savepoint_1", ("other", "none")),
+    ],
+)
+def test_classify_statement(statement, expected):
+    assert classify_statement(statement) == expected
+
+
+@pytest.fixture
+def instrumented_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'i.db'}", poolclass=InstrumentedQueuePool
+    )
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+    yield engine
+    engine.dispose()
+
+
+def _sample(metric, **labels):
+    return metric.labels(**labels)._sum.get()
+
+
+def test_request_queries_are_labeled_and_n_plus_one_is_reported(
+    instrumented_engine, monkeypatch
+):
+    monkeypatch.setattr(settings, "db_n_plus_one_threshold", 5)
+    app = FastAPI()
+    app.add_middleware(DBQueryStatsMiddleware)
+
+    @app.get("/items/{count}")
+    def list_items(count: int):
+        with instrumented_engine.connect() as conn:
+            for i in range(count):
+                conn.execute(text("SELECT id FROM items WHERE id = :id"), {"id": i})
+        return {}
+
+    route = "/items/{count}"
+    n_plus_one = DB_N_PLUS_ONE.labels(route=route)._value.get()
+    per_request = _sample(DB_QUERIES_PER_REQUEST, route=route)
+    timed = DB_QUERY_DURATION.labels(operation="select", table="items", route=route)
+    timed_before = timed._sum.get()
+
+    client = TestClient(app)
+    client.get("/items/2")
+    assert DB_N_PLUS_ONE.labels(route=route)._value.get() == n_plus_one
+    client.get("/items/6")
+
+    assert DB_N_PLUS_ONE.labels(route=route)._value.get() == n_plus_one + 1
+    assert _sample(DB_QUERIES_PER_REQUEST, route=route) == per_request + 8
+    assert timed._sum.get() > timed_before
+
+
+def test_slow_queries_are_counted(instrumented_engine, monkeypatch):
+    monkeypatch.setattr(settings, "db_slow_query_ms", 0)
+    slow = DB_SLOW_QUERIES.labels(operation="select", table="items")
+    before = slow._value.get()
+
+    with instrumented_engine.connect() as conn:
+        conn.execute(text("SELECT id FROM items"))
+
+    assert slow._value.get() == before + 1
+
+
+def test_pool_reports_checkout_wait_and_connections_in_use(instrumented_engine):
+    waits = DB_POOL_CHECKOUT_WAIT.labels(engine="sync")
+    observed = sum(bucket.get() for bucket in waits._buckets)
+
+    with instrumented_engine.connect():
+        assert DB_POOL_IN_USE.labels(engine="sync")._value.get() == 1
+    assert DB_POOL_IN_USE.labels(engine="sync")._value.get() == 0
+    assert sum(bucket.get() for bucket in waits._buckets) == observed + 1
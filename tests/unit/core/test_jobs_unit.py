@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from app.core.exceptions import ServiceUnavailableError
+from app.core.jobs import JobQueue
+
+
+@pytest.mark.asyncio
+async def test_job_queue_runs_jobs_with_bounded_concurrency():
+    queue = JobQueue("test", concurrency=2)
+    running = {"now": 0, "peak": 0}
+    done = []
+
+    async def job(n):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0.01)
+        running["now"] -= 1
+        done.append(n)
+
+    for n in range(5):
+        queue.enqueue(job, n)
+    await queue.join()
+    await queue.stop()
+
+    assert sorted(done) == [0, 1, 2, 3, 4]
+    assert running["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_job_queue_survives_failing_job():
+    queue = JobQueue("test", concurrency=1)
+    done = []
+
+    async def boom():
+        raise RuntimeError("boom")
+
+    async def ok():
+        done.append(True)
+
+    queue.enqueue(boom)
+    queue.enqueue(ok)
+    await queue.join()
+    await queue.stop()
+
+    assert done == [True]
+
+
+@pytest.mark.asyncio
+async def test_job_queue_rejects_when_full():
+    queue = JobQueue("test", concurrency=1, max_size=1)
+    release = asyncio.Event()
+
+    async def wait():
+        await release.wait()
+
+    queue.enqueue(wait)
+    await asyncio.sleep(0)  # let the worker take the first job
+    queue.enqueue(wait)
+
+    with pytest.raises(ServiceUnavailableError):
+        queue.enqueue(wait)
+
+    release.set()
+    await queue.join()
+    await queue.stop()
@@ -0,0 +1,42 @@
+import json
+
+from app.core.json_stream import JSONStreamScanner
+
+
+def _feed_in_chunks(text: str, size: int):
+    scanner = JSONStreamScanner()
+    values = []
+    for start in range(0, len(text), size):
+        values.extend(scanner.feed(text[start : start + size]))
+    return scanner, values
+
+
+def test_scanner_reports_nested_values_with_their_path():
+    payload = {
+        "scores": {"empathy": 8, "self_awareness": -1.5},
+        "reasoning": {"empathy": 'Nghe "kỹ", rồi\nđáp', "ok": True},
+        "tags": ["a", None],
+    }
+    text = "```json\n" + json.dumps(payload, ensure_ascii=False) + "\n```"
+
+    for size in (1, 3, len(text)):
+        scanner, values = _feed_in_chunks(text, size)
+        assert scanner.done
+        assert values == [
+            (("scores", "empathy"), 8),
+            (("scores", "self_awareness"), -1.5),
+            (("reasoning", "empathy"), 'Nghe "kỹ", rồi\nđáp'),
+            (("reasoning", "ok"), True),
+            (("tags",), "a"),
+            (("tags",), None),
+        ]
+
+
+def test_scanner_emits_values_before_the_document_ends():
+    scanner = JSONStreamScanner()
+
+    assert scanner.feed('{"scores": {"empathy": 7') == []
+    assert scanner.feed(", ") == [(("scores", "empathy"), 7)]
+    assert scanner.feed('"communication": "go') == []
+    assert scanner.feed('od"') == [(("scores", "communication"), "good")]
+    assert not scanner.done
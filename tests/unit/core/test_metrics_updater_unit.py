@@ -0,0 +1,123 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import app.core.metrics_updater as updater
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def expire(self, key, seconds):
+        return key in self.data
+
+
+def test_only_one_replica_holds_the_leader_lock(monkeypatch):
+    redis = FakeRedis()
+
+    assert updater.is_leader(redis)
+    assert updater.is_leader(redis)  # renewal by the holder
+    monkeypatch.setattr(updater, "REPLICA_ID", "other-replica")
+    assert not updater.is_leader(redis)
+    assert updater.is_leader(None)
+
+
+def test_estimated_totals_fall_back_to_count_for_unanalyzed_tables(monkeypatch):
+    rows = [("users", 120), ("situations", 40), ("reactions", -1), ("comments", 7)]
+    db = SimpleNamespace(
+        execute=lambda statement, params: SimpleNamespace(all=lambda: rows)
+    )
+    counted = []
+
+    def fake_exact(db, names):
+        counted.extend(names)
+        return {name: 3 for name in names}
+
+    monkeypatch.setattr(updater, "_exact_totals", fake_exact)
+
+    assert updater._estimated_totals(db) == {
+        "users": 120,
+        "situations": 40,
+        "reactions": 3,
+        "comments": 7,
+    }
+    assert counted == ["reactions"]
+
+
+@pytest.mark.asyncio
+async def test_followers_skip_the_database(monkeypatch):
+    monkeypatch.setattr(updater, "get_redis_client", lambda: object())
+    monkeypatch.setattr(updater, "is_leader", lambda client: False)
+
+    def fail():
+        raise AssertionError("follower must not query the database")
+
+    monkeypatch.setattr(updater, "_read_db_totals", fail)
+
+    await updater.update_database_metrics()
+
+
+@pytest.mark.asyncio
+async def test_leader_publishes_totals(monkeypatch):
+    published = []
+    monkeypatch.setattr(updater, "get_redis_client", lambda: None)
+    monkeypatch.setattr(
+        updater,
+        "_read_db_totals",
+        lambda: {"users": 1, "situations": 2, "reactions": 3, "comments": 4},
+    )
+    monkeypatch.setattr(
+        updater, "update_db_totals", lambda *totals: published.append(totals)
+    )
+
+    await updater.update_database_metrics()
+
+    assert published == [(1, 2, 3, 4)]
+
+
+def test_redis_client_uses_bounded_socket_timeouts(monkeypatch):
+    calls = []
+
+    class Client:
+        def ping(self):
+            return True
+
+    def from_url(url, **kwargs):
+        calls.append(kwargs)
+        return Client()
+
+    monkeypatch.setattr(updater, "_redis_client", None)
+    monkeypatch.setattr(updater.redis.Redis, "from_url", from_url)
+
+    assert updater.get_redis_client() is not None
+    assert calls[0]["socket_connect_timeout"] > 0
+    assert calls[0]["socket_timeout"] > 0
+
+
+@pytest.mark.asyncio
+async def test_active_user_tasks_connect_off_the_event_loop(monkeypatch):
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def get_client():
+        threads.append(threading.get_ident())
+        return None
+
+    monkeypatch.setattr(updater, "get_redis_client", get_client)
+
+    await updater.update_active_users_from_redis()
+    await updater.flush_active_users()
+
+    assert len(threads) == 2
+    assert loop_thread not in threads
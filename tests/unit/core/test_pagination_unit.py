@@ -0,0 +1,39 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.exceptions import ValidationError
+from app.core.pagination import (
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+)
+
+
+def test_cursor_roundtrip():
+    created_at = datetime(2025, 3, 1, 8, 30, 15, 123456, tzinfo=timezone.utc)
+    cursor = encode_cursor(created_at, 42)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, 42)
+
+
+def test_cursor_without_timestamp():
+    assert decode_cursor(encode_cursor(None, 7)) == (None, 7)
+
+
+@pytest.mark.parametrize("cursor", ["", "%%%", "bm90LWpzb24"])
+def test_decode_cursor_invalid(cursor):
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor)
+
+
+def test_rank_cursor_roundtrip():
+    rank = 0.1 + 0.2
+    assert decode_rank_cursor(encode_rank_cursor(rank, 9)) == (rank, 9)
+
+
+@pytest.mark.parametrize("cursor", ["%%%", "eyJpZCI6MX0"])
+def test_decode_rank_cursor_invalid(cursor):
+    with pytest.raises(ValidationError):
+        decode_rank_cursor(cursor)
@@ -0,0 +1,109 @@
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from jose import jwt
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.metrics import PRINCIPAL_CACHE_HITS, PRINCIPAL_CACHE_MISSES
+from app.core.principal_cache import principal_cache
+from app.core.security import (
+    create_access_token,
+    get_current_user,
+    get_current_user_async,
+)
+from app.services.user_service import UserService
+
+USER = SimpleNamespace(id=5, email="p@example.com", name="P", picture=None)
+
+
+class DummyRequest:
+    def __init__(self, token):
+        self.cookies = {}
+        self.headers = {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def cached(monkeypatch):
+    monkeypatch.setattr(settings, "cache_enabled", True)
+    monkeypatch.setattr(cache, "_redis_retry_at", float("inf"))
+    cache.clear_local()
+    principal_cache.clear_local()
+    yield
+    cache.clear_local()
+    principal_cache.clear_local()
+
+
+@pytest.fixture
+def users():
+    with patch("app.core.security.UserService") as service_cls:
+        service = service_cls.return_value
+        service.get_user_by_email.return_value = USER
+        yield service
+
+
+def _hits(tier):
+    return PRINCIPAL_CACHE_HITS.labels(tier=tier)._value.get()
+
+
+def test_repeat_requests_skip_the_user_lookup(cached, users):
+    request = DummyRequest(create_access_token({"sub": USER.email}))
+    misses, local_hits = PRINCIPAL_CACHE_MISSES._value.get(), _hits("local")
+
+    first = get_current_user(request)
+    second = get_current_user(request)
+
+    assert (
+        first == second == {"id": 5, "email": USER.email, "name": "P", "picture": None}
+    )
+    users.get_user_by_email.assert_called_once_with(USER.email)
+    assert PRINCIPAL_CACHE_MISSES._value.get() == misses + 1
+    assert _hits("local") == local_hits + 1
+
+
+def test_shared_tier_refills_the_local_tier(cached, users):
+    request = DummyRequest(create_access_token({"sub": USER.email}))
+    get_current_user(request)
+    principal_cache.clear_local()
+    shared_hits = _hits("redis")
+
+    get_current_user(request)
+
+    assert _hits("redis") == shared_hits + 1
+    assert principal_cache.get_local(USER.email)["id"] == 5
+    users.get_user_by_email.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_lookup_uses_the_cache(cached, users):
+    request = DummyRequest(create_access_token({"sub": USER.email}))
+    get_current_user(request)
+
+    assert (await get_current_user_async(request))["id"] == 5
+    users.get_user_by_email_async.assert_not_called()
+
+
+def test_entries_do_not_outlive_the_token(cached, users):
+    almost_expired = jwt.encode(
+        {"sub": USER.email, "exp": int(time.time())},
+        settings.secret_key,
+        algorithm=settings.algorithm,
+    )
+    principal_cache.set(
+        USER.email, {"id": 5}, jwt.get_unverified_claims(almost_expired)["exp"]
+    )
+
+    assert principal_cache.get(USER.email) is None
+
+
+def test_update_user_invalidates_the_principal(cached):
+    principal_cache.set(USER.email, {"id": 5}, time.time() + 60)
+    repo = Mock()
+    repo.get_user_by_id.return_value = USER
+
+    with patch("app.services.user_service.SessionLocal"):
+        UserService(user_repo=repo).update_user(5, {"name": "New"})
+
+    assert principal_cache.get(USER.email) is None
@@ -0,0 +1,129 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.api.v1.deps import get_db, use_request_session
+from app.core.database import RequestSession, request_session, session_scope
+
+
+@pytest.fixture
+def counted_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'uow.db'}", poolclass=QueuePool)
+    checkouts = []
+    event.listen(engine, "checkout", lambda *args: checkouts.append(1))
+    engine.checkouts = checkouts
+    yield engine
+    engine.dispose()
+
+
+def test_session_scope_opens_and_closes_its_own_session_outside_requests():
+    factory = MagicMock()
+    session = factory.return_value.__enter__.return_value
+
+    with session_scope(factory) as db:
+        assert db is session
+
+    factory.return_value.__exit__.assert_called_once()
+
+
+def test_session_scope_shares_the_request_session():
+    factory = MagicMock()
+    shared = MagicMock()
+
+    with request_session(shared):
+        with session_scope(factory) as first, session_scope(factory) as second:
+            assert first is shared and second is shared
+
+    factory.assert_not_called()
+    shared.close.assert_not_called()
+
+
+def test_session_scope_rolls_back_the_request_session_on_error():
+    shared = MagicMock()
+
+    with request_session(shared):
+        with pytest.raises(ValueError):
+            with session_scope():
+                raise ValueError("boom")
+
+    shared.rollback.assert_called_once()
+    shared.close.assert_not_called()
+
+
+def test_request_session_is_cleared_on_exit():
+    factory = MagicMock()
+
+    with request_session(MagicMock()):
+        pass
+
+    with session_scope(factory):
+        pass
+    factory.assert_called_once()
+
+
+def test_request_session_keeps_one_connection_across_commits(counted_engine):
+    factory = sessionmaker(class_=RequestSession, bind=counted_engine)
+
+    db = factory()
+    for _ in range(3):
+        db.execute(text("SELECT 1"))
+        db.commit()
+    assert len(counted_engine.checkouts) == 1
+    assert counted_engine.pool.checkedout() == 1
+
+    db.close()
+    assert counted_engine.pool.checkedout() == 0
+
+
+def test_plain_session_checks_out_again_after_commit(counted_engine):
+    db = sessionmaker(bind=counted_engine)()
+    for _ in range(3):
+        db.execute(text("SELECT 1"))
+        db.commit()
+    db.close()
+
+    assert len(counted_engine.checkouts) == 3
+
+
+def test_endpoint_and_sync_dependencies_share_the_request_session(counted_engine):
+    factory = sessionmaker(class_=RequestSession, bind=counted_engine)
+    seen = []
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def lookup():
+        with session_scope() as db:
+            db.execute(text("SELECT 1"))
+            seen.append(db)
+
+    router = APIRouter(dependencies=[Depends(use_request_session)])
+
+    @router.get("/")
+    def endpoint(_=Depends(lookup)):
+        with session_scope() as db:
+            db.execute(text("SELECT 1"))
+            db.commit()
+            seen.append(db)
+        with session_scope() as db:
+            db.execute(text("SELECT 1"))
+            seen.append(db)
+        return {}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = override_get_db
+
+    assert TestClient(app).get("/").status_code == 200
+    assert len(seen) == 3 and len(set(map(id, seen))) == 1
+    assert len(counted_engine.checkouts) == 1
+    assert counted_engine.pool.checkedout() == 0
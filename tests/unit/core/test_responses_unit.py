@@ -0,0 +1,78 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app.core.responses import ORJSONResponse, success_response
+from app.schemas.comments import CommentOut
+from app.schemas.reactions import ReactionOut
+from app.schemas.responses import SuccessResponse
+from app.services.situation_service import _feed_timestamp
+
+
+def _generic_body(message, data):
+    return jsonable_encoder(SuccessResponse(message=message, data=data))
+
+
+def test_success_response_matches_the_generic_encoder():
+    data = {
+        "items": [
+            CommentOut(
+                id=1,
+                user_id=2,
+                situation_id=3,
+                content="Xin chào",
+                sentiment_analysis={"label": "positive", "score": 0.5},
+                created_at=datetime(2026, 1, 1, 8, 30, 15, 123456),
+                user={"id": 2, "name": "An"},
+            ),
+            ReactionOut(
+                id=4,
+                situation_id=3,
+                user_id=2,
+                reaction_type="upvote",
+                created_at=datetime(2026, 1, 2, tzinfo=timezone.utc),
+            ),
+        ],
+        "pagination": {"page": 1, "has_next": False},
+        "seen_at": datetime(2026, 1, 3, 9, 0, 0),
+    }
+
+    response = success_response("Comments retrieved successfully", data)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == _generic_body(
+        "Comments retrieved successfully", data
+    )
+
+
+def test_success_response_without_data():
+    response = success_response("Done")
+
+    assert json.loads(response.body) == {
+        "success": True,
+        "message": "Done",
+        "data": None,
+    }
+
+
+def test_orjson_response_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        ORJSONResponse({"value": object()})
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2026, 1, 1, 8, 30, 15),
+        datetime(2026, 1, 1, 8, 30, 15, 999999),
+        datetime(2026, 1, 1, 8, 30, 15, tzinfo=timezone.utc),
+    ],
+)
+def test_feed_timestamp_matches_strftime(value):
+    assert _feed_timestamp(value) == value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def test_feed_timestamp_of_missing_value():
+    assert _feed_timestamp(None) == ""
@@ -0,0 +1,64 @@
+import pytest
+
+from app.core.text_search import (
+    InvertedIndex,
+    fold_text,
+    highlight,
+    parse_web_query,
+    trigram_similarity,
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("Nguyễn Văn An", "nguyen van an"),
+        ("Trần ĐỨC Anh", "tran duc anh"),
+        ("Lê Thị Hoà", "le thi hoa"),
+        ("plain", "plain"),
+        (None, None),
+    ],
+)
+def test_fold_text(value, expected):
+    assert fold_text(value) == expected
+
+
+def test_trigram_similarity_matches_pg_trgm():
+    # Values from the pg_trgm documentation
+    assert trigram_similarity("word", "two words") == pytest.approx(0.36363637)
+    assert trigram_similarity("word", "word") == 1.0
+    assert trigram_similarity("word", "") == 0.0
+    assert trigram_similarity(None, "word") is None
+
+
+def test_parse_web_query_splits_excluded_terms():
+    assert parse_web_query('Công việc -"gia đình" sếp') == (
+        ["cong", "viec", "sep"],
+        [["gia", "dinh"]],
+    )
+    assert parse_web_query("-") == ([], [])
+
+
+def test_highlight_marks_matches_around_first_hit():
+    text = " ".join(f"w{i}" for i in range(20)) + " Sếp nói"
+
+    assert highlight(text, ["sep"], max_words=4, before=2) == (
+        "w18 w19 <mark>Sếp</mark> nói"
+    )
+
+
+def test_inverted_index_scores_and_updates():
+    index = InvertedIndex()
+    index.add(1, [("Sếp khó tính", 1.0), ("sếp", 0.5)])
+    index.add(2, [("Đồng nghiệp khó tính", 1.0)])
+
+    assert index.search(["kho", "tinh"]) == {1: 2.0, 2: 2.0}
+    assert index.search(["sep"]) == {1: 1.5}
+    assert index.search(["kho"], [["sep"]]) == {2: 1.0}
+    assert index.search(["kho"], [["sep", "dong"]]) == {1: 1.0, 2: 1.0}
+
+    index.add(1, [("Đồng nghiệp", 1.0)])
+    index.remove(2)
+    assert index.search(["kho"]) == {}
+    assert index.search(["nghiep"]) == {1: 1.0}
+    assert len(index) == 1
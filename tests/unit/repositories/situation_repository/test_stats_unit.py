@@ -0,0 +1,84 @@
+from sqlalchemy.orm import Session
+
+from app.models import Comment, Reaction, Situation, Topic, User
+from app.repositories.comment_repository import CommentRepository
+from app.repositories.reaction_repository import ReactionRepository
+from app.repositories.situation_repository import SituationRepository
+
+
+def _setup(db: Session):
+    user = User(email="stats_user@example.com", name="StatsUser")
+    topic = Topic(name="RepoTopicStats")
+    db.add_all([user, topic])
+    db.commit()
+    sit = Situation(topic_id=topic.id, user_id=user.id, context="ctx", question="q?")
+    db.add(sit)
+    db.commit()
+    db.refresh(sit)
+    return user, sit
+
+
+def _stats(db: Session, situation_id: int):
+    sit = db.get(Situation, situation_id)
+    db.refresh(sit)
+    return (
+        sit.comments_count,
+        sit.reactions_count,
+        sit.upvotes_count,
+        sit.downvotes_count,
+    )
+
+
+def test_counters_follow_comment_writes(db_session: Session):
+    repo = CommentRepository()
+    user, sit = _setup(db_session)
+
+    c1 = repo.create_with_sentiment(
+        db_session, {"situation_id": sit.id, "content": "a"}, user.id
+    )
+    repo.create(
+        db_session, {"situation_id": sit.id, "user_id": user.id, "content": "b"}
+    )
+    assert _stats(db_session, sit.id) == (2, 0, 0, 0)
+
+    repo.delete(db_session, c1.id)
+    assert _stats(db_session, sit.id) == (1, 0, 0, 0)
+
+
+def test_counters_follow_reaction_writes(db_session: Session):
+    repo = ReactionRepository()
+    user, sit = _setup(db_session)
+
+    r = repo.create(
+        db_session,
+        {"situation_id": sit.id, "user_id": user.id, "reaction_type": "upvote"},
+    )
+    assert _stats(db_session, sit.id) == (0, 1, 1, 0)
+
+    repo.update_reaction(db_session, r.id, "downvote")
+    assert _stats(db_session, sit.id) == (0, 1, 0, 1)
+
+    repo.update_reaction(db_session, r.id, "downvote")
+    assert _stats(db_session, sit.id) == (0, 1, 0, 1)
+
+    repo.delete(db_session, r.id)
+    assert _stats(db_session, sit.id) == (0, 0, 0, 0)
+
+
+def test_reconcile_stats_repairs_drift(db_session: Session):
+    repo = SituationRepository()
+    user, sit = _setup(db_session)
+    # Direct inserts bypass the repositories, leaving the counters stale
+    db_session.add_all(
+        [
+            Comment(situation_id=sit.id, user_id=user.id, content="x"),
+            Reaction(situation_id=sit.id, user_id=user.id, reaction_type="upvote"),
+            Reaction(situation_id=sit.id, user_id=user.id, reaction_type="downvote"),
+        ]
+    )
+    db_session.commit()
+    assert _stats(db_session, sit.id) == (0, 0, 0, 0)
+
+    assert repo.reconcile_stats(db_session, batch_size=1) >= 1
+    assert _stats(db_session, sit.id) == (1, 2, 1, 1)
+    assert repo.reconcile_stats(db_session) == 0
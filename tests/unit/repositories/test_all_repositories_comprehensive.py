@@ -202,7 +202,7 @@ class TestCommentRepository:
             Comment(id=1, content="Comment 1", situation_id=1),
             Comment(id=2, content="Comment 2", situation_id=1),
         ]
-        mock_db_session.query().filter().all.return_value = comments
+        mock_db_session.scalars.return_value.all.return_value = comments
 
         result = repo.get_by_situation(mock_db_session, 1)
 
@@ -0,0 +1,59 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.repositories.user_repository import UserRepository
+
+NAMES = ["Nguyễn Văn An", "Trần Đức Anh", "Ana", "Lê Thị Hoa", "100%_real", "Anh"]
+
+
+def make_db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine, autoflush=False, autocommit=False)()
+    repo = UserRepository()
+    for i, name in enumerate(NAMES):
+        repo.create_user(db, {"google_id": f"g{i}", "email": f"u{i}@x", "name": name})
+    return db
+
+
+def _names(users):
+    return [u.name for u in users]
+
+
+def test_search_ignores_case_and_vietnamese_accents():
+    db = make_db()
+    repo = UserRepository()
+
+    assert _names(repo.search_users_by_name(db, "duc")) == ["Trần Đức Anh"]
+    assert _names(repo.search_users_by_name(db, "NGUYỄN")) == ["Nguyễn Văn An"]
+    assert _names(repo.search_users_by_name(db, "thi hoa")) == ["Lê Thị Hoa"]
+
+
+def test_search_ranks_by_similarity():
+    db = make_db()
+
+    names = _names(UserRepository().search_users_by_name(db, "anh", limit=10))
+
+    assert names[0] == "Anh"
+    assert set(names) == {"Anh", "Trần Đức Anh"}
+
+
+def test_search_treats_like_wildcards_literally():
+    db = make_db()
+    repo = UserRepository()
+
+    assert _names(repo.search_users_by_name(db, "0%_")) == ["100%_real"]
+    assert repo.search_users_by_name(db, "%%") == []
+
+
+def test_list_users_search_is_ranked_and_paginated():
+    db = make_db()
+    repo = UserRepository()
+
+    first = repo.list_users(db, search="an", page=1, size=2)
+    second = repo.list_users(db, search="an", page=2, size=2)
+
+    assert len(first) == 2
+    assert not set(_names(first)) & set(_names(second))
+    assert first[0].name in {"Ana", "Anh"}
@@ -0,0 +1,221 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.services.analysis_service as analysis_service_module
+from app.core.config import settings
+from app.core.database import Base
+from app.core.exceptions import ServiceUnavailableError
+from app.models import Answer, Situation
+from app.repositories.answer_repository import AnswerRepository
+from app.schemas.analysis import AnswerCreate
+from app.services.analysis_service import AnalysisService, analysis_queue
+
+
+class FakeOpenAI:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    async def analyze_eq(self, context, question, answer_text):
+        self.calls += 1
+        return self.result
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(analysis_service_module, "SessionLocal", factory)
+    with factory() as db:
+        db.add(Situation(context="ctx", question="q?"))
+        db.commit()
+    yield factory
+    engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def queue():
+    yield analysis_queue
+    await analysis_queue.stop()
+
+
+def _service(result):
+    svc = AnalysisService()
+    svc.openai_service = FakeOpenAI(result)
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_submit_answer_completes_in_background(factory, queue):
+    svc = _service(({"empathy": 8}, {"empathy": "ok"}))
+
+    pending = await svc.submit_answer(
+        AnswerCreate(situation_id=1, answer_text="a"), user_id=None
+    )
+    assert pending.status == "pending"
+    assert pending.scores == {}
+
+    await queue.join()
+
+    done = svc.get_answer(pending.id)
+    assert done.status == "completed"
+    assert done.scores == {"empathy": 8}
+    assert done.question == "q?"
+
+
+@pytest.mark.asyncio
+async def test_unparseable_reply_marks_answer_failed(factory, queue):
+    svc = _service({"scores": {}, "reasoning": {}, "error": "no json"})
+
+    pending = await svc.submit_answer(AnswerCreate(situation_id=1, answer_text="a"))
+    await queue.join()
+
+    failed = svc.get_answer(pending.id)
+    assert failed.status == "failed"
+    assert failed.error == "no json"
+    with factory() as db:
+        assert svc.answer_repo.get_by_situation(db, 1) == []
+
+
+@pytest.mark.asyncio
+async def test_recover_pending_requeues_unfinished_answers(factory, queue):
+    with factory() as db:
+        db.add(Answer(situation_id=1, answer_text="left over", status="pending"))
+        db.add(Answer(situation_id=1, answer_text="done", scores="{}"))
+        db.commit()
+    svc = _service(({"empathy": 5}, {"empathy": "r"}))
+
+    assert await svc.recover_pending() == 1
+    await queue.join()
+
+    assert svc.openai_service.calls == 1
+    with factory() as db:
+        assert {a.status for a in db.query(Answer)} == {"completed"}
+
+
+@pytest.mark.asyncio
+async def test_submit_answer_marks_answer_failed_when_queue_is_full(
+    factory, queue, monkeypatch
+):
+    def full(job, *args):
+        raise ServiceUnavailableError("The analysis queue is full, retry later")
+
+    monkeypatch.setattr(analysis_queue, "enqueue", full)
+    svc = _service(({"empathy": 8}, {"empathy": "ok"}))
+
+    with pytest.raises(ServiceUnavailableError):
+        await svc.submit_answer(AnswerCreate(situation_id=1, answer_text="a"))
+
+    with factory() as db:
+        answer = db.query(Answer).one()
+    assert answer.status == "failed"
+    assert answer.error == "The analysis queue is full, retry later"
+
+
+@pytest.mark.asyncio
+async def test_recover_pending_skips_answers_claimed_by_a_live_process(factory, queue):
+    stale = datetime.now(timezone.utc) - timedelta(
+        seconds=settings.analysis_claim_timeout_seconds + 60
+    )
+    with factory() as db:
+        db.add(Answer(situation_id=1, answer_text="stale", status="pending"))
+        db.add(Answer(situation_id=1, answer_text="b", status="pending"))
+        db.commit()
+        db.query(Answer).filter(Answer.answer_text == "stale").update(
+            {"claimed_at": stale}
+        )
+        db.commit()
+    svc = _service(({"empathy": 5}, {"empathy": "r"}))
+    live = await svc.submit_answer(AnswerCreate(situation_id=1, answer_text="c"))
+    await queue.join()
+    svc.openai_service.calls = 0
+
+    with factory() as db:
+        db.query(Answer).filter(Answer.id == live.id).update({"status": "pending"})
+        db.commit()
+
+    # A second replica starting up takes the stale and unclaimed answers only
+    assert await svc.recover_pending() == 2
+    assert await svc.recover_pending() == 0
+    await queue.join()
+
+    assert svc.openai_service.calls == 2
+    with factory() as db:
+        assert db.get(Answer, live.id).status == "pending"
+
+
+def test_complete_and_fail_leave_finished_answers_alone(factory):
+    repo = AnswerRepository()
+    with factory() as db:
+        db.add(Answer(situation_id=1, answer_text="a", status="pending"))
+        db.commit()
+
+        repo.complete(db, 1, {"empathy": 8}, {"empathy": "ok"})
+        repo.fail(db, 1, "late worker")
+        repo.complete(db, 1, {"empathy": 1}, {"empathy": "late"})
+
+        answer = db.get(Answer, 1)
+        db.refresh(answer)
+    assert answer.status == "completed"
+    assert answer.error is None
+    assert answer.scores == '{"empathy": 8}'
+
+
+def _age_claims(factory, seconds):
+    claimed_at = datetime.now(timezone.utc) - timedelta(seconds=seconds)
+    with factory() as db:
+        db.query(Answer).update({"claimed_at": claimed_at})
+        db.commit()
+
+
+@pytest.mark.asyncio
+async def test_refreshed_claims_of_queued_answers_are_not_recovered(
+    factory, monkeypatch
+):
+    queued = []
+    monkeypatch.setattr(analysis_service_module, "_claimed", set())
+    monkeypatch.setattr(
+        analysis_queue, "enqueue", lambda job, *args: queued.append(args[0])
+    )
+    svc = _service(({"empathy": 5}, {"empathy": "r"}))
+    pending = await svc.submit_answer(AnswerCreate(situation_id=1, answer_text="a"))
+
+    # Still waiting in this process's queue past the claim timeout
+    _age_claims(factory, settings.analysis_claim_timeout_seconds + 60)
+    await svc.refresh_claims()
+
+    # Another replica finds nothing to recover
+    monkeypatch.setattr(analysis_service_module, "_claimed", set())
+    assert await _service(None).recover_pending() == 0
+    assert queued == [pending.id]
+
+
+@pytest.mark.asyncio
+async def test_worker_refreshes_the_claim_when_it_picks_an_answer_up(factory):
+    with factory() as db:
+        db.add(Answer(situation_id=1, answer_text="a", status="pending"))
+        db.commit()
+    _age_claims(factory, settings.analysis_claim_timeout_seconds + 60)
+    svc = _service(None)
+    reclaimed = []
+
+    async def analyze_eq(context, question, answer_text):
+        reclaimed.extend(await asyncio.to_thread(svc._claim_pending, 10))
+        return {"empathy": 5}, {"empathy": "r"}
+
+    svc.openai_service.analyze_eq = analyze_eq
+    await svc.process_answer(1)
+
+    assert reclaimed == []
+    assert svc.get_answer(1).status == "completed"
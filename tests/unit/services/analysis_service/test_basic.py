@@ -56,7 +56,8 @@ class TestAnalysisService:
 
         return answer
 
-    def test_analyze_answer_success(
+    @pytest.mark.asyncio
+    async def test_analyze_answer_success(
         self,
         analysis_service,
         mock_situation_repo,
@@ -81,7 +82,7 @@ class TestAnalysisService:
             mock_analyze_eq.return_value = (scores, reasoning)
 
             # Act
-            result = analysis_service.analyze_answer(answer_in)
+            result = await analysis_service.analyze_answer(answer_in)
 
             # Assert
             mock_situation_repo.get.assert_called_once_with(ANY, 1)
@@ -96,7 +97,8 @@ class TestAnalysisService:
             assert isinstance(result, AnswerOut)
             assert result.situation_id == 1
 
-    def test_analyze_answer_situation_not_found(
+    @pytest.mark.asyncio
+    async def test_analyze_answer_situation_not_found(
         self, analysis_service, mock_situation_repo
     ):
         """Test answer analysis when situation not found."""
@@ -106,7 +108,7 @@ class TestAnalysisService:
 
         # Act & Assert
         with pytest.raises(NotFoundError) as exc_info:
-            analysis_service.analyze_answer(answer_in)
+            await analysis_service.analyze_answer(answer_in)
 
         assert "Situation" in str(exc_info.value)
         assert "999" in str(exc_info.value)
@@ -190,7 +192,8 @@ class TestAnalysisService:
         assert result_list == {}
         assert result_int == {}
 
-    def test_analyze_answer_with_openai_error(
+    @pytest.mark.asyncio
+    async def test_analyze_answer_with_openai_error(
         self,
         analysis_service,
         mock_situation_repo,
@@ -212,7 +215,7 @@ class TestAnalysisService:
 
             # Act & Assert
             with pytest.raises(Exception):
-                analysis_service.analyze_answer(answer_in)
+                await analysis_service.analyze_answer(answer_in)
 
     def test_get_answers_by_situation_empty_result(
         self, analysis_service, mock_answer_repo
@@ -0,0 +1,72 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.services.analysis_service as analysis_service_module
+from app.core.database import Base
+from app.models import Answer, Situation
+from app.schemas.analysis import AnswerCreate
+from app.services.analysis_service import AnalysisService
+
+
+class FakeOpenAI:
+    async def analyze_eq_batch(self, items):
+        return [
+            {"error": "unparseable"} if text == "bad" else ({"empathy": 7}, {})
+            for _, _, text in items
+        ]
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(analysis_service_module, "SessionLocal", factory)
+    with factory() as db:
+        db.add_all(
+            [
+                Situation(context="c1", question="q1"),
+                Situation(context="c2", question="q2"),
+            ]
+        )
+        db.commit()
+    yield factory
+    engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_reports_per_item_and_bulk_inserts(factory):
+    svc = AnalysisService()
+    svc.openai_service = FakeOpenAI()
+    bulk_calls = []
+    original = svc.answer_repo.bulk_create_with_analysis
+
+    def _spy(db, rows):
+        bulk_calls.append(len(rows))
+        return original(db, rows)
+
+    svc.answer_repo.bulk_create_with_analysis = _spy
+    results = await svc.analyze_batch(
+        [
+            AnswerCreate(situation_id=1, answer_text="good"),
+            AnswerCreate(situation_id=99, answer_text="orphan"),
+            AnswerCreate(situation_id=2, answer_text="bad"),
+            AnswerCreate(situation_id=2, answer_text="also good"),
+        ],
+        user_id=None,
+    )
+
+    assert [r.success for r in results] == [True, False, False, True]
+    assert results[1].error == "Situation with id 99 not found"
+    assert results[2].error == "unparseable"
+    assert results[3].answer.context == "c2"
+    assert results[3].answer.scores == {"empathy": 7}
+    assert bulk_calls == [2]
+    with factory() as db:
+        assert db.query(Answer).count() == 2
@@ -0,0 +1,79 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+import app.services.analysis_service as analysis_service_module
+from app.core.database import Base, RequestSession, request_session
+from app.models import Situation
+from app.schemas.analysis import AnswerCreate
+from app.services.analysis_service import AnalysisService
+
+
+class PoolProbeOpenAI:
+    """Records how many pooled connections are checked out during each call."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.checked_out = []
+
+    async def analyze_eq(self, context, question, answer_text):
+        self.checked_out.append(self.engine.pool.checkedout())
+        return {"empathy": 8}, {"empathy": "ok"}
+
+    async def analyze_eq_batch(self, items):
+        self.checked_out.append(self.engine.pool.checkedout())
+        return [({"empathy": 8}, {"empathy": "ok"}) for _ in items]
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'analysis.db'}",
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(analysis_service_module, "SessionLocal", factory)
+    with factory() as db:
+        db.add(Situation(context="ctx", question="q?"))
+        db.commit()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def request_db(engine):
+    db = sessionmaker(class_=RequestSession, bind=engine)()
+    with request_session(db):
+        yield db
+    db.close()
+
+
+def _service(engine):
+    svc = AnalysisService()
+    svc.openai_service = PoolProbeOpenAI(engine)
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_analyze_answer_holds_no_connection_during_model_call(engine, request_db):
+    svc = _service(engine)
+
+    result = await svc.analyze_answer(AnswerCreate(situation_id=1, answer_text="a"))
+
+    assert result.scores == {"empathy": 8}
+    assert svc.openai_service.checked_out == [0]
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_holds_no_connection_during_model_call(engine, request_db):
+    svc = _service(engine)
+
+    results = await svc.analyze_batch(
+        [AnswerCreate(situation_id=1, answer_text="a")] * 2
+    )
+
+    assert all(item.success for item in results)
+    assert svc.openai_service.checked_out == [0]
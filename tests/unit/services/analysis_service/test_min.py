@@ -1,5 +1,5 @@
 from types import SimpleNamespace
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -11,7 +11,8 @@ def make_answer_create(situation_id: int, text: str):
     return SimpleNamespace(situation_id=situation_id, answer_text=text)
 
 
-def test_analyze_answer_happy_path(monkeypatch):
+@pytest.mark.asyncio
+async def test_analyze_answer_happy_path(monkeypatch):
     # Mock repos and openai path
     answer_repo = Mock()
     situation_repo = Mock()
@@ -26,7 +27,9 @@ def test_analyze_answer_happy_path(monkeypatch):
     monkeypatch.setattr(
         service,
         "openai_service",
-        SimpleNamespace(analyze_eq=lambda c, q, a: ({"empathy": 7}, {"empathy": "ok"})),
+        SimpleNamespace(
+            analyze_eq=AsyncMock(return_value=({"empathy": 7}, {"empathy": "ok"}))
+        ),
     )
 
     # Repo create returns answer-like object
@@ -42,7 +45,7 @@ def test_analyze_answer_happy_path(monkeypatch):
     # AnalysisService branches to create_answer (not create_answer_with_analysis) when repo is not AnswerRepository instance
     answer_repo.create_answer.return_value = db_answer
 
-    out = service.analyze_answer(make_answer_create(1, "hello"))
+    out = await service.analyze_answer(make_answer_create(1, "hello"))
     assert out.id == 10
     assert out.scores["empathy"] == 7
     assert out.reasoning["empathy"] == "ok"
@@ -50,13 +53,14 @@ def test_analyze_answer_happy_path(monkeypatch):
     assert out.question == "q"
 
 
-def test_analyze_answer_situation_not_found():
+@pytest.mark.asyncio
+async def test_analyze_answer_situation_not_found():
     service = AnalysisService(
         answer_repo=Mock(), situation_repo=Mock(), sentiment_service=Mock()
     )
     service.situation_repo.get.return_value = None
     with pytest.raises(Exception):
-        service.analyze_answer(make_answer_create(999, "x"))
+        await service.analyze_answer(make_answer_create(999, "x"))
 
 
 def test_safe_json_loads_variants():
@@ -39,7 +39,7 @@ class DummyOpenAI:
     def __init__(self, payload=None):
         self.payload = payload or ({"self_awareness": 7}, {"self_awareness": "ok"})
 
-    def analyze_eq(self, c, q, a):
+    async def analyze_eq(self, c, q, a):
         return self.payload
 
 
@@ -67,7 +67,8 @@ def test_safe_json_loads_variants():
     assert svc.safe_json_loads(123) == {}
 
 
-def test_analyze_answer_ok(monkeypatch):
+@pytest.mark.asyncio
+async def test_analyze_answer_ok(monkeypatch):
     svc = AnalysisService(
         answer_repo=DummyAnswerRepo(),
         situation_repo=DummySituationRepo(),
@@ -75,19 +76,20 @@ def test_analyze_answer_ok(monkeypatch):
     )
     monkeypatch.setattr(svc, "openai_service", DummyOpenAI())
 
-    out = svc.analyze_answer(AnswerIn())
+    out = await svc.analyze_answer(AnswerIn())
     assert out.scores["self_awareness"] == 7
     assert out.question == "Q?"
     assert out.context == "CTX"
 
 
-def test_analyze_answer_situation_not_found(monkeypatch):
+@pytest.mark.asyncio
+async def test_analyze_answer_situation_not_found(monkeypatch):
     svc = AnalysisService(
         answer_repo=DummyAnswerRepo(),
         situation_repo=DummySituationRepo(situation=None),
     )
     with pytest.raises(NotFoundError):
-        svc.analyze_answer(AnswerIn(situation_id=999))
+        await svc.analyze_answer(AnswerIn(situation_id=999))
 
 
 def test_get_answers_by_situation_maps_fields(monkeypatch):
@@ -0,0 +1,59 @@
+import pytest
+
+from app.models import Comment, Reaction, Situation, User
+from app.services.comment_service import CommentService
+from app.services.reaction_service import ReactionService
+from app.services.user_service import UserService
+
+
+def _seed(factory):
+    with factory() as db:
+        user = User(email="async-comments@ex.com", name="Commenter")
+        situation = Situation(context="c", question="q?")
+        db.add_all([user, situation])
+        db.commit()
+        db.add_all(
+            [
+                Comment(situation_id=situation.id, user_id=user.id, content="one"),
+                Comment(situation_id=situation.id, user_id=user.id, content="two"),
+                Reaction(
+                    situation_id=situation.id, user_id=user.id, reaction_type="upvote"
+                ),
+            ]
+        )
+        db.commit()
+        return situation.id
+
+
+@pytest.mark.asyncio
+async def test_get_comments_by_situation_async(async_session_factory):
+    situation_id = _seed(async_session_factory)
+    svc = CommentService()
+
+    comments = await svc.get_comments_by_situation_async(situation_id)
+
+    assert [c.content for c in comments] == ["one", "two"]
+    assert comments[0].user["name"] == "Commenter"
+    assert comments == svc.get_comments_by_situation(situation_id)
+
+
+@pytest.mark.asyncio
+async def test_get_reactions_by_situation_async(async_session_factory):
+    situation_id = _seed(async_session_factory)
+
+    reactions = await ReactionService().get_reactions_by_situation_async(situation_id)
+
+    assert len(reactions) == 1
+    assert reactions[0].reaction_type == "upvote"
+    assert reactions[0].user.name == "Commenter"
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_email_async(async_session_factory):
+    _seed(async_session_factory)
+    svc = UserService()
+
+    user = await svc.get_user_by_email_async("async-comments@ex.com")
+
+    assert user.name == "Commenter"
+    assert await svc.get_user_by_email_async("missing@ex.com") is None
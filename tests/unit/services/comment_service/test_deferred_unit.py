@@ -0,0 +1,64 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from app.core.config import settings
+from app.schemas.comments import CommentCreate
+from app.services.comment_service import CommentService
+from app.services.sentiment_service import SentimentService, get_sentiment_backend
+
+
+class UpbeatBackend:
+    def analyze_sentiment(self, content):
+        return {"sentiment": "positive", "score": 1.0}
+
+
+def _created(comment_id=7):
+    return SimpleNamespace(
+        id=comment_id,
+        content="c",
+        situation_id=2,
+        user_id=3,
+        created_at=datetime(2026, 1, 1),
+        user=None,
+        sentiment_analysis=None,
+    )
+
+
+def test_deferred_mode_inserts_unscored_and_defers_scoring(monkeypatch):
+    monkeypatch.setattr(settings, "sentiment_mode", "deferred")
+    repo, sentiment, deferred = Mock(), Mock(), []
+    repo.create_with_sentiment.return_value = _created()
+    service = CommentService(repo=repo, sentiment_service=sentiment)
+
+    out = service.create_comment(
+        CommentCreate(situation_id=2, content="c"),
+        user_id=3,
+        defer=lambda fn, *args: deferred.append((fn, args)),
+    )
+
+    assert out.id == 7 and out.sentiment_analysis is None
+    _, payload, user_id = repo.create_with_sentiment.call_args.args
+    assert (payload, user_id) == ({"situation_id": 2, "content": "c"}, 3)
+    sentiment.analyze_sentiment.assert_not_called()
+    assert deferred == [(service.score_comment, (7, 2, "c"))]
+
+
+def test_deferred_mode_without_scheduler_scores_inline(monkeypatch):
+    monkeypatch.setattr(settings, "sentiment_mode", "deferred")
+    repo, sentiment = Mock(), Mock()
+    sentiment.analyze_sentiment.return_value = {"sentiment": "neutral"}
+    repo.create_with_sentiment.return_value = _created()
+
+    CommentService(repo=repo, sentiment_service=sentiment).create_comment(
+        CommentCreate(situation_id=2, content="c"), user_id=3
+    )
+
+    sentiment.analyze_sentiment.assert_called_once_with("c")
+
+
+def test_get_sentiment_backend_loads_configured_class():
+    assert isinstance(get_sentiment_backend("keyword"), SentimentService)
+    backend = get_sentiment_backend(f"{__name__}:UpbeatBackend")
+    assert isinstance(backend, UpbeatBackend)
+    assert get_sentiment_backend(f"{__name__}:UpbeatBackend") is backend
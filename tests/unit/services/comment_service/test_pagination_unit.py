@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.core.exceptions import ValidationError
+from app.models import Comment, Situation, User
+from app.services.comment_service import CommentService
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _seed(factory):
+    """Five comments; the middle three share a timestamp, so ids break ties."""
+    with factory() as db:
+        user = User(email="pages@ex.com", name="Pager", picture="p.png")
+        situation = Situation(context="c", question="q?")
+        db.add_all([user, situation])
+        db.commit()
+        offsets = [0, 1, 1, 1, 2]
+        db.add_all(
+            Comment(
+                situation_id=situation.id,
+                user_id=user.id,
+                content=f"c{i}",
+                created_at=START + timedelta(minutes=offset),
+            )
+            for i, offset in enumerate(offsets)
+        )
+        db.commit()
+        return situation.id
+
+
+def _contents(page):
+    return [c.content for c in page["items"]]
+
+
+def test_pages_forward_and_back_without_gaps(async_session_factory):
+    situation_id = _seed(async_session_factory)
+    svc = CommentService()
+
+    first = svc.get_comments_page(situation_id, limit=2)
+    second = svc.get_comments_page(
+        situation_id, after=first["pagination"]["next_cursor"], limit=2
+    )
+    third = svc.get_comments_page(
+        situation_id, after=second["pagination"]["next_cursor"], limit=2
+    )
+    back = svc.get_comments_page(
+        situation_id, before=second["pagination"]["prev_cursor"], limit=2
+    )
+
+    assert [_contents(p) for p in (first, second, third)] == [
+        ["c0", "c1"],
+        ["c2", "c3"],
+        ["c4"],
+    ]
+    assert first["pagination"]["has_prev"] is False
+    assert third["pagination"]["has_next"] is False
+    assert third["pagination"]["next_cursor"] is None
+    assert back == first | {"pagination": back["pagination"]}
+    assert back["pagination"]["has_next"] is True
+    assert first["items"][0].user == {
+        "id": first["items"][0].user_id,
+        "email": "pages@ex.com",
+        "name": "Pager",
+        "picture": "p.png",
+    }
+
+
+def test_empty_before_returns_newest_page(async_session_factory):
+    situation_id = _seed(async_session_factory)
+
+    page = CommentService().get_comments_page(situation_id, before="", limit=2)
+
+    assert _contents(page) == ["c3", "c4"]
+    assert page["pagination"]["has_prev"] is True
+    assert page["pagination"]["has_next"] is False
+
+
+def test_page_is_one_query(async_session_factory):
+    situation_id = _seed(async_session_factory)
+    engine = async_session_factory.kw["bind"]
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(1))
+
+    CommentService().get_comments_page(situation_id, limit=10)
+
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_page_matches_sync(async_session_factory):
+    situation_id = _seed(async_session_factory)
+    svc = CommentService()
+
+    page = await svc.get_comments_page_async(situation_id, limit=3)
+
+    assert page == svc.get_comments_page(situation_id, limit=3)
+
+
+def test_rejects_both_cursors(async_session_factory):
+    with pytest.raises(ValidationError):
+        CommentService().get_comments_page(1, after="", before="")
@@ -0,0 +1,189 @@
+import json
+import types
+
+import pytest
+
+import app.services.openai_service as openai_service_module
+from app.core.cache import cache
+from app.core.config import settings
+from app.services.openai_service import (
+    BATCH_PROMPT_VERSION,
+    EQ_PILLARS,
+    PROMPT_VERSION,
+    OpenAIService,
+    _batch_message,
+    analysis_cache_key,
+    pack_batches,
+)
+
+
+def _scores(value):
+    return {pillar: value for pillar in EQ_PILLARS}
+
+
+def _reply(items):
+    return json.dumps(
+        {
+            "results": [
+                {"item": i, "scores": _scores(i), "reasoning": _scores("r")}
+                for i in items
+            ]
+        }
+    )
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    calls = []
+    replies = []
+
+    async def create(**kwargs):
+        calls.append(kwargs["messages"][1]["content"])
+        reply = replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return types.SimpleNamespace(
+            choices=[
+                types.SimpleNamespace(message=types.SimpleNamespace(content=reply))
+            ]
+        )
+
+    client = types.SimpleNamespace(
+        chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create))
+    )
+
+    class Limiter:
+        async def __aenter__(self):
+            return None
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(
+        openai_service_module, "_shared_client", lambda: (client, Limiter())
+    )
+    return types.SimpleNamespace(calls=calls, replies=replies)
+
+
+def test_pack_batches_respects_item_cap_and_groups_situations():
+    items = [(i, f"ctx{i % 2}", "q?", "answer") for i in range(5)]
+
+    batches = pack_batches(items, token_budget=10_000, max_items=2)
+
+    assert [len(b) for b in batches] == [2, 2, 1]
+    # Sorted by situation so the shared context is stated once per batch
+    assert {b[0][1] for b in batches[:1]} == {"ctx0"}
+    assert sorted(i for b in batches for i, *_ in b) == [0, 1, 2, 3, 4]
+
+
+def test_pack_batches_respects_token_budget():
+    items = [(i, "ctx", "q?", "x" * 400) for i in range(4)]
+
+    batches = pack_batches(items, token_budget=250, max_items=10)
+
+    assert [len(b) for b in batches] == [2, 2]
+
+
+def test_batch_message_states_each_situation_once():
+    message = _batch_message([(0, "ctx", "q?", "a0"), (3, "ctx", "q?", "a3")])
+
+    assert message.count("SITUATION 1: ctx") == 1
+    assert "ITEM 0 (SITUATION 1)" in message
+    assert "ITEM 3 (SITUATION 1)" in message
+
+
+@pytest.mark.asyncio
+async def test_analyze_eq_batch_maps_results_and_missing_items(
+    fake_client, monkeypatch
+):
+    monkeypatch.setattr(settings, "analysis_batch_max_items", 10)
+    fake_client.replies.append(_reply([0, 2]))
+
+    results = await OpenAIService().analyze_eq_batch(
+        [("ctx", "q?", "a"), ("ctx", "q?", "b"), ("ctx", "q?", "c")]
+    )
+
+    assert len(fake_client.calls) == 1
+    assert results[0] == (_scores(0), _scores("r"))
+    assert results[1] == {"error": "Missing from model reply"}
+    assert results[2][0] == _scores(2)
+
+
+@pytest.mark.asyncio
+async def test_analyze_eq_batch_failed_call_only_fails_its_batch(
+    fake_client, monkeypatch
+):
+    monkeypatch.setattr(settings, "analysis_batch_max_items", 1)
+    fake_client.replies.extend([RuntimeError("rate limited"), _reply([1])])
+
+    results = await OpenAIService().analyze_eq_batch(
+        [("ctx", "q?", "a"), ("ctx", "q?", "b")]
+    )
+
+    assert results[0] == {"error": "rate limited"}
+    assert results[1][0] == _scores(1)
+
+
+@pytest.mark.asyncio
+async def test_analyze_eq_batch_skips_cached_items(fake_client, monkeypatch):
+    monkeypatch.setattr(settings, "cache_enabled", True)
+    monkeypatch.setattr(cache, "_redis_retry_at", float("inf"))
+    cache.clear_local()
+    cache.set(
+        openai_service_module.ANALYSIS_CACHE_NAMESPACE,
+        analysis_cache_key("ctx", "q?", "known", version=BATCH_PROMPT_VERSION),
+        {"scores": _scores(9), "reasoning": _scores("r"), "latency": 1.0},
+    )
+    fake_client.replies.append(_reply([1]))
+
+    results = await OpenAIService().analyze_eq_batch(
+        [("ctx", "q?", "known"), ("ctx", "q?", "new")]
+    )
+    cache.clear_local()
+
+    assert results[0] == (_scores(9), _scores("r"))
+    assert "ITEM 0" not in fake_client.calls[0]
+    assert results[1][0] == _scores(1)
+
+
+def test_batch_results_are_cached_apart_from_single_analyses():
+    single = analysis_cache_key("ctx", "q?", "a")
+
+    assert analysis_cache_key("ctx", "q?", "a", version=PROMPT_VERSION) == single
+    assert analysis_cache_key("ctx", "q?", "a", version=BATCH_PROMPT_VERSION) != single
+    assert BATCH_PROMPT_VERSION == openai_service_module.prompt_version(
+        openai_service_module.SITUATION_BATCH_ANALYZE_PROMPT
+    )
+
+
+@pytest.mark.asyncio
+async def test_analyze_eq_batch_rejects_and_does_not_cache_incomplete_items(
+    fake_client, monkeypatch
+):
+    monkeypatch.setattr(settings, "cache_enabled", True)
+    monkeypatch.setattr(cache, "_redis_retry_at", float("inf"))
+    monkeypatch.setattr(settings, "analysis_batch_max_items", 10)
+    cache.clear_local()
+    fake_client.replies.append(
+        json.dumps(
+            {
+                "results": [
+                    {"item": 0, "scores": {"empathy": 5}, "reasoning": {}},
+                    {"item": 1, "scores": _scores(6), "reasoning": _scores("r")},
+                ]
+            }
+        )
+    )
+
+    results = await OpenAIService().analyze_eq_batch(
+        [("ctx", "q?", "partial"), ("ctx", "q?", "full")]
+    )
+    cached = cache.get(
+        openai_service_module.ANALYSIS_CACHE_NAMESPACE,
+        analysis_cache_key("ctx", "q?", "partial", version=BATCH_PROMPT_VERSION),
+    )
+    cache.clear_local()
+
+    assert results[0] == {"error": "Incomplete analysis in model reply"}
+    assert results[1][0] == _scores(6)
+    assert cached is None
@@ -0,0 +1,83 @@
+import json
+import types
+
+import pytest
+
+import app.services.openai_service as openai_service_module
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.metrics import EQ_ANALYSIS_CACHE_SAVED_SECONDS
+from app.services.openai_service import OpenAIService, analysis_cache_key
+
+
+@pytest.fixture
+def cached(monkeypatch):
+    monkeypatch.setattr(settings, "cache_enabled", True)
+    monkeypatch.setattr(cache, "_redis_retry_at", float("inf"))
+    cache.clear_local()
+    yield
+    cache.clear_local()
+
+
+@pytest.fixture
+def model(monkeypatch):
+    calls = []
+    replies = {"content": json.dumps({"scores": {"empathy": 6}, "reasoning": {}})}
+
+    async def fake_uncached(self, situation, question, answer_text):
+        calls.append(answer_text)
+        reply = replies["content"]
+        if reply is None:
+            return {"scores": {}, "reasoning": {}, "error": "parse"}
+        payload = json.loads(reply)
+        return payload["scores"], payload["reasoning"]
+
+    monkeypatch.setattr(OpenAIService, "_analyze_eq_uncached", fake_uncached)
+    return types.SimpleNamespace(calls=calls, replies=replies)
+
+
+def test_cache_key_normalizes_answer_but_not_context():
+    base = analysis_cache_key("ctx", "q?", "Tôi sẽ  lắng nghe")
+
+    assert analysis_cache_key("ctx", "q?", "  tôi sẽ lắng NGHE\n") == base
+    assert analysis_cache_key("ctx", "other?", "Tôi sẽ lắng nghe") != base
+    assert analysis_cache_key("ctx2", "q?", "Tôi sẽ lắng nghe") != base
+
+
+def test_cache_key_changes_with_model(monkeypatch):
+    base = analysis_cache_key("ctx", "q?", "a")
+    monkeypatch.setattr(settings, "openai_model", "another-model")
+
+    assert analysis_cache_key("ctx", "q?", "a") != base
+
+
+@pytest.mark.asyncio
+async def test_repeated_answer_is_served_from_cache(cached, model):
+    svc = OpenAIService()
+    saved_before = EQ_ANALYSIS_CACHE_SAVED_SECONDS._value.get()
+
+    first = await svc.analyze_eq("ctx", "q?", "Same answer")
+    second = await svc.analyze_eq("ctx", "q?", "same   answer")
+
+    assert first == second == ({"empathy": 6}, {})
+    assert model.calls == ["Same answer"]
+    assert EQ_ANALYSIS_CACHE_SAVED_SECONDS._value.get() >= saved_before
+
+
+@pytest.mark.asyncio
+async def test_failure_fallback_is_never_cached(cached, model):
+    model.replies["content"] = None
+    svc = OpenAIService()
+
+    first = await svc.analyze_eq("ctx", "q?", "answer")
+    await svc.analyze_eq("ctx", "q?", "answer")
+
+    assert "error" in first
+    assert len(model.calls) == 2
+    assert (
+        cache.get(
+            openai_service_module.ANALYSIS_CACHE_NAMESPACE,
+            analysis_cache_key("ctx", "q?", "answer"),
+        )
+        is None
+    )
@@ -0,0 +1,95 @@
+import json
+import types
+
+import pytest
+
+import app.services.openai_service as openai_service_module
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.metrics import EQ_ANALYSIS_TIME_TO_FIRST_PILLAR
+from app.services.openai_service import OpenAIService
+
+PAYLOAD = {
+    "scores": {"self_awareness": 7, "empathy": 8},
+    "reasoning": {"self_awareness": "Nhận ra cảm xúc", "empathy": "Lắng nghe"},
+}
+
+
+def _chunk(content):
+    return types.SimpleNamespace(
+        choices=[types.SimpleNamespace(delta=types.SimpleNamespace(content=content))]
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_client(monkeypatch):
+    monkeypatch.setattr(openai_service_module, "_client", None)
+    monkeypatch.setattr(openai_service_module, "_limiter", None)
+    monkeypatch.setattr(openai_service_module, "_client_loop", None)
+
+
+@pytest.fixture
+def model(monkeypatch):
+    state = types.SimpleNamespace(reply=json.dumps(PAYLOAD), calls=[])
+
+    async def stream(reply):
+        for start in range(0, len(reply), 5):
+            yield _chunk(reply[start : start + 5])
+
+    class FakeOpenAI:
+        def __init__(self, *args, **kwargs):
+            self.chat = types.SimpleNamespace(
+                completions=types.SimpleNamespace(create=self.create)
+            )
+
+        async def create(self, **kwargs):
+            state.calls.append(kwargs)
+            return stream(state.reply)
+
+    monkeypatch.setattr(openai_service_module.openai, "AsyncOpenAI", FakeOpenAI)
+    return state
+
+
+async def _collect(gen):
+    return [event async for event in gen]
+
+
+@pytest.mark.asyncio
+async def test_stream_emits_each_pillar_then_result(model):
+    observed_before = EQ_ANALYSIS_TIME_TO_FIRST_PILLAR._sum.get()
+
+    events = await _collect(OpenAIService().analyze_eq_stream("s", "q", "a"))
+
+    assert model.calls[0]["stream"] is True
+    assert events == [
+        (
+            "pillar",
+            {"pillar": "self_awareness", "score": 7, "reasoning": "Nhận ra cảm xúc"},
+        ),
+        ("pillar", {"pillar": "empathy", "score": 8, "reasoning": "Lắng nghe"}),
+        ("result", (PAYLOAD["scores"], PAYLOAD["reasoning"])),
+    ]
+    assert EQ_ANALYSIS_TIME_TO_FIRST_PILLAR._sum.get() > observed_before
+
+
+@pytest.mark.asyncio
+async def test_stream_rejects_truncated_reply(model):
+    model.reply = json.dumps(PAYLOAD)[:-10]
+
+    with pytest.raises(ValueError):
+        await _collect(OpenAIService().analyze_eq_stream("s", "q", "a"))
+
+
+@pytest.mark.asyncio
+async def test_stream_replays_cached_result_without_model_call(model, monkeypatch):
+    monkeypatch.setattr(settings, "cache_enabled", True)
+    monkeypatch.setattr(cache, "_redis_retry_at", float("inf"))
+    cache.clear_local()
+    svc = OpenAIService()
+
+    first = await _collect(svc.analyze_eq_stream("s", "q", "a"))
+    second = await _collect(svc.analyze_eq_stream("s", "q", "a"))
+    cache.clear_local()
+
+    assert len(model.calls) == 1
+    assert second == first
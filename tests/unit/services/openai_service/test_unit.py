@@ -3,6 +3,7 @@ import types
 
 import pytest
 
+import app.services.openai_service as openai_service_module
 from app.services.openai_service import OpenAIService
 
 
@@ -26,7 +27,15 @@ class DummyClient:
                 raise NotImplementedError
 
 
-def test_analyze_eq_ok(monkeypatch):
+@pytest.fixture(autouse=True)
+def fresh_client(monkeypatch):
+    monkeypatch.setattr(openai_service_module, "_client", None)
+    monkeypatch.setattr(openai_service_module, "_limiter", None)
+    monkeypatch.setattr(openai_service_module, "_client_loop", None)
+
+
+@pytest.mark.asyncio
+async def test_analyze_eq_ok(monkeypatch):
     svc = OpenAIService()
 
     def fake_create(**kwargs):
@@ -48,10 +57,10 @@ def test_analyze_eq_ok(monkeypatch):
         }
         return DummyResponse(content=json.dumps(payload))
 
-    # Patch openai.OpenAI().chat.completions.create
+    # Patch openai.AsyncOpenAI().chat.completions.create
     import openai
 
-    original_openai = openai.OpenAI
+    original_openai = openai.AsyncOpenAI
 
     class FakeOpenAI:
         def __init__(self, *args, **kwargs):
@@ -60,20 +69,21 @@ def test_analyze_eq_ok(monkeypatch):
         class chat:
             class completions:
                 @staticmethod
-                def create(**kwargs):
+                async def create(**kwargs):
                     return fake_create(**kwargs)
 
-    monkeypatch.setattr(openai, "OpenAI", FakeOpenAI)
+    monkeypatch.setattr(openai, "AsyncOpenAI", FakeOpenAI)
 
-    scores, reasoning = svc.analyze_eq("s", "q", "a")
+    scores, reasoning = await svc.analyze_eq("s", "q", "a")
     assert scores["empathy"] == 8
     assert reasoning["communication"] == "ok"
 
     # restore if needed
-    monkeypatch.setattr(openai, "OpenAI", original_openai)
+    monkeypatch.setattr(openai, "AsyncOpenAI", original_openai)
 
 
-def test_analyze_eq_parse_error(monkeypatch):
+@pytest.mark.asyncio
+async def test_analyze_eq_parse_error(monkeypatch):
     svc = OpenAIService()
 
     # Return non-JSON content
@@ -89,18 +99,19 @@ def test_analyze_eq_parse_error(monkeypatch):
         class chat:
             class completions:
                 @staticmethod
-                def create(**kwargs):
+                async def create(**kwargs):
                     return fake_create(**kwargs)
 
-    monkeypatch.setattr(openai, "OpenAI", FakeOpenAI)
+    monkeypatch.setattr(openai, "AsyncOpenAI", FakeOpenAI)
 
-    result = svc.analyze_eq("s", "q", "a")
+    result = await svc.analyze_eq("s", "q", "a")
     # On error path current implementation returns a dict with fallback
     assert isinstance(result, dict)
     assert "scores" in result and "reasoning" in result
 
 
-def test_analyze_eq_client_exception(monkeypatch):
+@pytest.mark.asyncio
+async def test_analyze_eq_client_exception(monkeypatch):
     svc = OpenAIService()
 
     def fake_create(**kwargs):
@@ -115,11 +126,48 @@ def test_analyze_eq_client_exception(monkeypatch):
         class chat:
             class completions:
                 @staticmethod
-                def create(**kwargs):
+                async def create(**kwargs):
                     return fake_create(**kwargs)
 
-    monkeypatch.setattr(openai, "OpenAI", FakeOpenAI)
+    monkeypatch.setattr(openai, "AsyncOpenAI", FakeOpenAI)
 
-    result = svc.analyze_eq("s", "q", "a")
-    assert isinstance(result, dict)
-    assert "error" in result
+    with pytest.raises(RuntimeError):
+        await svc.analyze_eq("s", "q", "a")
+
+
+@pytest.mark.asyncio
+async def test_analyze_eq_shares_client_and_limits_concurrency(monkeypatch):
+    import asyncio
+
+    import openai
+
+    created = []
+    in_flight = {"now": 0, "peak": 0}
+    payload = json.dumps({"scores": {"empathy": 5}, "reasoning": {"empathy": "r"}})
+
+    class FakeOpenAI:
+        def __init__(self, *args, **kwargs):
+            created.append(kwargs)
+            self.chat = types.SimpleNamespace(
+                completions=types.SimpleNamespace(create=self.create)
+            )
+
+        async def create(self, **kwargs):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return DummyResponse(content=payload)
+
+    monkeypatch.setattr(openai, "AsyncOpenAI", FakeOpenAI)
+    monkeypatch.setattr(openai_service_module.settings, "openai_max_concurrency", 2)
+    svc = OpenAIService()
+
+    results = await asyncio.gather(*(svc.analyze_eq("s", "q", "a") for _ in range(6)))
+
+    assert all(scores == {"empathy": 5} for scores, _ in results)
+    assert len(created) == 1
+    assert (
+        created[0]["max_retries"] == openai_service_module.settings.openai_max_retries
+    )
+    assert in_flight["peak"] == 2
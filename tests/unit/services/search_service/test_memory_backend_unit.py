@@ -0,0 +1,115 @@
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+import app.services.search_service as search_service_module
+from app.core.database import Base
+from app.models import Comment, Situation, Topic
+from app.services.search_service import SearchService, memory_backend
+
+
+@pytest.fixture
+def factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}", poolclass=NullPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(search_service_module, "SessionLocal", factory)
+    monkeypatch.setattr(search_service_module.settings, "search_backend", "auto")
+    memory_backend().reset()
+    with factory() as db:
+        db.add_all([Topic(id=1, name="Công việc"), Topic(id=2, name="Gia đình")])
+        db.add_all(
+            [
+                Situation(
+                    id=1,
+                    topic_id=1,
+                    question="Sếp phê bình bạn trước cả phòng",
+                    context="Cuộc họp sáng thứ hai",
+                ),
+                Situation(
+                    id=2,
+                    topic_id=2,
+                    question="Bố mẹ phê bình cách bạn tiêu tiền",
+                    context="Bữa cơm gia đình",
+                ),
+                Situation(
+                    id=3,
+                    topic_id=1,
+                    question="Đồng nghiệp nhận công của bạn",
+                    context="Sếp khen đồng nghiệp trong cuộc họp, không nhắc đến bạn",
+                ),
+            ]
+        )
+        db.add_all(
+            [
+                Comment(id=1, situation_id=1, content="Hãy bình tĩnh sau cuộc họp"),
+                Comment(id=2, situation_id=2, content="Nói chuyện với bố mẹ"),
+            ]
+        )
+        db.commit()
+    yield factory
+    memory_backend().reset()
+    engine.dispose()
+
+
+def _ids(result):
+    return [item["id"] for item in result["items"]]
+
+
+def test_search_is_accent_insensitive_and_ranks_question_matches_first(factory):
+    result = SearchService().search("cuoc hop sep")
+
+    assert _ids(result) == [1, 3]
+    assert "<mark>Sếp</mark>" in result["items"][0]["snippet"]
+    assert result["pagination"] == {"limit": 10, "next_cursor": None, "has_next": False}
+
+
+def test_search_filters_by_topic_and_excluded_terms(factory):
+    service = SearchService()
+
+    assert _ids(service.search("phê bình", topic_id=2)) == [2]
+    assert _ids(service.search("phê bình -gia")) == [1]
+    assert _ids(service.search("cuộc họp", kind="comments", topic_id=1)) == [1]
+    assert _ids(service.search("cuộc họp", kind="comments", topic_id=2)) == []
+
+
+def test_search_pages_with_cursor_without_duplicates(factory):
+    service = SearchService()
+
+    first = service.search("bạn", limit=2)
+    second = service.search("bạn", cursor=first["pagination"]["next_cursor"], limit=2)
+
+    assert first["pagination"]["has_next"] is True
+    assert second["pagination"]["has_next"] is False
+    assert sorted(_ids(first) + _ids(second)) == [1, 2, 3]
+
+
+def test_index_follows_orm_writes_after_commit(factory):
+    service = SearchService()
+    assert _ids(service.search("lương")) == []
+
+    with factory() as db:
+        db.add(Situation(id=4, topic_id=1, question="Xin tăng lương", context=""))
+        db.flush()
+        db.rollback()
+    assert _ids(service.search("lương")) == []
+
+    with factory() as db:
+        db.add(Situation(id=4, topic_id=1, question="Xin tăng lương", context=""))
+        db.delete(db.get(Situation, 2))
+        db.commit()
+    assert _ids(service.search("lương")) == [4]
+    assert _ids(service.search("phê bình")) == [1]
+
+
+def test_stale_hits_from_core_writes_are_dropped(factory):
+    service = SearchService()
+    assert _ids(service.search("phê bình")) == [2, 1]
+
+    with factory() as db:
+        db.execute(update(Situation).where(Situation.id == 1).values(question="Khác"))
+        db.commit()
+
+    assert _ids(service.search("phê bình")) == [2]
+    assert memory_backend().indexes["situations"].search(["khac"]) == {1: 1.0}
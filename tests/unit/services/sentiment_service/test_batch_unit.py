@@ -0,0 +1,32 @@
+from app.core.config import settings
+from app.services.sentiment_service import SentimentService, shutdown_pool
+
+
+def test_analyze_many_keeps_input_order_and_reports_item_errors():
+    svc = SentimentService()
+    texts = ["Tôi rất vui và hạnh phúc", "   ", "Tôi rất chán và mệt mỏi"]
+
+    items = svc.analyze_many(texts)
+
+    assert [item["index"] for item in items] == [0, 1, 2]
+    assert items[0]["success"] and items[0]["result"]["sentiment"] == "positive"
+    assert items[1] == {
+        "index": 1,
+        "success": False,
+        "result": None,
+        "error": "Content cannot be empty",
+    }
+    assert items[2]["result"] == svc.analyze_sentiment(texts[2])
+
+
+def test_analyze_many_fans_out_to_process_pool(monkeypatch):
+    monkeypatch.setattr(settings, "sentiment_pool_workers", 2)
+    monkeypatch.setattr(settings, "sentiment_pool_min_batch", 4)
+    texts = ["vui", "buồn", "", "hôm nay đi làm", "tuyệt"]
+    try:
+        pooled = SentimentService().analyze_many(texts)
+    finally:
+        shutdown_pool()
+
+    monkeypatch.setattr(settings, "sentiment_pool_workers", 0)
+    assert pooled == SentimentService().analyze_many(texts)
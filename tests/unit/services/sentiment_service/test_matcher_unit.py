@@ -0,0 +1,49 @@
+import json
+import unicodedata
+
+from app.services.sentiment_service import (
+    KeywordMatcher,
+    SentimentService,
+    get_matcher,
+)
+
+
+def test_matcher_requires_whole_words():
+    matcher = KeywordMatcher({"negative": ["vl", "buồn"], "positive": ["vui"]})
+
+    assert matcher.find("cái vlog này vui vẻ") == {
+        "negative": set(),
+        "positive": {"vui"},
+    }
+    assert matcher.find("Buồn vl!") == {"negative": {"buồn", "vl"}, "positive": set()}
+
+
+def test_matcher_prefers_longest_keyword_and_allows_extra_spaces():
+    matcher = KeywordMatcher({"negative": ["mệt", "mệt mỏi", "khó chịu"]})
+
+    assert matcher.find("mệt  mỏi và KHÓ\nchịu") == {
+        "negative": {"mệt mỏi", "khó chịu"}
+    }
+    assert matcher.find("mệt mỏing") == {"negative": {"mệt"}}
+
+
+def test_matcher_treats_nfd_text_like_nfc():
+    matcher = get_matcher()
+    decomposed = unicodedata.normalize("NFD", "Tôi thất vọng và lo lắng")
+
+    assert matcher.find(decomposed)["negative"] == {"thất vọng", "lo lắng"}
+
+
+def test_matcher_loads_lexicon_from_file(tmp_path):
+    path = tmp_path / "lexicon.json"
+    path.write_text(
+        json.dumps({"negative": ["cáu"], "positive": ["ổn áp"]}, ensure_ascii=False),
+        encoding="utf-8",
+    )
+
+    matcher = get_matcher(str(path))
+
+    assert get_matcher(str(path)) is matcher
+    result = SentimentService(matcher=matcher).analyze_sentiment("ổn áp lắm")
+    assert result["sentiment"] == "positive"
+    assert result["analysis"]["positive_words"] == 1
@@ -0,0 +1,107 @@
+import io
+import json
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+import app.services.situation_import_service as import_module
+from app.core.database import Base
+from app.core.exceptions import ValidationError
+from app.models import Situation, Topic
+from app.services.search_service import SearchService, memory_backend
+from app.services.situation_import_service import SituationImportService
+
+
+@pytest.fixture
+def factory(tmp_path, monkeypatch):
+    import app.services.search_service as search_module
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'import.db'}", poolclass=NullPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(import_module, "SessionLocal", factory)
+    monkeypatch.setattr(search_module, "SessionLocal", factory)
+    memory_backend().reset()
+    with factory() as db:
+        db.add_all([Topic(id=1, name="Công sở"), Topic(id=2, name="Gia đình")])
+        db.commit()
+    yield factory
+    memory_backend().reset()
+    engine.dispose()
+
+
+def _jsonl(*records):
+    return io.StringIO(
+        "\n".join(r if isinstance(r, str) else json.dumps(r) for r in records)
+    )
+
+
+def _situations(factory):
+    with factory() as db:
+        rows = db.execute(
+            select(Situation.topic_id, Situation.question).order_by(Situation.id)
+        )
+        return [tuple(row) for row in rows]
+
+
+def test_import_jsonl_resolves_topics_and_reports_rejected_rows(factory):
+    stream = _jsonl(
+        {"topic": "Công sở", "context": "c1", "question": "q1"},
+        "{not json",
+        {"topic": "Không có", "context": "c2", "question": "q2"},
+        {"topic_id": 2, "context": "c3", "question": "q3"},
+        "",
+        {"context": "c4"},
+        {"topic_id": 9, "context": "c5", "question": "q5"},
+        {"context": "c6", "question": "q6"},
+    )
+
+    report = SituationImportService().import_stream(stream, "jsonl", batch_size=2)
+
+    assert _situations(factory) == [(1, "q1"), (2, "q3"), (None, "q6")]
+    assert (report["inserted"], report["duplicates"], report["rejected"]) == (3, 0, 4)
+    assert [error["line"] for error in report["errors"]] == [2, 3, 6, 7]
+    assert report["errors"][1]["errors"] == ["unknown topic: Không có"]
+    assert report["errors"][2]["errors"] == ["question: Field required"]
+
+
+def test_reimport_skips_duplicates(factory):
+    rows = [{"context": "c", "question": "q"}, {"context": "c", "question": "q"}]
+    service = SituationImportService()
+
+    first = service.import_stream(_jsonl(*rows), "jsonl")
+    second = service.import_stream(_jsonl(*rows, {"context": "c", "question": "q2"}))
+
+    assert (first["inserted"], first["duplicates"]) == (1, 1)
+    assert (second["inserted"], second["duplicates"]) == (1, 2)
+    assert len(_situations(factory)) == 2
+
+
+def test_import_csv_with_quoted_newlines(factory):
+    stream = io.StringIO(
+        'topic,topic_id,context,question\nGia đình,,"two\nlines",q1\n,1,c2,q2\n'
+    )
+
+    report = SituationImportService().import_stream(stream, "csv")
+
+    assert report["inserted"] == 2
+    assert _situations(factory) == [(2, "q1"), (1, "q2")]
+
+
+def test_import_rejects_unknown_format(factory):
+    with pytest.raises(ValidationError):
+        SituationImportService().import_stream(io.StringIO(""), "xml")
+
+
+def test_imported_rows_are_searchable(factory):
+    assert SearchService().search("lương")["items"] == []
+
+    SituationImportService().import_stream(
+        _jsonl({"topic_id": 1, "context": "Xin tăng lương", "question": "Nói gì?"})
+    )
+
+    assert [item["question"] for item in SearchService().search("lương")["items"]] == [
+        "Nói gì?"
+    ]
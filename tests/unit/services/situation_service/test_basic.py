@@ -52,22 +52,20 @@ class TestSituationService:
         assert isinstance(result[0], SituationOut)
         assert result[0].context == "Bạn đang trong một cuộc họp quan trọng"
 
-    def test_get_contributed_situations_success(
-        self, situation_service, mock_repository, sample_situation_data
-    ):
-        """Test successful contributed situations retrieval."""
+    def test_get_contributed_situations_success(self, situation_service):
+        """Test contributed situations reuse the paginated feed query."""
         # Arrange
-        mock_repository.get_contributed_situations.return_value = [
-            sample_situation_data
-        ]
+        envelope = {"items": [], "pagination": {"page": 2, "limit": 5}}
+        situation_service.get_situations_feed_paginated = Mock(return_value=envelope)
 
         # Act
-        result = situation_service.get_contributed_situations()
+        result = situation_service.get_contributed_situations(page=2, limit=5)
 
         # Assert
-        mock_repository.get_contributed_situations.assert_called_once_with(ANY)
-        assert len(result) == 1
-        assert isinstance(result[0], SituationOut)
+        situation_service.get_situations_feed_paginated.assert_called_once_with(
+            page=2, limit=5
+        )
+        assert result == envelope
 
     def test_get_situation_success(
         self, situation_service, mock_repository, sample_situation_data
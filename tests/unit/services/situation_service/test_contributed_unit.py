@@ -0,0 +1,91 @@
+import pytest
+from sqlalchemy import event
+
+from app.models import Comment, Reaction, Situation, Topic, User
+from app.repositories.situation_repository import SituationRepository
+from app.services.situation_service import SituationService
+
+
+def _seed_situations(factory, count: int):
+    with factory() as db:
+        user = User(email=f"contrib{count}@ex.com", name="Contributor")
+        topic = Topic(name=f"ContribTopic{count}")
+        db.add_all([user, topic])
+        db.commit()
+        for i in range(count):
+            situation = Situation(
+                topic_id=topic.id, user_id=user.id, context=f"c{i}", question="q?"
+            )
+            db.add(situation)
+            db.flush()
+            db.add(Comment(situation_id=situation.id, user_id=user.id, content="hi"))
+            db.add(
+                Reaction(
+                    situation_id=situation.id, user_id=user.id, reaction_type="upvote"
+                )
+            )
+        db.commit()
+        SituationRepository().reconcile_stats(db)
+
+
+def _count_queries(factory, fn):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = factory.kw["bind"]
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return result, len(statements)
+
+
+@pytest.mark.parametrize("rows", [1, 5, 25])
+def test_contributed_situations_query_count_is_constant(session_factory, rows):
+    _seed_situations(session_factory, rows)
+    svc = SituationService()
+
+    result, queries = _count_queries(
+        session_factory, lambda: svc.get_contributed_situations(page=1, limit=50)
+    )
+
+    assert len(result["items"]) == rows
+    assert result["pagination"]["total"] == rows
+    # One aggregated page query plus one total count, regardless of row count
+    assert queries == 2
+
+
+def test_contributed_situations_stats_and_pagination(session_factory):
+    _seed_situations(session_factory, 3)
+    svc = SituationService()
+
+    page = svc.get_contributed_situations(page=2, limit=2)
+
+    assert len(page["items"]) == 1
+    assert page["pagination"] == {
+        "page": 2,
+        "limit": 2,
+        "total": 3,
+        "pages": 2,
+        "has_next": False,
+        "has_prev": True,
+    }
+    assert page["items"][0]["stats"] == {
+        "comments_count": 1,
+        "reactions_count": 1,
+        "upvotes_count": 1,
+        "downvotes_count": 0,
+    }
+
+
+def test_deprecated_situations_feed_still_returns_a_list(session_factory):
+    _seed_situations(session_factory, 3)
+    svc = SituationService()
+
+    feed = svc.get_situations_feed()
+
+    assert isinstance(feed, list)
+    assert len(feed) == 3 and "stats" in feed[0]
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.exceptions import NotFoundError
+from app.models import Reaction, Situation, Topic, User
+from app.services.situation_service import SituationService
+
+
+def _seed_feed(factory, count: int):
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    with factory() as db:
+        user = User(email="async@ex.com", name="Async")
+        topic = Topic(name="AsyncTopic")
+        db.add_all([user, topic])
+        db.commit()
+        for i in range(count):
+            db.add(
+                Situation(
+                    topic_id=topic.id,
+                    user_id=user.id,
+                    context=f"c{i}",
+                    question="q?",
+                    created_at=base + timedelta(minutes=i),
+                )
+            )
+        db.commit()
+        return user.id
+
+
+@pytest.mark.asyncio
+async def test_feed_paginated_async_matches_sync(async_session_factory):
+    _seed_feed(async_session_factory, 5)
+    svc = SituationService()
+
+    expected = svc.get_situations_feed_paginated(page=2, limit=2)
+    result = await svc.get_situations_feed_paginated_async(page=2, limit=2)
+
+    assert result == expected
+    assert result["pagination"]["total"] == 5
+
+
+@pytest.mark.asyncio
+async def test_feed_cursor_async_matches_sync(async_session_factory):
+    _seed_feed(async_session_factory, 5)
+    svc = SituationService()
+
+    expected = svc.get_situations_feed_cursor(cursor="", limit=2, include_total=True)
+    result = await svc.get_situations_feed_cursor_async(
+        cursor="", limit=2, include_total=True
+    )
+
+    assert result == expected
+    follow = await svc.get_situations_feed_cursor_async(
+        cursor=result["pagination"]["next_cursor"], limit=2
+    )
+    assert follow == svc.get_situations_feed_cursor(
+        cursor=result["pagination"]["next_cursor"], limit=2
+    )
+
+
+@pytest.mark.asyncio
+async def test_feed_async_overlays_user_reaction(async_session_factory):
+    user_id = _seed_feed(async_session_factory, 2)
+    with async_session_factory() as db:
+        situation = db.query(Situation).order_by(Situation.id.desc()).first()
+        db.add(
+            Reaction(situation_id=situation.id, user_id=user_id, reaction_type="upvote")
+        )
+        db.commit()
+        situation_id = situation.id
+    svc = SituationService()
+
+    result = await svc.get_situations_feed_paginated_async(current_user_id=user_id)
+
+    reactions = {item["id"]: item["user_reaction"] for item in result["items"]}
+    assert reactions[situation_id] == "upvote"
+    assert list(reactions.values()).count(None) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_situation_async(async_session_factory):
+    _seed_feed(async_session_factory, 1)
+    svc = SituationService()
+
+    situation = await svc.get_situation_async(1)
+
+    assert situation == svc.get_situation(1)
+    with pytest.raises(NotFoundError):
+        await svc.get_situation_async(999)
@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import event
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.models import Reaction, Situation, Topic, User
+from app.services.reaction_service import ReactionService
+from app.services.situation_service import SituationService
+
+
+@pytest.fixture
+def cached(monkeypatch, session_factory):
+    import app.services.reaction_service as reaction_service_module
+
+    monkeypatch.setattr(settings, "cache_enabled", True)
+    monkeypatch.setattr(cache, "_redis_retry_at", float("inf"))
+    monkeypatch.setattr(reaction_service_module, "SessionLocal", session_factory)
+    cache.clear_local()
+    yield session_factory
+    cache.clear_local()
+
+
+def _seed(factory):
+    with factory() as db:
+        u1 = User(email="cache1@ex.com", name="C1")
+        u2 = User(email="cache2@ex.com", name="C2")
+        topic = Topic(name="CacheTopic")
+        db.add_all([u1, u2, topic])
+        db.commit()
+        s1 = Situation(topic_id=topic.id, user_id=u1.id, context="c", question="q?")
+        db.add(s1)
+        db.commit()
+        db.add(Reaction(situation_id=s1.id, user_id=u2.id, reaction_type="upvote"))
+        db.commit()
+        return u1.id, u2.id, s1.id
+
+
+def _queries(factory, fn):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = factory.kw["bind"]
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        return fn(), len(statements)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_feed_served_from_cache_with_per_user_overlay(cached):
+    u1, u2, s1 = _seed(cached)
+    svc = SituationService()
+
+    _, first = _queries(cached, lambda: svc.get_situations_feed_paginated())
+    anon, second = _queries(cached, lambda: svc.get_situations_feed_paginated())
+    assert first > 0 and second == 0
+    assert anon["items"][0]["user_reaction"] is None
+
+    mine, overlay = _queries(
+        cached, lambda: svc.get_situations_feed_paginated(current_user_id=u2)
+    )
+    assert overlay == 1
+    assert mine["items"][0]["user_reaction"] == "upvote"
+
+    other = svc.get_situations_feed_paginated(current_user_id=u1)
+    assert other["items"][0]["user_reaction"] is None
+
+
+def test_reaction_write_invalidates_feed(cached):
+    u1, u2, s1 = _seed(cached)
+    svc = SituationService()
+
+    before = svc.get_situations_feed_paginated()
+    assert before["items"][0]["stats"]["reactions_count"] == 0
+
+    ReactionService().create_reaction(s1, "downvote", u1)
+
+    after = svc.get_situations_feed_paginated(current_user_id=u1)
+    assert after["items"][0]["stats"]["downvotes_count"] == 1
+    assert after["items"][0]["user_reaction"] == "downvote"
+
+
+def test_situation_detail_cached_and_invalidated_on_update(cached):
+    from app.schemas.situations import SituationUpdate
+
+    _, _, s1 = _seed(cached)
+    svc = SituationService()
+
+    assert svc.get_situation(s1).context == "c"
+    _, queries = _queries(cached, lambda: svc.get_situation(s1))
+    assert queries == 0
+
+    svc.update_situation(s1, SituationUpdate(context="changed"))
+    assert svc.get_situation(s1).context == "changed"
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.exceptions import ValidationError
+from app.models import Situation, Topic, User
+from app.services.situation_service import SituationService
+
+
+def _seed_feed(factory, count: int):
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    with factory() as db:
+        user = User(email="cursor@ex.com", name="Cursor")
+        topic = Topic(name="CursorTopic")
+        db.add_all([user, topic])
+        db.commit()
+        for i in range(count):
+            # Pairs of rows share a timestamp so the id tiebreak is exercised
+            db.add(
+                Situation(
+                    topic_id=topic.id,
+                    user_id=user.id,
+                    context=f"c{i}",
+                    question="q?",
+                    created_at=base + timedelta(minutes=i // 2),
+                )
+            )
+        db.commit()
+
+
+def _walk(svc, **kwargs):
+    ids, cursor, pages = [], "", 0
+    while cursor is not None:
+        page = svc.get_situations_feed_cursor(cursor=cursor, **kwargs)
+        ids.extend(item["id"] for item in page["items"])
+        cursor = page["pagination"]["next_cursor"]
+        pages += 1
+    return ids, pages
+
+
+def test_feed_cursor_walks_every_row_once_in_order(session_factory):
+    _seed_feed(session_factory, 7)
+    svc = SituationService()
+
+    offset_ids = [
+        item["id"]
+        for item in svc.get_situations_feed_paginated(page=1, limit=50)["items"]
+    ]
+    cursor_ids, pages = _walk(svc, limit=3)
+
+    assert cursor_ids == offset_ids
+    assert len(set(cursor_ids)) == 7
+    assert pages == 3
+
+
+def test_feed_cursor_ascending(session_factory):
+    _seed_feed(session_factory, 5)
+    svc = SituationService()
+
+    ids, _ = _walk(svc, limit=2, sort_order="asc")
+
+    assert ids == sorted(ids)
+    assert len(ids) == 5
+
+
+def test_feed_cursor_total_is_optional_and_cached(session_factory):
+    _seed_feed(session_factory, 3)
+    svc = SituationService()
+
+    first = svc.get_situations_feed_cursor(cursor="", limit=2)
+    assert "total" not in first["pagination"]
+    assert first["pagination"]["has_next"] is True
+
+    counted = svc.get_situations_feed_cursor(cursor="", limit=2, include_total=True)
+    assert counted["pagination"]["total"] == 3
+
+    with session_factory() as db:
+        db.add(Situation(topic_id=1, context="late", question="q?"))
+        db.commit()
+    cached = svc.get_situations_feed_cursor(cursor="", limit=2, include_total=True)
+    assert cached["pagination"]["total"] == 3
+
+
+def test_feed_cursor_rejects_malformed_cursor(session_factory):
+    svc = SituationService()
+
+    with pytest.raises(ValidationError):
+        svc.get_situations_feed_cursor(cursor="not-a-cursor")
@@ -53,8 +53,8 @@ def test_get_contributed_situations_format(db_session: Session):
     svc = SituationService()
     _seed_data(db_session)
     out = svc.get_contributed_situations()
-    assert isinstance(out, list)
+    assert "items" in out and "pagination" in out
     # each item has stats and user keys
-    if out:
-        item = out[0]
+    if out["items"]:
+        item = out["items"][0]
         assert "stats" in item and "user" in item
@@ -0,0 +1,30 @@
+import json
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.services.situation_import_service as import_module
+from app.core.database import Base
+from app.import_situations import import_file
+from app.models import Situation
+
+
+def test_import_file_picks_format_from_extension(tmp_path, monkeypatch, capsys):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(import_module, "SessionLocal", factory)
+    csv_path = tmp_path / "situations.csv"
+    csv_path.write_text("﻿context,question\nc1,q1\nc2,\n", encoding="utf-8")
+
+    report = import_file(str(csv_path))
+
+    assert (report["inserted"], report["rejected"]) == (1, 1)
+    out, err = capsys.readouterr()
+    assert "Imported 1 situations from situations.csv" in out
+    assert json.loads(err) == {"line": 3, "errors": ["question: Field required"]}
+    with factory() as db:
+        assert db.query(Situation).count() == 1
@@ -0,0 +1,126 @@
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.rescore_sentiment as rescore_module
+from app.core.database import Base
+from app.models import Comment, Situation, Topic, User
+from app.repositories.comment_repository import CommentRepository
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(rescore_module, "SessionLocal", factory)
+    with factory() as db:
+        user, topic = User(email="rescore@ex.com", name="R"), Topic(name="Rescore")
+        db.add_all([user, topic])
+        db.flush()
+        situation = Situation(
+            topic_id=topic.id, user_id=user.id, context="c", question="q"
+        )
+        db.add(situation)
+        db.flush()
+        texts = ["Tôi rất vui", "Tôi buồn và chán", "hôm nay đi làm", "tuyệt vời", ""]
+        db.add_all(
+            Comment(situation_id=situation.id, user_id=user.id, content=text)
+            for text in texts
+        )
+        db.commit()
+    yield factory
+    engine.dispose()
+
+
+def _labels(factory):
+    with factory() as db:
+        rows = db.query(Comment).order_by(Comment.id).all()
+        return [(c.sentiment_label, c.sentiment_score) for c in rows]
+
+
+def test_rescore_fills_all_sentiment_columns(factory, tmp_path):
+    checkpoint = tmp_path / "checkpoint.json"
+
+    assert rescore_module.rescore(chunk_size=2, checkpoint_path=str(checkpoint)) == 5
+
+    labels = _labels(factory)
+    assert [label for label, _ in labels] == [
+        "positive",
+        "negative",
+        "neutral",
+        "positive",
+        "neutral",
+    ]
+    assert labels[1][1] < 0 < labels[0][1]
+    with factory() as db:
+        assert db.get(Comment, 1).sentiment_analysis["sentiment"] == "positive"
+    assert json.loads(checkpoint.read_text())["last_id"] == 5
+
+
+def test_rescore_resumes_from_checkpoint(factory, tmp_path, monkeypatch):
+    checkpoint = str(tmp_path / "checkpoint.json")
+    original = CommentRepository.bulk_update_sentiment
+    calls = []
+
+    def failing_after_first_chunk(self, db, rows):
+        calls.append([row["id"] for row in rows])
+        if len(calls) > 1:
+            raise RuntimeError("interrupted")
+        original(self, db, rows)
+
+    monkeypatch.setattr(
+        CommentRepository, "bulk_update_sentiment", failing_after_first_chunk
+    )
+    with pytest.raises(RuntimeError):
+        rescore_module.rescore(chunk_size=2, checkpoint_path=checkpoint)
+    monkeypatch.setattr(CommentRepository, "bulk_update_sentiment", original)
+
+    assert rescore_module.rescore(chunk_size=2, checkpoint_path=checkpoint) == 3
+    assert None not in [label for label, _ in _labels(factory)]
+
+
+def test_checkpoint_from_another_lexicon_is_ignored(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    path.write_text(json.dumps({"lexicon_version": "old", "last_id": 40}))
+
+    assert rescore_module._load_checkpoint(str(path), "new") == 0
+    assert rescore_module._load_checkpoint(str(path), "old") == 40
+
+
+class FixedBackend:
+    version = "fixed-1"
+
+    def analyze_sentiment(self, content):
+        return {"sentiment": "positive", "score": 0.5, "keywords": {}}
+
+
+def test_rescore_uses_the_configured_backend(factory, tmp_path, monkeypatch):
+    monkeypatch.setattr(rescore_module, "get_sentiment_backend", FixedBackend)
+    checkpoint = tmp_path / "checkpoint.json"
+
+    assert rescore_module.rescore(checkpoint_path=str(checkpoint)) == 5
+
+    assert {label for label, _ in _labels(factory)} == {"positive"}
+    assert json.loads(checkpoint.read_text())["lexicon_version"] == "fixed-1"
+
+
+def test_missing_only_scores_unlabeled_comments_below_the_checkpoint(factory, tmp_path):
+    checkpoint = tmp_path / "checkpoint.json"
+    rescore_module.rescore(checkpoint_path=str(checkpoint))
+    with factory() as db:
+        # Left unscored by a failed deferred scoring
+        db.get(Comment, 2).sentiment_label = None
+        db.commit()
+
+    assert rescore_module.rescore(checkpoint_path=str(checkpoint)) == 0
+    assert (
+        rescore_module.rescore(checkpoint_path=str(checkpoint), missing_only=True) == 1
+    )
+    assert _labels(factory)[1][0] == "negative"
+    assert json.loads(checkpoint.read_text())["last_id"] == 5